@@ -0,0 +1,80 @@
+import logging
+import time
+from typing import Dict, List, Optional, Tuple
+
+from sqlalchemy.ext.asyncio import async_sessionmaker
+
+from app.api.response_cache import refresh_entry, response_cache
+from app.core.config import settings
+from app.db.database import AsyncSessionLocal
+from app.services.futures_service import FuturesService
+from app.services.jobs import latest_macro_days, scheduler
+from app.services.macro_service import MacroService
+
+logger = logging.getLogger(__name__)
+
+
+class ResponseCacheWarmer:
+    """Re-renders the URLs the macro and futures pages open with once their data changes.
+
+    Each run only looks up the dashboard versions and the futures dataset
+    version; a group of URLs is rendered again when its version differs from
+    the one last warmed, or when its previous warm did not fully succeed.
+    Warmed entries are stored for ttl seconds rather than the short route
+    TTLs, so they stay warm until their data changes; a group that keeps its
+    version is still renewed once half of ttl has passed.
+    """
+
+    def __init__(self, app, futures_service: FuturesService, macro_service: MacroService,
+                 sessions: async_sessionmaker, ttl: Optional[float] = None):
+        self.app = app
+        self.futures_service = futures_service
+        self.macro_service = macro_service
+        self.sessions = sessions
+        self.ttl = settings.CACHE_WARM_TTL_SECONDS if ttl is None else ttl
+        # group -> (version, monotonic time it was warmed)
+        self._warmed: Dict[str, Tuple[object, float]] = {}
+
+    async def run(self):
+        days = await latest_macro_days(self.macro_service, self.sessions)
+        versions = [(await self.macro_service.dashboard_version_async(self.sessions, day))[2] for day in days]
+        urls = ["/api/macro/dashboard", "/api/macro/dates"]
+        for day in days:
+            urls += [f"/api/macro/analysis?date={day}", f"/api/macro/news?date={day}"]
+        # A version is None when its lookup failed, so wait for the next run
+        macro_version = None if None in versions else (tuple(days), tuple(versions))
+        await self._warm("macro", macro_version, urls)
+
+        symbols = tuple(self.futures_service.price_data)
+        await self._warm("futures", (self.futures_service.data_version, symbols),
+                         [f"/api/futures/{symbol}" for symbol in symbols])
+
+    async def _warm(self, group: str, version: Optional[object], urls: List[str]):
+        if version is None:
+            return
+        warmed_version, warmed_at = self._warmed.get(group, (None, 0.0))
+        if warmed_version == version and time.monotonic() - warmed_at < self.ttl / 2:
+            return
+        failed = 0
+        for url in urls:
+            status = await refresh_entry(self.app, url, ttl=self.ttl)
+            if status != 200:
+                failed += 1
+                logger.warning("Cache warm of %s returned %s", url, status)
+        if failed:
+            self._warmed.pop(group, None)
+        else:
+            self._warmed[group] = (version, time.monotonic())
+        logger.info("Warmed %d %s responses (%d failed)", len(urls), group, failed)
+
+
+def register_warm_job(app, futures_service: FuturesService, macro_service: MacroService):
+    """Add the response cache warming job to the app scheduler, when the cache is on"""
+    if response_cache is not None:
+        scheduler.add(
+            "response-cache-warm",
+            ResponseCacheWarmer(app, futures_service, macro_service, AsyncSessionLocal).run,
+            every=settings.CACHE_WARM_INTERVAL_SECONDS,
+            jitter=2,
+            run_at_start=True,
+        )
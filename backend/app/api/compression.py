@@ -0,0 +1,151 @@
+import zlib
+from typing import Optional
+
+from starlette.datastructures import Headers, MutableHeaders
+
+from app.core.config import settings
+
+try:
+    import brotli
+except ImportError:  # br is simply not offered without it
+    brotli = None
+
+# Content types worth compressing; everything else passes through untouched
+COMPRESSIBLE_TYPES = ("application/json", "application/x-ndjson", "text/")
+
+
+def negotiate_encoding(accept_encoding: str) -> Optional[str]:
+    """Best of br / gzip the client accepts (q > 0), preferring br"""
+    accepted = {}
+    for part in accept_encoding.lower().split(","):
+        coding, _, params = part.strip().partition(";")
+        q = 1.0
+        params = params.strip()
+        if params.startswith("q="):
+            try:
+                q = float(params[2:])
+            except ValueError:
+                q = 0.0
+        accepted[coding.strip()] = q
+    if brotli is not None and accepted.get("br", 0) > 0:
+        return "br"
+    if accepted.get("gzip", 0) > 0:
+        return "gzip"
+    return None
+
+
+class CompressionMiddleware:
+    """Negotiated br/gzip for JSON and text responses of at least minimum_size bytes.
+
+    Streaming bodies are compressed chunk by chunk and flushed after each one,
+    so NDJSON clients still get records as they are produced.
+    """
+
+    def __init__(self, app, minimum_size: int = settings.COMPRESSION_MIN_BYTES):
+        self.app = app
+        self.minimum_size = minimum_size
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+        encoding = negotiate_encoding(Headers(scope=scope).get("accept-encoding", ""))
+        if encoding is None:
+            await self.app(scope, receive, send)
+            return
+        await _Responder(self.app, encoding, self.minimum_size)(scope, receive, send)
+
+
+class _Responder:
+    def __init__(self, app, encoding: str, minimum_size: int):
+        self.app = app
+        self.encoding = encoding
+        self.minimum_size = minimum_size
+        self.send = None
+        self.start = None
+        self.compressor = None
+        self.passthrough = False
+
+    async def __call__(self, scope, receive, send):
+        self.send = send
+        await self.app(scope, receive, self.send_compressed)
+
+    async def send_compressed(self, message):
+        if message["type"] == "http.response.start":
+            # Hold the headers until the first body chunk shows how big it is
+            self.start = message
+            return
+        if message["type"] != "http.response.body":
+            await self.send(message)
+            return
+
+        body = message.get("body", b"")
+        more_body = message.get("more_body", False)
+
+        if self.start is not None:
+            start, self.start = self.start, None
+            headers = Headers(raw=start["headers"])
+            if (
+                "content-encoding" in headers
+                or not headers.get("content-type", "").startswith(COMPRESSIBLE_TYPES)
+                or (not more_body and len(body) < self.minimum_size)
+            ):
+                self.passthrough = True
+                await self.send(start)
+                await self.send(message)
+                return
+
+            self.compressor = _compressor(self.encoding)
+            headers = MutableHeaders(raw=start["headers"])
+            headers["Content-Encoding"] = self.encoding
+            headers.add_vary_header("Accept-Encoding")
+            etag = headers.get("etag")
+            if etag and not etag.startswith("W/"):
+                # The compressed bytes differ from the identity ones, so the tag is only weakly equal
+                headers["ETag"] = f"W/{etag}"
+            if more_body:
+                del headers["Content-Length"]
+                await self.send(start)
+            else:
+                body = self.compressor.finish(body)
+                headers["Content-Length"] = str(len(body))
+                await self.send(start)
+                await self.send({"type": "http.response.body", "body": body})
+                return
+
+        if self.passthrough:
+            await self.send(message)
+            return
+
+        if more_body:
+            chunk = self.compressor.flush(body)
+        else:
+            chunk = self.compressor.finish(body)
+        await self.send({"type": "http.response.body", "body": chunk, "more_body": more_body})
+
+
+class _Gzip:
+    def __init__(self):
+        # wbits=31 writes the gzip header and trailer
+        self._obj = zlib.compressobj(settings.GZIP_LEVEL, zlib.DEFLATED, 31)
+
+    def flush(self, data: bytes) -> bytes:
+        return self._obj.compress(data) + self._obj.flush(zlib.Z_SYNC_FLUSH)
+
+    def finish(self, data: bytes) -> bytes:
+        return self._obj.compress(data) + self._obj.flush()
+
+
+class _Brotli:
+    def __init__(self):
+        self._obj = brotli.Compressor(quality=settings.BROTLI_QUALITY)
+
+    def flush(self, data: bytes) -> bytes:
+        return self._obj.process(data) + self._obj.flush()
+
+    def finish(self, data: bytes) -> bytes:
+        return self._obj.process(data) + self._obj.finish()
+
+
+def _compressor(encoding: str):
+    return _Brotli() if encoding == "br" else _Gzip()
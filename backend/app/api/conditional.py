@@ -0,0 +1,59 @@
+import hashlib
+from datetime import datetime, timezone
+from email.utils import format_datetime, parsedate_to_datetime
+from typing import Dict, Optional
+
+from fastapi import Request, Response
+
+
+def make_etag(*parts) -> str:
+    """Strong ETag from the values that identify a representation"""
+    raw = "|".join("" if part is None else str(part) for part in parts)
+    return '"%s"' % hashlib.blake2b(raw.encode(), digest_size=12).hexdigest()
+
+
+def cache_headers(etag: str, last_modified: Optional[datetime] = None) -> Dict[str, str]:
+    """Validator headers; no-cache makes clients revalidate instead of reusing blindly"""
+    headers = {"ETag": etag, "Cache-Control": "no-cache"}
+    if last_modified is not None:
+        headers["Last-Modified"] = format_datetime(_utc(last_modified), usegmt=True)
+    return headers
+
+
+# For error payloads answered with a 200: neither clients nor the response cache may keep them
+NO_STORE_HEADERS = {"Cache-Control": "no-store"}
+
+
+def is_not_modified(request: Request, etag: str, last_modified: Optional[datetime] = None) -> bool:
+    """True when the client's cached copy is current (RFC 9110 13.1.2/13.1.3).
+
+    If-Modified-Since is only consulted when the request has no If-None-Match.
+    """
+    if_none_match = request.headers.get("if-none-match")
+    if if_none_match is not None:
+        tags = [tag.strip() for tag in if_none_match.split(",")]
+        # Weak comparison, so W/ tags added by proxies still match
+        return "*" in tags or etag in tags or f"W/{etag}" in tags
+
+    if_modified_since = request.headers.get("if-modified-since")
+    if if_modified_since and last_modified is not None:
+        try:
+            since = parsedate_to_datetime(if_modified_since)
+        except (TypeError, ValueError):
+            return False
+        if since.tzinfo is None:
+            return False
+        # HTTP dates have whole-second precision
+        return _utc(last_modified).replace(microsecond=0) <= since
+    return False
+
+
+def not_modified(headers: Dict[str, str]) -> Response:
+    return Response(status_code=304, headers=headers)
+
+
+def _utc(value: datetime) -> datetime:
+    # Naive timestamps (SQLite) are stored in UTC
+    if value.tzinfo is None:
+        return value.replace(tzinfo=timezone.utc)
+    return value.astimezone(timezone.utc)
@@ -1,11 +1,24 @@
 # backend/app/api/dependencies.py
+import secrets
+
 from fastapi import Depends, HTTPException, status
-from fastapi.security import OAuth2PasswordBearer
+from fastapi.security import APIKeyHeader, OAuth2PasswordBearer
 from sqlalchemy.orm import Session
 
+from app.core.config import settings
 from app.db.database import get_db
 
 # This would be used for authentication later
 oauth2_scheme = OAuth2PasswordBearer(tokenUrl="token")
 
-# Add more dependencies as needed
\ No newline at end of file
+admin_key_header = APIKeyHeader(name="X-API-Key", auto_error=False)
+
+
+def require_admin(api_key: str = Depends(admin_key_header)):
+    """Allow operational endpoints only with the ADMIN_API_KEY; all are closed while it is unset"""
+    if not settings.ADMIN_API_KEY:
+        raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="Admin endpoints are disabled")
+    if not api_key or not secrets.compare_digest(api_key, settings.ADMIN_API_KEY):
+        raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="Invalid API key")
+
+# Add more dependencies as needed
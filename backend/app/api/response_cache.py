@@ -0,0 +1,305 @@
+import asyncio
+import base64
+import json
+from email.utils import parsedate_to_datetime
+from typing import Dict, List, Optional, Tuple
+from urllib.parse import parse_qsl, urlencode
+
+from starlette.requests import Request
+
+from app.api.conditional import is_not_modified
+from app.api.streaming import NDJSON_MEDIA_TYPE
+from app.core.cache import LRUCache
+from app.core.config import settings
+
+# (status, [(header name, value)], body) as captured from the app
+Entry = Tuple[int, List[Tuple[bytes, bytes]], bytes]
+
+# Request headers the leader drops, so the cached copy is always a full 200
+CONDITIONAL_HEADERS = {b"if-none-match", b"if-modified-since"}
+
+# Response headers kept on a 304 built from a cached entry
+VALIDATOR_HEADERS = {b"etag", b"last-modified", b"cache-control", b"vary"}
+
+# ASGI scope extension marking an internal request that re-renders its entry;
+# its value is the TTL to store the result with (None for the path's TTL)
+REFRESH_EXTENSION = "qfind.response_cache.refresh"
+
+
+def entry_size(entry: Entry) -> int:
+    """Bytes held by a cached response: its body plus header names and values"""
+    status, headers, body = entry
+    return len(body) + sum(len(name) + len(value) for name, value in headers)
+
+
+class MemoryBackend:
+    """In-process LRU store bounded by entries and bytes; each worker process has its own copy"""
+
+    def __init__(self, maxsize: int, maxbytes: Optional[int] = None):
+        self._cache = LRUCache(maxsize=maxsize, maxbytes=maxbytes, sizeof=entry_size)
+
+    async def get(self, key: str) -> Optional[Entry]:
+        return self._cache.get(key, None)
+
+    async def set(self, key: str, entry: Entry, ttl: float):
+        self._cache.set(key, entry, ttl=ttl)
+
+    async def clear(self):
+        self._cache.clear()
+
+
+class RedisBackend:
+    """Shared store on any Redis-protocol server, through a redis.asyncio-style client"""
+
+    def __init__(self, client, prefix: str = "qfind:response:"):
+        self.client = client
+        self.prefix = prefix
+
+    async def get(self, key: str) -> Optional[Entry]:
+        raw = await self.client.get(self.prefix + key)
+        if raw is None:
+            return None
+        meta, body = raw.split(b"\n", 1)
+        meta = json.loads(meta)
+        headers = [(base64.b64decode(k), base64.b64decode(v)) for k, v in meta["headers"]]
+        return meta["status"], headers, body
+
+    async def set(self, key: str, entry: Entry, ttl: float):
+        status, headers, body = entry
+        meta = {
+            "status": status,
+            "headers": [[base64.b64encode(k).decode(), base64.b64encode(v).decode()] for k, v in headers],
+        }
+        # The JSON header line never contains a newline, so the body follows the first one
+        raw = json.dumps(meta).encode() + b"\n" + body
+        await self.client.set(self.prefix + key, raw, px=max(int(ttl * 1000), 1))
+
+    async def clear(self):
+        async for key in self.client.scan_iter(match=self.prefix + "*"):
+            await self.client.delete(key)
+
+
+def create_backend(name: str):
+    """Backend for RESPONSE_CACHE_BACKEND ("memory" or "redis")"""
+    if name == "redis":
+        try:
+            import redis.asyncio as redis
+        except ImportError as e:
+            raise RuntimeError("RESPONSE_CACHE_BACKEND=redis requires the redis package") from e
+        return RedisBackend(redis.from_url(settings.REDIS_URL))
+    if name == "memory":
+        return MemoryBackend(settings.RESPONSE_CACHE_SIZE, settings.RESPONSE_CACHE_MAX_BYTES)
+    raise ValueError(f"Unknown response cache backend: {name}")
+
+
+class ResponseCache:
+    """GET response cache with per-route TTLs and single-flight misses.
+
+    ttls maps path prefixes to seconds; the longest matching prefix wins and
+    0 turns caching off below it. Concurrent misses for one key wait for the
+    first request's response instead of all running the handler. Coalescing
+    is per process, even with a shared backend.
+    """
+
+    def __init__(self, backend, ttls: Dict[str, float], max_body: int):
+        self.backend = backend
+        self.ttls = ttls
+        self.max_body = max_body
+        self.stats = {"hits": 0, "misses": 0, "coalesced": 0, "bypassed": 0, "refreshed": 0, "stored": 0, "errors": 0}
+        self._inflight: Dict[str, asyncio.Future] = {}
+
+    def ttl_for(self, path: str) -> float:
+        best = None
+        for prefix in self.ttls:
+            if path == prefix or path.startswith(prefix.rstrip("/") + "/"):
+                if best is None or len(prefix) > len(best):
+                    best = prefix
+        return self.ttls[best] if best is not None else 0
+
+    def key_for(self, scope) -> str:
+        """Path plus query with parameters sorted, so ?a=1&b=2 and ?b=2&a=1 share an entry"""
+        query = parse_qsl(scope.get("query_string", b"").decode("latin-1"), keep_blank_values=True)
+        return scope["path"] + "?" + urlencode(sorted(query))
+
+    def report(self) -> Dict:
+        return {"backend": type(self.backend).__name__, "inflight": len(self._inflight), **self.stats}
+
+    async def clear(self):
+        await self.backend.clear()
+
+    async def lookup(self, key: str) -> Optional[Entry]:
+        try:
+            return await self.backend.get(key)
+        except Exception as e:
+            # A broken backend degrades to no caching rather than failing requests
+            self.stats["errors"] += 1
+            print(f"Response cache read failed for {key}: {e}")
+            return None
+
+    async def store(self, key: str, entry: Entry, ttl: float):
+        status, headers, body = entry
+        if status != 200 or len(body) > self.max_body:
+            return
+        if any(name == b"set-cookie" or (name == b"cache-control" and b"no-store" in value)
+               for name, value in headers):
+            # Routes mark error payloads they answer with a 200 as no-store
+            return
+        try:
+            await self.backend.set(key, entry, ttl)
+            self.stats["stored"] += 1
+        except Exception as e:
+            self.stats["errors"] += 1
+            print(f"Response cache write failed for {key}: {e}")
+
+
+class ResponseCacheMiddleware:
+    """ASGI middleware serving cacheable GETs from a ResponseCache.
+
+    Streaming (NDJSON) requests and requests with Cache-Control: no-cache or
+    no-store go straight to the app. Cached entries answer If-None-Match /
+    If-Modified-Since themselves, so hits never reach the routes.
+    """
+
+    def __init__(self, app, cache: ResponseCache):
+        self.app = app
+        self.cache = cache
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http" or scope["method"] != "GET":
+            await self.app(scope, receive, send)
+            return
+
+        ttl = self.cache.ttl_for(scope["path"])
+        if not ttl:
+            await self.app(scope, receive, send)
+            return
+
+        request = Request(scope)
+        if NDJSON_MEDIA_TYPE in request.headers.get("accept", "") or _no_cache(request):
+            self.cache.stats["bypassed"] += 1
+            await self.app(scope, receive, send)
+            return
+
+        key = self.cache.key_for(scope)
+        extensions = scope.get("extensions") or {}
+        refresh = REFRESH_EXTENSION in extensions
+        if refresh and extensions[REFRESH_EXTENSION]:
+            ttl = extensions[REFRESH_EXTENSION]
+        entry = None if refresh else await self.cache.lookup(key)
+        if entry is not None:
+            self.cache.stats["hits"] += 1
+            await _replay(request, send, entry, b"HIT")
+            return
+
+        pending = self.cache._inflight.get(key)
+        if pending is not None:
+            self.cache.stats["coalesced"] += 1
+            entry = await asyncio.shield(pending)
+            if entry is not None:
+                await _replay(request, send, entry, b"COALESCED")
+                return
+            # The leader failed; run the request on its own
+            await self.app(scope, receive, send)
+            return
+
+        self.cache.stats["refreshed" if refresh else "misses"] += 1
+        future = asyncio.get_running_loop().create_future()
+        self.cache._inflight[key] = future
+        try:
+            entry = await self._render(scope, receive)
+            await self.cache.store(key, entry, ttl)
+            future.set_result(entry)
+        finally:
+            if not future.done():
+                future.set_result(None)
+            del self.cache._inflight[key]
+        await _replay(request, send, entry, b"MISS")
+
+    async def _render(self, scope, receive) -> Entry:
+        """Run the app with conditional headers removed and capture the whole response"""
+        scope = dict(scope)
+        scope["headers"] = [(k, v) for k, v in scope["headers"] if k not in CONDITIONAL_HEADERS]
+        start = {}
+        body = []
+
+        async def capture(message):
+            if message["type"] == "http.response.start":
+                start.update(message)
+            elif message["type"] == "http.response.body":
+                body.append(message.get("body", b""))
+
+        await self.app(scope, receive, capture)
+        return start["status"], list(start.get("headers", [])), b"".join(body)
+
+
+async def refresh_entry(app, url: str, ttl: Optional[float] = None) -> int:
+    """Re-render one GET through the app and store it, bypassing any cached copy.
+
+    The entry is kept for ttl seconds, or the path's TTL when not given.
+    Returns the response status. Used by the cache warming job.
+    """
+    path, _, query = url.partition("?")
+    scope = {
+        "type": "http",
+        "asgi": {"version": "3.0"},
+        "http_version": "1.1",
+        "method": "GET",
+        "scheme": "http",
+        "path": path,
+        "raw_path": path.encode(),
+        "root_path": "",
+        "query_string": query.encode(),
+        "headers": [(b"host", b"localhost")],
+        "client": None,
+        "server": ("localhost", 80),
+        "extensions": {REFRESH_EXTENSION: ttl},
+    }
+    status = {}
+
+    async def receive():
+        return {"type": "http.request", "body": b"", "more_body": False}
+
+    async def send(message):
+        if message["type"] == "http.response.start":
+            status["code"] = message["status"]
+
+    await app(scope, receive, send)
+    return status.get("code", 500)
+
+
+def _no_cache(request: Request) -> bool:
+    directives = request.headers.get("cache-control", "").lower()
+    return "no-cache" in directives or "no-store" in directives
+
+
+async def _replay(request: Request, send, entry: Entry, state: bytes):
+    status, headers, body = entry
+    if status == 200 and _entry_not_modified(request, headers):
+        headers = [(k, v) for k, v in headers if k in VALIDATOR_HEADERS]
+        status, body = 304, b""
+    await send({"type": "http.response.start", "status": status, "headers": headers + [(b"x-cache", state)]})
+    await send({"type": "http.response.body", "body": body})
+
+
+def _entry_not_modified(request: Request, headers) -> bool:
+    values = dict(headers)
+    etag = values.get(b"etag")
+    if etag is None:
+        return False
+    last_modified = values.get(b"last-modified")
+    if last_modified is not None:
+        try:
+            last_modified = parsedate_to_datetime(last_modified.decode("latin-1"))
+        except (TypeError, ValueError):
+            last_modified = None
+    return is_not_modified(request, etag.decode("latin-1"), last_modified)
+
+
+# None when RESPONSE_CACHE_BACKEND is "off"
+response_cache = None
+if settings.RESPONSE_CACHE_BACKEND != "off":
+    response_cache = ResponseCache(
+        create_backend(settings.RESPONSE_CACHE_BACKEND),
+        settings.RESPONSE_CACHE_TTLS,
+        settings.RESPONSE_CACHE_MAX_BODY_BYTES,
+    )
@@ -1,15 +1,68 @@
-# backend/app/api/routes/futures.py
-from fastapi import APIRouter, Depends, HTTPException
-from typing import Dict
+from fastapi import APIRouter, Depends, HTTPException, Query, Request
+from fastapi.responses import ORJSONResponse
+from typing import Dict, List, Optional
+from datetime import date
+from sqlalchemy.orm import Session
+from app.api.streaming import ndjson_response, wants_ndjson
+from app.db.database import get_db
 from app.services.futures_service import FuturesService
+from app.services.indicators import INDICATORS
 
 router = APIRouter()
 futures_service = FuturesService()
 
+
+def parse_indicators(indicators: Optional[str] = None) -> Optional[List[str]]:
+    """Parse and validate the comma-separated indicators= parameter"""
+    if not indicators:
+        return None
+    names = [name.strip().lower() for name in indicators.split(",") if name.strip()]
+    unknown = [name for name in names if name not in INDICATORS]
+    if unknown:
+        raise HTTPException(
+            status_code=422,
+            detail=f"Unknown indicators: {', '.join(unknown)}. Choose from {', '.join(INDICATORS)}",
+        )
+    return names
+
+
+@router.get("")
+def get_futures_batch(
+    symbols: Optional[str] = None,
+    history: bool = False,
+    start: Optional[date] = None,
+    end: Optional[date] = None,
+    indicators: Optional[List[str]] = Depends(parse_indicators),
+    db: Session = Depends(get_db),
+):
+    """Get data for several futures contracts in one request"""
+    requested = [s.strip() for s in symbols.split(",") if s.strip()] if symbols else None
+    return ORJSONResponse(futures_service.get_futures_batch(requested, history, start, end, indicators, db))
+
+@router.get("/reload/status")
+def get_reload_status():
+    """Get hot-reload counters for the futures dataset"""
+    return futures_service.reload_stats
+
 @router.get("/{symbol}")
-def get_futures_data(symbol: str):
-    """Get detailed data for a specific futures contract"""
-    data = futures_service.get_futures_data(symbol)
+def get_futures_data(
+    request: Request,
+    symbol: str,
+    start: Optional[date] = None,
+    end: Optional[date] = None,
+    interval: str = Query("daily", pattern="^(daily|weekly|monthly)$"),
+    max_points: Optional[int] = Query(None, ge=3),
+    indicators: Optional[List[str]] = Depends(parse_indicators),
+    db: Session = Depends(get_db),
+):
+    """Get detailed data for a specific futures contract; send Accept: application/x-ndjson to stream it"""
+    if wants_ndjson(request):
+        records = futures_service.iter_futures_data(symbol, start, end, interval, max_points, db, indicators)
+        if records is None:
+            raise HTTPException(status_code=404, detail=f"Futures data for {symbol} not found")
+        return ndjson_response(records)
+    data = futures_service.get_futures_data(symbol, start, end, interval, max_points, db, indicators)
     if not data:
         raise HTTPException(status_code=404, detail=f"Futures data for {symbol} not found")
-    return data
\ No newline at end of file
+    # priceHistory is already plain lists and floats; orjson writes it without jsonable_encoder's walk
+    return ORJSONResponse(data)
@@ -1,25 +1,73 @@
-from fastapi import APIRouter, Depends, HTTPException, Query
-from typing import Optional
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response
+from fastapi.responses import ORJSONResponse
+from typing import Dict, Optional, Tuple
 from datetime import date
-from sqlalchemy.orm import Session
-from app.db.database import get_db
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+from app.api.conditional import NO_STORE_HEADERS, cache_headers, is_not_modified, make_etag, not_modified
+from app.api.streaming import ndjson_response, wants_ndjson
+from app.db.database import get_async_db, get_async_sessionmaker
 from app.services.macro_service import MacroService
-from app.schemas.macro import EconomicIndicators, MacroAnalysis, MacroNews, MacroDates
+from app.schemas.macro import EconomicIndicators, MacroAnalysis, MacroDashboard, MacroNews, MacroDates
 
 router = APIRouter(tags=["macro"])
 macro_service = MacroService()
 
 
+# Routes await the AsyncSession forms of the service queries, so a slow
+# query only suspends its own request instead of the event loop
+
+
+def _validators(request: Request, version: Optional[Tuple], *parts) -> Tuple[Optional[Dict], Optional[Response]]:
+    """(ETag/Last-Modified headers, 304 response if the client copy is current).
+
+    No headers when the service couldn't work out a version, so error
+    payloads never get a validator.
+    """
+    if version is None:
+        return None, None
+    key, last_modified = version
+    etag = make_etag(*parts, *key)
+    headers = cache_headers(etag, last_modified)
+    if is_not_modified(request, etag, last_modified):
+        return headers, not_modified(headers)
+    return headers, None
+
+
 @router.get("/dates", response_model=MacroDates)
-async def get_available_dates():
+async def get_available_dates(request: Request, response: Response, db: AsyncSession = Depends(get_async_db)):
     """Get available dates for macro analysis"""
-    return macro_service.get_available_dates()
+    result = await macro_service.get_available_dates_async(db)
+    if "error" in result:
+        response.headers.update(NO_STORE_HEADERS)
+        return result
+    
+    # The date list is cached and derived from the months alone
+    headers, cached = _validators(request, (result["months"], None), "dates")
+    if cached:
+        return cached
+    response.headers.update(headers)
+    return result
 
 
 @router.get("/indicators", response_model=EconomicIndicators)
-async def get_economic_indicators(month: Optional[str] = None, db: Session = Depends(get_db)):
-    """Get economic indicators for the specified month"""
-    return macro_service.get_economic_indicators(month)
+async def get_economic_indicators(
+    request: Request,
+    response: Response,
+    month: Optional[str] = None,
+    db: AsyncSession = Depends(get_async_db)
+):
+    """Get economic indicators for the specified month; supports If-None-Match / If-Modified-Since"""
+    version = await macro_service.indicators_version_async(db, month)
+    headers, cached = _validators(request, version, "indicators")
+    if cached:
+        return cached
+    
+    result = await macro_service.get_economic_indicators_async(db, month)
+    if "error" in result:
+        response.headers.update(NO_STORE_HEADERS)
+    elif headers:
+        response.headers.update(headers)
+    return result
 
 
 @router.get("/analysis", response_model=MacroAnalysis)
@@ -29,6 +77,61 @@ async def get_daily_analysis(date: Optional[str] = None):
 
 
 @router.get("/news", response_model=MacroNews)
-async def get_macro_news(date: Optional[str] = None, db: Session = Depends(get_db)):
-    """Get macro-related news for the specified date"""
-    return macro_service.get_macro_news(date)
\ No newline at end of file
+async def get_macro_news(
+    request: Request,
+    date: Optional[str] = None,
+    limit: Optional[int] = Query(None, ge=1, le=500, description="Page size; omit for the whole day"),
+    after: Optional[str] = Query(None, description="next_cursor from the previous page"),
+    db: AsyncSession = Depends(get_async_db)
+):
+    """Get macro-related news for the specified date; send Accept: application/x-ndjson to stream it.
+
+    JSON bodies support If-None-Match / If-Modified-Since against the day's
+    newest update. The service already builds the MacroNews shape, so the
+    JSON body is serialized directly instead of being re-validated against it.
+    """
+    try:
+        if wants_ndjson(request):
+            # Headers go out before the rows are read and a failed query ends
+            # the stream early, so a stream never gets validators to confirm it
+            result = ndjson_response(macro_service.iter_macro_news_async(db, date, limit=limit, after=after))
+            result.headers.update(NO_STORE_HEADERS)
+            result.headers["Vary"] = "Accept"
+            return result
+        
+        version = await macro_service.news_version_async(db, date)
+        headers, cached = _validators(request, version, "news", limit, after)
+        if headers:
+            # The same URL streams NDJSON when asked to
+            headers["Vary"] = "Accept"
+        if cached:
+            return cached
+        result = await macro_service.get_macro_news_async(db, date, limit=limit, after=after)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    
+    if "error" in result:
+        headers = NO_STORE_HEADERS
+    return ORJSONResponse(result, headers=headers)
+
+
+@router.get("/dashboard", response_model=MacroDashboard)
+async def get_macro_dashboard(
+    request: Request,
+    date: Optional[str] = None,
+    sessions: async_sessionmaker = Depends(get_async_sessionmaker)
+):
+    """Get dates, indicators, analysis and news for one day (default: the latest) in one response"""
+    try:
+        day, dates, version = await macro_service.dashboard_version_async(sessions, date)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    
+    headers, cached = _validators(request, version, "dashboard")
+    if cached:
+        return cached
+    
+    result = await macro_service.get_dashboard_async(sessions, day, dates, version)
+    if any("error" in result[part] for part in ("dates", "indicators", "news")):
+        headers = NO_STORE_HEADERS
+    return ORJSONResponse(result, headers=headers)
@@ -1,10 +1,11 @@
 # backend/app/api/routes/news.py
-from fastapi import APIRouter, Depends, HTTPException
+from fastapi import APIRouter, Depends, HTTPException, Query
 from sqlalchemy.orm import Session
-from typing import List
+from typing import List, Optional
 
 from app.db.database import get_db
 from app.schemas import news as news_schemas
+from app.services.news_search import search_news
 
 router = APIRouter()
 
@@ -23,4 +24,17 @@ def get_trending_news(db: Session = Depends(get_db)):
         {"id": 9, "title": "Header", "subheading": "Subhead before 3hours", "published_time": "3hours", "tag": "Tag"},
         {"id": 10, "title": "Header", "subheading": "Subhead before 3hours", "published_time": "3hours", "tag": "Tag"},
     ]
-    return news_items
\ No newline at end of file
+    return news_items
+
+
+@router.get("/search", response_model=news_schemas.NewsSearchResults)
+def search(
+    q: str = Query(..., min_length=1, max_length=200),
+    lang: Optional[str] = Query(None, pattern="^(en|ko)$", description="Defaults to ko when q contains Hangul"),
+    limit: int = Query(20, ge=1, le=100),
+    # Ranked results can't be keyset-paged, so cap how deep offsets go
+    offset: int = Query(0, ge=0, le=1000),
+    db: Session = Depends(get_db)
+):
+    """Ranked full-text search over English and Korean news"""
+    return search_news(db, q, lang=lang, limit=limit, offset=offset)
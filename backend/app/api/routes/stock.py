@@ -1,11 +1,15 @@
 # backend/app/api/routes/stock.py
-from fastapi import APIRouter, Depends, HTTPException
+from fastapi import APIRouter, Depends, HTTPException, Query
+from fastapi.responses import ORJSONResponse
 from sqlalchemy.orm import Session
-from typing import List
+from typing import List, Optional
+from datetime import datetime
 
+from app.api.dependencies import require_admin
 from app.db.database import get_db
 from app.db import models
 from app.schemas import stock as stock_schemas
+from app.services import stock_service
 
 router = APIRouter()
 
@@ -38,4 +42,32 @@ def get_stock_by_symbol(symbol: str, db: Session = Depends(get_db)):
             "operating_results": "Tesla has shown consistent growth in vehicle deliveries and revenue over the past several quarters.",
             "risk_assessment": "Key risks include competition in the EV market, supply chain disruptions, and regulatory challenges."
         }
-    raise HTTPException(status_code=404, detail=f"Stock with symbol {symbol} not found")
\ No newline at end of file
+    raise HTTPException(status_code=404, detail=f"Stock with symbol {symbol} not found")
+
+@router.get("/{symbol}/prices", response_model=stock_schemas.StockPriceHistory)
+def get_stock_prices(
+    symbol: str,
+    interval: str = Query("1d", pattern="^(1m|1h|1d)$"),
+    start: Optional[datetime] = None,
+    end: Optional[datetime] = None,
+    db: Session = Depends(get_db),
+):
+    """Get OHLCV bars for a stock, aggregated in the database"""
+    stock_id = stock_service.get_stock_id(db, symbol)
+    if stock_id is None:
+        raise HTTPException(status_code=404, detail=f"Stock with symbol {symbol} not found")
+    try:
+        result = stock_service.get_price_bars(db, stock_id, interval, start, end)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    # Bars are plain floats and ISO strings already, so skip re-validating thousands of them
+    return ORJSONResponse({"symbol": symbol.upper(), **result})
+
+@router.post("/{symbol}/prices", dependencies=[Depends(require_admin)])
+def ingest_stock_prices(symbol: str, batch: stock_schemas.StockPriceBatch, db: Session = Depends(get_db)):
+    """Bulk insert a batch of price ticks for a stock (needs X-API-Key)"""
+    stock_id = stock_service.get_stock_id(db, symbol)
+    if stock_id is None:
+        raise HTTPException(status_code=404, detail=f"Stock with symbol {symbol} not found")
+    inserted = stock_service.insert_stock_prices(db, stock_id, [price.model_dump() for price in batch.prices])
+    return {"symbol": symbol.upper(), "inserted": inserted}
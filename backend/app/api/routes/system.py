@@ -0,0 +1,38 @@
+# backend/app/api/routes/system.py
+from fastapi import APIRouter, Depends, HTTPException
+
+from app.api.dependencies import require_admin
+from app.api.response_cache import response_cache
+from app.db.database import async_engine, engine, pool_stats
+from app.services.jobs import scheduler
+
+router = APIRouter()
+
+@router.get("/pool")
+def get_pool_stats():
+    """Get checked-out, idle and overflow connection counts for the sync and async DB pools"""
+    return {
+        "sync": pool_stats(engine.pool),
+        "async": pool_stats(async_engine.pool),
+    }
+
+@router.get("/cache")
+def get_response_cache_stats():
+    """Get hit, miss and coalesced counts for the GET response cache"""
+    if response_cache is None:
+        return {"backend": "off"}
+    return response_cache.report()
+
+@router.get("/jobs")
+def get_job_stats():
+    """Get schedule, run counts and durations for each background job"""
+    return scheduler.report()
+
+@router.post("/jobs/{name}/run", dependencies=[Depends(require_admin)])
+async def run_job(name: str):
+    """Run a background job now (needs X-API-Key); 409 if it is already running"""
+    if name not in scheduler.jobs:
+        raise HTTPException(status_code=404, detail=f"Job {name} not found")
+    if not await scheduler.run_now(name):
+        raise HTTPException(status_code=409, detail=f"Job {name} is already running")
+    return scheduler.jobs[name].report()
@@ -0,0 +1,62 @@
+from typing import AsyncIterable, AsyncIterator, Dict, Iterable, Iterator, Union
+
+import orjson
+from fastapi import Request
+from fastapi.responses import StreamingResponse
+
+NDJSON_MEDIA_TYPE = "application/x-ndjson"
+
+# Same options as ORJSONResponse, so a record encodes identically in JSON and NDJSON bodies
+ORJSON_OPTIONS = orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_APPEND_NEWLINE
+
+# Lines are batched into writes of roughly this size; the first line always goes out alone
+FLUSH_BYTES = 64 * 1024
+
+
+def wants_ndjson(request: Request) -> bool:
+    """True when the client opted into streaming with Accept: application/x-ndjson"""
+    return NDJSON_MEDIA_TYPE in request.headers.get("accept", "")
+
+
+def ndjson_response(records: Union[Iterable[Dict], AsyncIterable[Dict]]) -> StreamingResponse:
+    """Stream records as newline-delimited JSON, one object per line.
+
+    Records are serialized as they are produced, skipping response_model
+    validation, so memory stays flat however long the stream is. Sync
+    iterables are drained in the threadpool, async ones on the event loop.
+    """
+    body = _aencode(records) if hasattr(records, "__aiter__") else _encode(records)
+    return StreamingResponse(body, media_type=NDJSON_MEDIA_TYPE)
+
+
+def _encode(records: Iterable[Dict]) -> Iterator[bytes]:
+    buffer = []
+    size = 0
+    for i, record in enumerate(records):
+        line = orjson.dumps(record, option=ORJSON_OPTIONS)
+        buffer.append(line)
+        size += len(line)
+        # Send the header line right away so clients can start rendering
+        if i == 0 or size >= FLUSH_BYTES:
+            yield b"".join(buffer)
+            buffer = []
+            size = 0
+    if buffer:
+        yield b"".join(buffer)
+
+
+async def _aencode(records: AsyncIterable[Dict]) -> AsyncIterator[bytes]:
+    buffer = []
+    size = 0
+    first = True
+    async for record in records:
+        line = orjson.dumps(record, option=ORJSON_OPTIONS)
+        buffer.append(line)
+        size += len(line)
+        if first or size >= FLUSH_BYTES:
+            yield b"".join(buffer)
+            buffer = []
+            size = 0
+            first = False
+    if buffer:
+        yield b"".join(buffer)
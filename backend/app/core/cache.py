@@ -0,0 +1,110 @@
+import threading
+import time
+import weakref
+from collections import OrderedDict
+from typing import Any, Callable, Hashable, Optional
+
+from sqlalchemy import event
+from sqlalchemy.orm import Session, object_session
+
+# Returned by LRUCache.get when a key is absent, so None can be cached
+MISSING = object()
+
+
+class LRUCache:
+    """Thread-safe bounded LRU map with an optional per-entry TTL.
+
+    With maxbytes, sizeof(value) is charged per entry and the least recently
+    used entries are evicted until the total fits; a value larger than
+    maxbytes on its own is not stored.
+    """
+
+    def __init__(self, maxsize: int = 128, ttl: Optional[float] = None,
+                 maxbytes: Optional[int] = None, sizeof: Optional[Callable[[Any], int]] = None):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self.maxbytes = maxbytes
+        self.sizeof = sizeof
+        self.nbytes = 0
+        self._data = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: Hashable, default: Any = MISSING) -> Any:
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is None:
+                return default
+            value, expires_at, _ = entry
+            if expires_at is not None and expires_at <= time.monotonic():
+                self._remove(key)
+                return default
+            self._data.move_to_end(key)
+            return value
+
+    def set(self, key: Hashable, value: Any, ttl: Optional[float] = None):
+        ttl = self.ttl if ttl is None else ttl
+        expires_at = time.monotonic() + ttl if ttl else None
+        size = self.sizeof(value) if self.sizeof is not None else 0
+        with self._lock:
+            self._remove(key)
+            if self.maxbytes is not None and size > self.maxbytes:
+                return
+            self._data[key] = (value, expires_at, size)
+            self.nbytes += size
+            while len(self._data) > self.maxsize or (self.maxbytes is not None and self.nbytes > self.maxbytes):
+                _, (_, _, evicted) = self._data.popitem(last=False)
+                self.nbytes -= evicted
+
+    def delete(self, key: Hashable):
+        with self._lock:
+            self._remove(key)
+
+    def clear(self):
+        with self._lock:
+            self._data.clear()
+            self.nbytes = 0
+
+    def _remove(self, key: Hashable):
+        # Callers hold the lock
+        entry = self._data.pop(key, None)
+        if entry is not None:
+            self.nbytes -= entry[2]
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+
+class CommitInvalidation:
+    """Calls invalidate() on every registered owner once a commit has changed a model's rows.
+
+    ORM inserts, updates and deletes of the model flag the session that made
+    them (session.info[flag]); the owners are invalidated after that session
+    commits, and the flag is dropped on rollback. Owners are held weakly.
+    """
+
+    def __init__(self, model, flag: str):
+        self.flag = flag
+        self._owners = weakref.WeakSet()
+        for identifier in ("after_insert", "after_update", "after_delete"):
+            event.listen(model, identifier, self._mark_changed)
+        event.listen(Session, "after_commit", self._after_commit)
+        event.listen(Session, "after_rollback", self._after_rollback)
+
+    def register(self, owner):
+        self._owners.add(owner)
+
+    def invalidate(self):
+        for owner in list(self._owners):
+            owner.invalidate()
+
+    def _mark_changed(self, mapper, connection, target):
+        session = object_session(target)
+        if session is not None:
+            session.info[self.flag] = True
+
+    def _after_commit(self, session):
+        if session.info.pop(self.flag, False):
+            self.invalidate()
+
+    def _after_rollback(self, session):
+        session.info.pop(self.flag, None)
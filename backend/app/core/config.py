@@ -13,6 +13,76 @@ class Settings:
     DB_SCHEMA: str = "qfind"  # Add the schema name
     DB_AGII: str = "agii"
     
+    # Connection pool (persistent connections, extra burst connections, seconds
+    # to wait for a free one, liveness check on checkout, seconds before reconnect)
+    DB_POOL_SIZE: int = int(os.getenv("DB_POOL_SIZE", "5"))
+    DB_MAX_OVERFLOW: int = int(os.getenv("DB_MAX_OVERFLOW", "10"))
+    DB_POOL_TIMEOUT: float = float(os.getenv("DB_POOL_TIMEOUT", "30"))
+    DB_POOL_PRE_PING: bool = os.getenv("DB_POOL_PRE_PING", "true").lower() in ("1", "true", "yes")
+    DB_POOL_RECYCLE: int = int(os.getenv("DB_POOL_RECYCLE", "1800"))
+    
+    # Futures data ("file" reads the CSV/binary cache, "db" reads futures_prices)
+    FUTURES_SOURCE: str = os.getenv("FUTURES_SOURCE", "file")
+    FUTURES_DATA_PATH: str = os.getenv("FUTURES_DATA_PATH", "data/all_financial_data.csv")
+    FUTURES_RELOAD_INTERVAL_SECONDS: float = float(os.getenv("FUTURES_RELOAD_INTERVAL_SECONDS", "30"))
+    # Latest bars per symbol kept in memory in "db" mode (indicators and recent
+    # ranges); older history is read from futures_prices per request
+    FUTURES_DB_TAIL_BARS: int = int(os.getenv("FUTURES_DB_TAIL_BARS", "500"))
+    
+    # Background jobs: market data refresh (cron, server local time; default is
+    # after the US close in KST), macro snapshot precompute and response cache
+    # warming (checks every interval, re-renders only what changed). The futures
+    # hot reload above runs whether or not these are enabled.
+    SCHEDULER_ENABLED: bool = os.getenv("SCHEDULER_ENABLED", "true").lower() in ("1", "true", "yes")
+    MARKET_REFRESH_CRON: str = os.getenv("MARKET_REFRESH_CRON", "30 6 * * 2-6")
+    MACRO_PRECOMPUTE_INTERVAL_SECONDS: float = float(os.getenv("MACRO_PRECOMPUTE_INTERVAL_SECONDS", "60"))
+    CACHE_WARM_INTERVAL_SECONDS: float = float(os.getenv("CACHE_WARM_INTERVAL_SECONDS", "25"))
+    # Lifetime of warmed responses in place of RESPONSE_CACHE_TTLS. A data
+    # change re-renders them sooner; otherwise they are renewed at half of it.
+    CACHE_WARM_TTL_SECONDS: float = float(os.getenv("CACHE_WARM_TTL_SECONDS", "3600"))
+    
+    # Macro caches (entries, and seconds before re-checking the DB for new states)
+    MACRO_CACHE_SIZE: int = int(os.getenv("MACRO_CACHE_SIZE", "128"))
+    MACRO_CACHE_TTL_SECONDS: float = float(os.getenv("MACRO_CACHE_TTL_SECONDS", "300"))
+    
+    # Seconds the trending tickers snapshot is trusted; ORM commits refresh it
+    # sooner, this covers writers in other processes
+    TRENDING_CACHE_TTL_SECONDS: float = float(os.getenv("TRENDING_CACHE_TTL_SECONDS", "60"))
+    
+    # Most OHLCV bars one /api/stock/{symbol}/prices request may aggregate
+    STOCK_PRICES_MAX_BARS: int = int(os.getenv("STOCK_PRICES_MAX_BARS", "5000"))
+    
+    # GET response cache ("memory", "redis" or "off"), its entry count and the
+    # largest body it stores. redis needs the redis package and REDIS_URL.
+    RESPONSE_CACHE_BACKEND: str = os.getenv("RESPONSE_CACHE_BACKEND", "memory")
+    RESPONSE_CACHE_SIZE: int = int(os.getenv("RESPONSE_CACHE_SIZE", "256"))
+    RESPONSE_CACHE_MAX_BODY_BYTES: int = int(os.getenv("RESPONSE_CACHE_MAX_BODY_BYTES", str(4 * 1024 * 1024)))
+    # Total body and header bytes the in-process backend may hold per worker
+    RESPONSE_CACHE_MAX_BYTES: int = int(os.getenv("RESPONSE_CACHE_MAX_BYTES", str(64 * 1024 * 1024)))
+    REDIS_URL: str = os.getenv("REDIS_URL", "redis://localhost:6379/0")
+    
+    # Seconds each path prefix stays cached; the longest match wins, 0 disables
+    RESPONSE_CACHE_TTLS = {
+        "/api/macro/dates": 300,
+        "/api/macro/dashboard": 30,
+        "/api/macro/indicators": 60,
+        "/api/macro/analysis": 300,
+        "/api/macro/news": 30,
+        "/api/futures": 30,
+        "/api/futures/reload": 0,
+        "/api/stock": 15,
+    }
+    
+    # Response compression: smallest body worth compressing, gzip level and
+    # brotli quality (br is only offered when the brotli package is installed)
+    COMPRESSION_MIN_BYTES: int = int(os.getenv("COMPRESSION_MIN_BYTES", "1024"))
+    GZIP_LEVEL: int = int(os.getenv("GZIP_LEVEL", "5"))
+    BROTLI_QUALITY: int = int(os.getenv("BROTLI_QUALITY", "4"))
+    
+    # Key expected in X-API-Key by operational endpoints (running jobs, bulk
+    # ingest); they refuse every request while it is empty
+    ADMIN_API_KEY: str = os.getenv("ADMIN_API_KEY", "")
+    
     # JWT
     SECRET_KEY: str = os.getenv("SECRET_KEY", "your_secret_key_here")
     ALGORITHM: str = os.getenv("ALGORITHM", "HS256")
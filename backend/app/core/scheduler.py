@@ -0,0 +1,199 @@
+import asyncio
+import inspect
+import logging
+import random
+import time
+from datetime import datetime, timedelta
+from typing import Callable, Dict, List, Optional, Set
+
+logger = logging.getLogger(__name__)
+
+
+class CronSchedule:
+    """Five-field cron expression (minute hour day-of-month month day-of-week).
+
+    Fields take *, numbers, a-b ranges, comma lists and /step; day-of-week
+    counts Sunday as 0 (or 7). Times are the server's local time.
+    """
+
+    FIELDS = ((0, 59), (0, 23), (1, 31), (1, 12), (0, 7))
+
+    def __init__(self, expression: str):
+        parts = expression.split()
+        if len(parts) != 5:
+            raise ValueError(f"Cron expression needs 5 fields: {expression!r}")
+        self.expression = expression
+        self.minutes, self.hours, self.days, self.months, weekdays = (
+            _parse_field(part, low, high) for part, (low, high) in zip(parts, self.FIELDS)
+        )
+        self.weekdays = {day % 7 for day in weekdays}
+        # Cron ORs day-of-month and day-of-week when both are restricted
+        self._any_day = parts[2] == "*"
+        self._any_weekday = parts[4] == "*"
+
+    def _day_matches(self, day: datetime) -> bool:
+        if day.month not in self.months:
+            return False
+        in_month = day.day in self.days
+        # isoweekday() is 1-7 from Monday, so % 7 makes Sunday 0
+        in_week = day.isoweekday() % 7 in self.weekdays
+        if self._any_day or self._any_weekday:
+            return in_month and in_week
+        return in_month or in_week
+
+    def next_after(self, now: datetime) -> datetime:
+        """First matching minute strictly after now"""
+        start = now.replace(second=0, microsecond=0) + timedelta(minutes=1)
+        day = start.replace(hour=0, minute=0)
+        # Checking day by day bounds the search at a few years of days, not minutes
+        for _ in range(366 * 5):
+            if self._day_matches(day):
+                for hour in sorted(self.hours):
+                    for minute in sorted(self.minutes):
+                        candidate = day.replace(hour=hour, minute=minute)
+                        if candidate >= start:
+                            return candidate
+            day += timedelta(days=1)
+        raise ValueError(f"Cron expression never fires: {self.expression!r}")
+
+
+class IntervalSchedule:
+    """Fire every `seconds`, measured from the end of the previous run"""
+
+    def __init__(self, seconds: float):
+        if seconds <= 0:
+            raise ValueError("Interval must be positive")
+        self.seconds = seconds
+
+    def next_after(self, now: datetime) -> datetime:
+        return now + timedelta(seconds=self.seconds)
+
+
+def _parse_field(field: str, low: int, high: int) -> Set[int]:
+    values = set()
+    for part in field.split(","):
+        base, _, step = part.partition("/")
+        if base == "*":
+            start, stop = low, high
+        elif "-" in base:
+            start, stop = (int(v) for v in base.split("-", 1))
+        else:
+            start = stop = int(base)
+            if step:
+                stop = high
+        if not (low <= start <= stop <= high):
+            raise ValueError(f"Cron field {field!r} is outside {low}-{high}")
+        values.update(range(start, stop + 1, int(step) if step else 1))
+    return values
+
+
+class Job:
+    """One scheduled callable and its run metrics"""
+
+    def __init__(self, name: str, func: Callable, schedule, jitter: float = 0, run_at_start: bool = False):
+        self.name = name
+        self.func = func
+        self.schedule = schedule
+        self.jitter = jitter
+        self.run_at_start = run_at_start
+        self.lock = asyncio.Lock()
+        self.next_run_at: Optional[datetime] = None
+        self.stats = {
+            "runs": 0,
+            "failures": 0,
+            "skipped": 0,
+            "lastDurationMs": None,
+            "maxDurationMs": None,
+            "totalDurationMs": 0.0,
+            "lastStartedAt": None,
+            "lastError": None,
+        }
+
+    def report(self) -> Dict:
+        schedule = getattr(self.schedule, "expression", None) or f"every {self.schedule.seconds:g}s"
+        return {
+            "schedule": schedule,
+            "running": self.lock.locked(),
+            "nextRunAt": self.next_run_at.isoformat() if self.next_run_at else None,
+            **self.stats,
+        }
+
+
+class Scheduler:
+    """Runs jobs on asyncio tasks for the lifetime of the app.
+
+    Sync jobs run in the default thread pool so they never block requests.
+    Each job's loop waits for a run to finish before scheduling the next, so
+    a job never overlaps itself; fire times missed meanwhile are dropped, and
+    run_now calls that arrive mid-run are skipped and counted. Jitter adds a
+    random 0..jitter seconds to every wait so jobs in several processes don't
+    all hit the database in the same second.
+    """
+
+    def __init__(self):
+        self.jobs: Dict[str, Job] = {}
+        self._tasks: List[asyncio.Task] = []
+
+    def add(self, name: str, func: Callable, every: Optional[float] = None, cron: Optional[str] = None,
+            jitter: float = 0, run_at_start: bool = False) -> Job:
+        if (every is None) == (cron is None):
+            raise ValueError(f"Job {name} needs exactly one of every= or cron=")
+        schedule = IntervalSchedule(every) if every is not None else CronSchedule(cron)
+        job = Job(name, func, schedule, jitter, run_at_start)
+        self.jobs[name] = job
+        return job
+
+    def start(self):
+        if self._tasks:
+            return
+        for job in self.jobs.values():
+            self._tasks.append(asyncio.create_task(self._loop(job), name=f"job:{job.name}"))
+
+    async def stop(self):
+        for task in self._tasks:
+            task.cancel()
+        await asyncio.gather(*self._tasks, return_exceptions=True)
+        self._tasks = []
+
+    async def run_now(self, name: str) -> bool:
+        """Run a job immediately; False if it was already running"""
+        return await self._run(self.jobs[name])
+
+    def report(self) -> Dict[str, Dict]:
+        return {name: job.report() for name, job in self.jobs.items()}
+
+    async def _loop(self, job: Job):
+        if job.run_at_start:
+            await self._run(job)
+        while True:
+            job.next_run_at = job.schedule.next_after(datetime.now())
+            delay = (job.next_run_at - datetime.now()).total_seconds() + random.uniform(0, job.jitter)
+            await asyncio.sleep(max(delay, 0))
+            await self._run(job)
+
+    async def _run(self, job: Job) -> bool:
+        if job.lock.locked():
+            job.stats["skipped"] += 1
+            return False
+        async with job.lock:
+            job.stats["lastStartedAt"] = datetime.now().isoformat()
+            started = time.perf_counter()
+            try:
+                if inspect.iscoroutinefunction(job.func):
+                    await job.func()
+                else:
+                    await asyncio.to_thread(job.func)
+                job.stats["lastError"] = None
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                job.stats["failures"] += 1
+                job.stats["lastError"] = f"{type(e).__name__}: {e}"
+                logger.exception("Scheduled job %s failed", job.name)
+            finally:
+                duration_ms = (time.perf_counter() - started) * 1000
+                job.stats["runs"] += 1
+                job.stats["lastDurationMs"] = round(duration_ms, 2)
+                job.stats["maxDurationMs"] = round(max(job.stats["maxDurationMs"] or 0, duration_ms), 2)
+                job.stats["totalDurationMs"] = round(job.stats["totalDurationMs"] + duration_ms, 2)
+        return True
@@ -1,12 +1,42 @@
 # backend/app/db/database.py
 from sqlalchemy import create_engine, event
+from sqlalchemy.engine import make_url
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import AsyncAdaptedQueuePool, QueuePool
 from sqlalchemy.schema import CreateSchema
 
 from app.core.config import settings
 
-engine = create_engine(settings.DATABASE_URL)
+POOL_OPTIONS = dict(
+    pool_size=settings.DB_POOL_SIZE,
+    max_overflow=settings.DB_MAX_OVERFLOW,
+    pool_timeout=settings.DB_POOL_TIMEOUT,
+    pool_pre_ping=settings.DB_POOL_PRE_PING,
+    pool_recycle=settings.DB_POOL_RECYCLE,
+)
+
+# asyncio drivers for the same databases
+ASYNC_DRIVERS = {"postgresql": "asyncpg", "sqlite": "aiosqlite"}
+
+
+def async_database_url(url: str):
+    """DATABASE_URL rewritten to use the backend's asyncio driver"""
+    url = make_url(url)
+    backend = url.get_backend_name()
+    if backend not in ASYNC_DRIVERS:
+        raise ValueError(f"No async driver configured for {backend}")
+    return url.set(drivername=f"{backend}+{ASYNC_DRIVERS[backend]}")
+
+
+engine = create_engine(settings.DATABASE_URL, **POOL_OPTIONS)
+
+# Async engine for routes that await their queries; it has its own pool with the
+# same limits (named explicitly since aiosqlite would otherwise get a NullPool)
+async_engine = create_async_engine(
+    async_database_url(settings.DATABASE_URL), poolclass=AsyncAdaptedQueuePool, **POOL_OPTIONS
+)
 
 # Create the schema if it doesn't exist
 @event.listens_for(engine, "connect")
@@ -16,6 +46,7 @@ def create_schema(dbapi_connection, connection_record):
     cursor.close()
 
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+AsyncSessionLocal = async_sessionmaker(async_engine, autoflush=False, expire_on_commit=False)
 
 Base = declarative_base()
 # Set the default schema for all tables
@@ -27,4 +58,28 @@ def get_db():
     try:
         yield db
     finally:
-        db.close()
\ No newline at end of file
+        db.close()
+
+async def get_async_db():
+    async with AsyncSessionLocal() as db:
+        yield db
+
+def get_async_sessionmaker() -> async_sessionmaker:
+    """For routes that open several sessions to run queries concurrently"""
+    return AsyncSessionLocal
+
+def pool_stats(pool=None) -> dict:
+    """Point-in-time connection counts for the engine's pool"""
+    pool = pool or engine.pool
+    stats = {"pool": type(pool).__name__, "status": pool.status()}
+    if isinstance(pool, QueuePool):
+        stats.update({
+            "size": pool.size(),
+            "checked_in": pool.checkedin(),
+            "checked_out": pool.checkedout(),
+            # QueuePool counts overflow from -size, so only positive values are extra connections
+            "overflow": max(pool.overflow(), 0),
+            "max_overflow": pool._max_overflow,
+            "timeout": pool.timeout(),
+        })
+    return stats
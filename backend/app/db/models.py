@@ -1,11 +1,15 @@
 # backend/app/db/models.py
-from sqlalchemy import Column, Integer, String, Float, Text, DateTime, ForeignKey, schema
-from sqlalchemy.orm import relationship
-from sqlalchemy.sql import func
+from sqlalchemy import Column, Integer, BigInteger, String, Float, Text, DateTime, ForeignKey, Index, JSON, schema
+from sqlalchemy.dialects.postgresql import JSONB
+from sqlalchemy.orm import deferred, relationship
+from sqlalchemy.sql import func, text
 
 from app.db.database import Base
 from app.core.config import settings
 
+# JSONB on PostgreSQL, JSON stored as TEXT on SQLite
+JSONDocument = JSON().with_variant(JSONB(), "postgresql")
+
 class Stock(Base):
     __tablename__ = "stocks"
     __table_args__ = {'schema': settings.DB_SCHEMA}
@@ -24,19 +28,42 @@ class Stock(Base):
 
 class StockPrice(Base):
     __tablename__ = "stock_prices"
-    __table_args__ = {'schema': settings.DB_SCHEMA}
+    __table_args__ = (
+        # Range scans per stock for /api/stock/{symbol}/prices
+        Index("ix_stock_prices_stock_id_timestamp", "stock_id", "timestamp"),
+        # Ticks arrive in time order, so a BRIN index stays tiny however large the table grows
+        Index("ix_stock_prices_timestamp_brin", "timestamp", postgresql_using="brin").ddl_if(dialect="postgresql"),
+        {'schema': settings.DB_SCHEMA},
+    )
 
     id = Column(Integer, primary_key=True, index=True)
     stock_id = Column(Integer, ForeignKey(f"{settings.DB_SCHEMA}.stocks.id"))
     price = Column(Float)
     volume = Column(Integer)
-    timestamp = Column(DateTime(timezone=True), index=True)
+    timestamp = Column(DateTime(timezone=True))
     
     stock = relationship("Stock", back_populates="prices")
 
 # Add this relationship to the Stock model
 Stock.prices = relationship("StockPrice", back_populates="stock")
 
+class FuturesPrice(Base):
+    __tablename__ = "futures_prices"
+    __table_args__ = (
+        # Range scans per symbol and the upsert conflict target
+        Index("ix_futures_prices_symbol_timestamp", "symbol", "timestamp", unique=True),
+        # max(updated_at) change detection and "rows written since" reloads
+        Index("ix_futures_prices_updated_at", "updated_at"),
+        {'schema': settings.DB_SCHEMA},
+    )
+
+    id = Column(Integer, primary_key=True, index=True)
+    symbol = Column(String(16), nullable=False)
+    timestamp = Column(DateTime(timezone=True), nullable=False)
+    price = Column(Float, nullable=False)
+    volume = Column(BigInteger, nullable=True)
+    updated_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now())
+
 class TrendingKeyword(Base):
     __tablename__ = "trending_keywords"
     __table_args__ = {'schema': settings.DB_SCHEMA}
@@ -60,7 +87,15 @@ class MacroIndicator(Base):
 
 class News(Base):
     __tablename__ = "market_news"
-    __table_args__ = {'schema': settings.DB_AGII}
+    __table_args__ = (
+        # agii owns this table, so its columns stay as they are. The indexes
+        # here only add access paths: rows and columns are untouched, and
+        # ensure_indexes logs and skips them where agii has not granted us
+        # the privileges to create them.
+        # Day-range scans ordered by date, with id for joins and keyset paging
+        Index("ix_agii_market_news_date_id", "date", "id"),
+        {'schema': settings.DB_AGII},
+    )
 
     id = Column(Integer, primary_key=True, index=True)
     date = Column(DateTime(timezone=True), nullable=False)  
@@ -74,7 +109,16 @@ class News(Base):
 
 class KoreanNews(Base):
     __tablename__ = "market_news"
-    __table_args__ = {'schema': settings.DB_SCHEMA}  # Use qfind schema
+    __table_args__ = (
+        Index("ix_qfind_market_news_date_id", "date", "id"),
+        # No Korean text search config ships with PostgreSQL, so Korean search
+        # is substring matching backed by trigram indexes (needs pg_trgm)
+        Index("ix_qfind_market_news_headline_trgm", "headline",
+              postgresql_using="gin", postgresql_ops={"headline": "gin_trgm_ops"}).ddl_if(dialect="postgresql"),
+        Index("ix_qfind_market_news_body_trgm", "body",
+              postgresql_using="gin", postgresql_ops={"body": "gin_trgm_ops"}).ddl_if(dialect="postgresql"),
+        {'schema': settings.DB_SCHEMA},  # Use qfind schema
+    )
 
     id = Column(Integer, primary_key=True, index=True)
     date = Column(DateTime(timezone=True), nullable=False)  
@@ -86,6 +130,14 @@ class KoreanNews(Base):
     created_at = Column(DateTime(timezone=True), nullable=False, server_default=func.now())
     updated_at = Column(DateTime(timezone=True), nullable=False, server_default=func.now())
 
+# Weighted English document for full-text search; news search must query this
+# exact expression for PostgreSQL to use the expression index below
+ENGLISH_CONFIG = text("'english'::regconfig")
+NEWS_SEARCH_VECTOR = func.setweight(func.to_tsvector(ENGLISH_CONFIG, News.headline), text("'A'")).op("||")(
+    func.setweight(func.to_tsvector(ENGLISH_CONFIG, News.body), text("'B'"))
+)
+Index("ix_agii_market_news_search", NEWS_SEARCH_VECTOR, postgresql_using="gin").ddl_if(dialect="postgresql")
+
 class TrendingTicker(Base):
     __tablename__ = "trending_tickers"
     __table_args__ = {'schema': settings.DB_SCHEMA}
@@ -98,9 +150,20 @@ class TrendingTicker(Base):
     change_percent = Column(Float)
     timestamp = Column(DateTime(timezone=True), index=True, server_default=func.now())
 
+# Latest row per symbol: DISTINCT ON (symbol) ... ORDER BY symbol, timestamp DESC
+# (and the SQLite window-function form) read this index in order
+Index("ix_trending_tickers_symbol_timestamp", TrendingTicker.symbol, TrendingTicker.timestamp.desc())
+
 class MacroAnalysisState(Base):
     __tablename__ = "macro_analysis_states"
-    __table_args__ = {'schema': settings.DB_SCHEMA}
+    __table_args__ = (
+        # Per-indicator filtering (?, @>, jsonb_path) on the JSONB payloads
+        Index("ix_macro_analysis_states_indicator_values_gin", "economic_indicator_values",
+              postgresql_using="gin").ddl_if(dialect="postgresql"),
+        Index("ix_macro_analysis_states_final_analysis_gin", "final_analysis_results",
+              postgresql_using="gin").ddl_if(dialect="postgresql"),
+        {'schema': settings.DB_SCHEMA},
+    )
 
     id = Column(Integer, primary_key=True, index=True)
     timestamp = Column(DateTime(timezone=True), index=True, server_default=func.now())
@@ -110,16 +173,18 @@ class MacroAnalysisState(Base):
     cme_fedwatch_data_path = Column(String)
     remaining_days = Column(Integer)
     
-    # JSON fields for complex data structures
-    economic_indicator_values = Column(Text)  # Stored as JSON string
-    news_items = Column(Text)  # Stored as JSON string
-    answer = Column(Text)
-    economic_raw_data = Column(Text)  # Stored as JSON string
-    economic_analysis = Column(Text)  # Stored as JSON string
-    extracted_contents = Column(Text)  # Stored as JSON string
-    summarized_contents = Column(Text)  # Stored as JSON string
-    filtered_summarized_contents = Column(Text)  # Stored as JSON string
-    final_analysis_results = Column(Text)  # Stored as JSON string
+    # JSON fields for complex data structures. They are large, so entity loads
+    # skip them unless their group is requested (see MacroService.load_state_async):
+    # "indicators", "analysis", or "raw" for intermediate pipeline artifacts
+    economic_indicator_values = deferred(Column(JSONDocument), group="indicators")
+    news_items = deferred(Column(JSONDocument), group="raw")
+    answer = deferred(Column(Text), group="analysis")
+    economic_raw_data = deferred(Column(JSONDocument), group="raw")
+    economic_analysis = deferred(Column(JSONDocument), group="analysis")
+    extracted_contents = deferred(Column(JSONDocument), group="raw")
+    summarized_contents = deferred(Column(JSONDocument), group="raw")
+    filtered_summarized_contents = deferred(Column(JSONDocument), group="raw")
+    final_analysis_results = deferred(Column(JSONDocument), group="analysis")
     
     # Add timestamps for tracking
     created_at = Column(DateTime(timezone=True), server_default=func.now())
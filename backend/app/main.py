@@ -1,20 +1,48 @@
 # backend/app/main.py
+import asyncio
+from contextlib import asynccontextmanager
+
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import ORJSONResponse
 
-from app.api.routes import stock, trending, macro, news, futures
+from app.api.cache_warming import register_warm_job
+from app.api.compression import CompressionMiddleware
+from app.api.response_cache import ResponseCacheMiddleware, response_cache
+from app.api.routes import stock, trending, macro, news, futures, system
 from app.core.config import settings
-from app.db.database import engine
-from app.db import models
+from app.services.init_service import init_db
+from app.services.jobs import register_jobs, register_reload_job, scheduler
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    # Extensions, tables, migrations and indexes, in that order
+    await asyncio.to_thread(init_db)
+
+    # Hot reload of futures data changed outside this process always runs;
+    # refreshing data and warming caches in the background is optional
+    register_reload_job(futures.futures_service)
+    if settings.SCHEDULER_ENABLED:
+        register_jobs(futures.futures_service, macro.macro_service)
+        register_warm_job(app, futures.futures_service, macro.macro_service)
+    scheduler.start()
+    yield
+    await scheduler.stop()
 
-# Create tables in the database
-models.Base.metadata.create_all(bind=engine)
 
 app = FastAPI(
     title=settings.PROJECT_NAME,
-    version=settings.PROJECT_VERSION
+    version=settings.PROJECT_VERSION,
+    lifespan=lifespan,
+    default_response_class=ORJSONResponse
 )
 
+# Middleware added last runs outermost. The response cache goes in first so
+# it sits inside CORS, which then sets headers per request on cached replies.
+if response_cache is not None:
+    app.add_middleware(ResponseCacheMiddleware, cache=response_cache)
+
 # Set up CORS
 app.add_middleware(
     CORSMiddleware,
@@ -24,12 +52,16 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+# Outermost, so cached entries are stored uncompressed and encoded per client
+app.add_middleware(CompressionMiddleware)
+
 # Include routers
 app.include_router(stock.router, prefix="/api/stock", tags=["stock"])
 app.include_router(trending.router, prefix="/api/trending", tags=["trending"])
 app.include_router(macro.router, prefix="/api/macro", tags=["macro"])
 app.include_router(news.router, prefix="/api/news", tags=["news"])
 app.include_router(futures.router, prefix="/api/futures", tags=["futures"])
+app.include_router(system.router, prefix="/api/system", tags=["system"])
 
 
 @app.get("/")
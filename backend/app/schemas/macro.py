@@ -26,7 +26,7 @@ class MacroAnalysis(BaseModel):
 class MacroNewsItem(BaseModel):
     id: int
     title: str
-    date: str  # e.g., "3hours ago"
+    date: str  # ISO 8601 timestamp, e.g. "2025-03-28T09:30:00+00:00"
     tag: str
     url: str
     body: str
@@ -37,8 +37,18 @@ class MacroNewsItem(BaseModel):
 class MacroNews(BaseModel):
     date: date
     news: List[MacroNewsItem]
+    next_cursor: Optional[str] = None  # Pass as after= to fetch the next page
+    error: Optional[str] = None  # Set, with an empty list, when the news query failed
 
 
 class MacroDates(BaseModel):
     dates: List[str]
-    months: List[str]
\ No newline at end of file
+    months: List[str]
+
+
+class MacroDashboard(BaseModel):
+    date: date
+    dates: MacroDates
+    indicators: EconomicIndicators
+    analysis: MacroAnalysis
+    news: MacroNews
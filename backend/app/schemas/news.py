@@ -13,4 +13,23 @@ class News(NewsBase):
     id: int
     
     class Config:
-        from_attributes = True
\ No newline at end of file
+        from_attributes = True
+
+
+class NewsSearchHit(BaseModel):
+    id: int
+    date: datetime
+    title: str
+    tag: str
+    url: str
+    body: str
+    kor_title: Optional[str] = None
+    kor_body: Optional[str] = None
+    score: float  # Higher is more relevant; not comparable across languages
+
+
+class NewsSearchResults(BaseModel):
+    query: str
+    lang: str  # "en" or "ko"
+    results: List[NewsSearchHit]
+    next_offset: Optional[int] = None  # Pass as offset= to fetch the next page
@@ -1,7 +1,7 @@
 # backend/app/schemas/stock.py
 from typing import List, Optional
 from datetime import datetime
-from pydantic import BaseModel
+from pydantic import BaseModel, Field
 
 class StockBase(BaseModel):
     symbol: str
@@ -40,4 +40,21 @@ class StockPrice(StockPriceBase):
     stock_id: int
     
     class Config:
-        from_attributes = True
\ No newline at end of file
+        from_attributes = True
+class StockPriceBatch(BaseModel):
+    prices: List[StockPriceBase] = Field(..., min_length=1, max_length=100000)
+
+class StockPriceBar(BaseModel):
+    timestamp: datetime
+    open: float
+    high: float
+    low: float
+    close: float
+    volume: int
+
+class StockPriceHistory(BaseModel):
+    symbol: str
+    interval: str
+    start: datetime
+    end: datetime
+    bars: List[StockPriceBar]
@@ -0,0 +1,128 @@
+import copy
+import math
+from collections import deque
+from typing import Dict, Optional
+
+from app.services.price_series import PriceSeries
+
+
+class RollingAnalytics:
+    """Incrementally maintained stats for one symbol's price stream.
+
+    Every append is O(1): daily returns feed a running (Welford) variance for
+    volatility, the last few returns feed sentiment, and monotonic deques track
+    the min/max over an optional window (the full history by default).
+    """
+
+    def __init__(self, sentiment_window: int = 10, range_window: Optional[int] = None):
+        self.count = 0
+        self.last_price = None
+        self.previous_price = None
+        self.last_volume = 0
+
+        # Welford accumulators over daily returns
+        self._returns_count = 0
+        self._returns_mean = 0.0
+        self._returns_m2 = 0.0
+
+        self._recent_returns = deque(maxlen=sentiment_window)
+
+        # (position, price) pairs, increasing for min and decreasing for max
+        self._range_window = range_window
+        self._min_queue = deque()
+        self._max_queue = deque()
+
+    def append(self, price: float, volume: int):
+        """Add the next bar to every rolling window"""
+        price = float(price)
+        if self.last_price is not None:
+            daily_return = price / self.last_price - 1
+            self._returns_count += 1
+            delta = daily_return - self._returns_mean
+            self._returns_mean += delta / self._returns_count
+            self._returns_m2 += delta * (daily_return - self._returns_mean)
+            self._recent_returns.append(daily_return)
+
+        position = self.count
+        while self._min_queue and self._min_queue[-1][1] >= price:
+            self._min_queue.pop()
+        self._min_queue.append((position, price))
+        while self._max_queue and self._max_queue[-1][1] <= price:
+            self._max_queue.pop()
+        self._max_queue.append((position, price))
+        if self._range_window is not None:
+            oldest = position - self._range_window + 1
+            while self._min_queue[0][0] < oldest:
+                self._min_queue.popleft()
+            while self._max_queue[0][0] < oldest:
+                self._max_queue.popleft()
+
+        self.previous_price = self.last_price if self.last_price is not None else price
+        self.last_price = price
+        self.last_volume = int(volume)
+        self.count += 1
+
+    def copy(self) -> "RollingAnalytics":
+        """Independent copy; the deques hold immutable values, so copying them shallowly suffices"""
+        clone = copy.copy(self)
+        clone._recent_returns = self._recent_returns.copy()
+        clone._min_queue = self._min_queue.copy()
+        clone._max_queue = self._max_queue.copy()
+        return clone
+
+    def extend(self, series: PriceSeries, start: int = 0):
+        """Append series[start:] bar by bar"""
+        for price, volume in zip(series.prices[start:].tolist(), series.volumes[start:].tolist()):
+            self.append(price, volume)
+
+    @property
+    def min_price(self) -> float:
+        return self._min_queue[0][1]
+
+    @property
+    def max_price(self) -> float:
+        return self._max_queue[0][1]
+
+    @property
+    def volatility(self) -> float:
+        """Annualized standard deviation of daily returns, in percent"""
+        if self._returns_count == 0:
+            return float("nan")
+        return math.sqrt(self._returns_m2 / self._returns_count) * 100 * math.sqrt(252)
+
+    @property
+    def sentiment(self) -> float:
+        """Weighted mean of recent returns, scaled and clamped to [-1, 1]"""
+        k = len(self._recent_returns)
+        if k == 0:
+            return 0
+        # Weight recent returns more heavily, linearly from 0.5 to 1.0
+        step = 0.5 / (k - 1) if k > 1 else 0.0
+        weighted = sum(r * (0.5 + step * i) for i, r in enumerate(self._recent_returns))
+        sentiment = weighted / k * 20  # Scale to roughly -1 to 1
+        return max(min(sentiment, 1.0), -1.0)
+
+    def snapshot(self) -> Dict:
+        """Response-ready stats for the latest bar"""
+        daily_change = self.last_price - self.previous_price
+        return {
+            "currentPrice": self.last_price,
+            "dailyChange": daily_change,
+            "dailyChangePercent": (daily_change / self.previous_price) * 100,
+            "volume": self.last_volume,
+            "openInterest": int(self.last_volume * 1.5),  # Mock value
+            "volatility": round(self.volatility, 1),
+            "sentiment": self.sentiment,
+        }
+
+
+def extend_analytics(engine: RollingAnalytics, series: PriceSeries, start: int = 0) -> RollingAnalytics:
+    """Copy of an engine that has seen series[:start], advanced over the remaining bars"""
+    engine = engine.copy()
+    engine.extend(series, start)
+    return engine
+
+
+def build_analytics(series: PriceSeries) -> RollingAnalytics:
+    """Replay a full price history through a fresh engine"""
+    return extend_analytics(RollingAnalytics(), series)
@@ -0,0 +1,169 @@
+import csv
+import io
+from datetime import date, datetime, time, timedelta
+from itertools import groupby
+from typing import Dict, Iterator, List, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+from sqlalchemy import func, select
+from sqlalchemy.dialects import sqlite
+from sqlalchemy.orm import Session
+
+from app.core.config import settings
+from app.db.models import FuturesPrice
+from app.services.price_series import PriceSeries, mock_volumes
+
+# Rows per executemany batch / server-side cursor fetch
+BATCH_SIZE = 5000
+
+
+def frame_to_rows(df: pd.DataFrame, symbol_mapping: Dict[str, str]) -> List[Dict]:
+    """Flatten a wide price frame (one column per contract) into futures_prices rows"""
+    names = {column: symbol for symbol, column in symbol_mapping.items() if column in df.columns}
+    if not names:
+        return []
+    stacked = df[list(names)].rename(columns=names).stack().dropna()
+    return [
+        {"symbol": symbol, "timestamp": datetime.combine(day.date(), time.min), "price": float(price), "volume": None}
+        for (day, symbol), price in stacked.items()
+    ]
+
+
+def upsert_futures_prices(db: Session, rows: List[Dict]) -> int:
+    """Bulk insert-or-update rows keyed on (symbol, timestamp)"""
+    if not rows:
+        return 0
+    if db.get_bind().dialect.name == "postgresql":
+        _copy_upsert(db, rows)
+    else:
+        for i in range(0, len(rows), BATCH_SIZE):
+            stmt = sqlite.insert(FuturesPrice).values(rows[i:i + BATCH_SIZE])
+            stmt = stmt.on_conflict_do_update(
+                index_elements=["symbol", "timestamp"],
+                set_={
+                    "price": stmt.excluded.price,
+                    "volume": func.coalesce(stmt.excluded.volume, FuturesPrice.volume),
+                    "updated_at": func.now(),
+                },
+                # Re-fetched bars that didn't change keep their updated_at
+                where=FuturesPrice.price.is_distinct_from(stmt.excluded.price)
+                | func.coalesce(stmt.excluded.volume, FuturesPrice.volume).is_distinct_from(FuturesPrice.volume),
+            )
+            db.execute(stmt)
+    db.commit()
+    return len(rows)
+
+
+def _copy_upsert(db: Session, rows: List[Dict]):
+    """COPY rows into a temp table, then merge them with one INSERT ... ON CONFLICT"""
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    for row in rows:
+        writer.writerow([row["symbol"], row["timestamp"].isoformat(), row["price"], row["volume"]])
+    buffer.seek(0)
+
+    cursor = db.connection().connection.cursor()
+    try:
+        cursor.execute("DROP TABLE IF EXISTS futures_prices_staging")
+        cursor.execute(
+            "CREATE TEMP TABLE futures_prices_staging "
+            "(symbol text, timestamp timestamptz, price double precision, volume bigint) ON COMMIT DROP"
+        )
+        cursor.copy_expert(
+            "COPY futures_prices_staging (symbol, timestamp, price, volume) FROM STDIN WITH (FORMAT csv)",
+            buffer,
+        )
+        cursor.execute(
+            f"INSERT INTO {settings.DB_SCHEMA}.futures_prices AS t (symbol, timestamp, price, volume, updated_at) "
+            "SELECT symbol, timestamp, price, volume, now() FROM futures_prices_staging "
+            "ON CONFLICT (symbol, timestamp) DO UPDATE SET "
+            "price = EXCLUDED.price, volume = COALESCE(EXCLUDED.volume, t.volume), updated_at = now() "
+            # Re-fetched bars that didn't change keep their updated_at
+            "WHERE t.price IS DISTINCT FROM EXCLUDED.price "
+            "OR COALESCE(EXCLUDED.volume, t.volume) IS DISTINCT FROM t.volume"
+        )
+    finally:
+        cursor.close()
+
+
+def _rows_to_series(timestamps: List[datetime], prices: List[float], volumes: List[Optional[int]]) -> PriceSeries:
+    volume_array = np.array([v if v is not None else -1 for v in volumes], dtype=np.int64)
+    missing = volume_array < 0
+    if missing.any():
+        # Volume isn't ingested yet, keep the mock volumes the CSV path uses
+        volume_array[missing] = mock_volumes(int(missing.sum()))
+    return PriceSeries([t.date() for t in timestamps], prices, volume_array)
+
+
+def _in_range(stmt, start: Optional[date] = None, end: Optional[date] = None):
+    if start is not None:
+        stmt = stmt.where(FuturesPrice.timestamp >= datetime.combine(start, time.min))
+    if end is not None:
+        stmt = stmt.where(FuturesPrice.timestamp < datetime.combine(end + timedelta(days=1), time.min))
+    return stmt
+
+
+def iter_price_chunks(db: Session, symbols: List[str], updated_after=None) -> Iterator[Tuple[str, PriceSeries]]:
+    """Stream bars in (symbol, timestamp) order as per-symbol chunks of at most BATCH_SIZE rows.
+
+    With updated_after (a data_version()), only rows written since then are read.
+    """
+    stmt = (
+        select(FuturesPrice.symbol, FuturesPrice.timestamp, FuturesPrice.price, FuturesPrice.volume)
+        .where(FuturesPrice.symbol.in_(symbols))
+        .order_by(FuturesPrice.symbol, FuturesPrice.timestamp)
+        .execution_options(yield_per=BATCH_SIZE)
+    )
+    if updated_after is not None:
+        stmt = stmt.where(FuturesPrice.updated_at > updated_after)
+    for partition in db.execute(stmt).partitions():
+        for symbol, rows in groupby(partition, key=lambda row: row[0]):
+            rows = list(rows)
+            yield symbol, _rows_to_series([r[1] for r in rows], [r[2] for r in rows], [r[3] for r in rows])
+
+
+def load_price_series(db: Session, symbols: List[str], start: Optional[date] = None,
+                      end: Optional[date] = None) -> Dict[str, PriceSeries]:
+    """Read the given symbols' bars within [start, end] in index order"""
+    stmt = _in_range(
+        select(FuturesPrice.symbol, FuturesPrice.timestamp, FuturesPrice.price, FuturesPrice.volume)
+        .where(FuturesPrice.symbol.in_(symbols))
+        .order_by(FuturesPrice.symbol, FuturesPrice.timestamp),
+        start, end,
+    )
+    columns: Dict[str, Tuple[list, list, list]] = {}
+    for symbol, timestamp, price, volume in db.execute(stmt):
+        timestamps, prices, volumes = columns.setdefault(symbol, ([], [], []))
+        timestamps.append(timestamp)
+        prices.append(price)
+        volumes.append(volume)
+    return {symbol: _rows_to_series(*column) for symbol, column in columns.items()}
+
+
+def _price_range_statement(symbol: str, start: Optional[date] = None, end: Optional[date] = None):
+    return _in_range(
+        select(FuturesPrice.timestamp, FuturesPrice.price, FuturesPrice.volume)
+        .where(FuturesPrice.symbol == symbol)
+        .order_by(FuturesPrice.timestamp),
+        start, end,
+    )
+
+
+def query_price_range(db: Session, symbol: str, start: Optional[date] = None, end: Optional[date] = None) -> PriceSeries:
+    """Read one symbol's bars within [start, end] with an index range scan"""
+    rows = db.execute(_price_range_statement(symbol, start, end)).all()
+    return _rows_to_series([r[0] for r in rows], [r[1] for r in rows], [r[2] for r in rows])
+
+
+def stream_price_range(db: Session, symbol: str, start: Optional[date] = None, end: Optional[date] = None) -> Iterator[Dict]:
+    """Yield priceHistory records for [start, end] from a server-side cursor"""
+    stmt = _price_range_statement(symbol, start, end).execution_options(yield_per=BATCH_SIZE)
+    for partition in db.execute(stmt).partitions():
+        series = _rows_to_series([r[0] for r in partition], [r[1] for r in partition], [r[2] for r in partition])
+        yield from series.to_records()
+
+
+def data_version(db: Session) -> Optional[datetime]:
+    """Latest write to the table, read from the updated_at index; None while it is empty"""
+    return db.execute(select(func.max(FuturesPrice.updated_at))).scalar()
@@ -1,76 +1,279 @@
 import json
 import pandas as pd
 import numpy as np
-from datetime import datetime, timedelta
-from typing import Dict, List, Optional
+from datetime import date, datetime, timedelta
+from typing import Dict, Iterator, List, Optional
 import os
-import random
+import threading
+import time
+
+from sqlalchemy.orm import Session
+
+from app.core.config import settings
+from app.db.database import SessionLocal
+from app.services import futures_db
+from app.services.futures_analytics import RollingAnalytics, build_analytics, extend_analytics
+from app.services.indicators import compute_indicators
+from app.services.price_series import (
+    PriceSeries, date_bounds, downsample, iter_records, load_price_columns, mock_volumes, resample_ohlc
+)
+
+# Map our futures symbols to CSV columns (and fetch_data.py names)
+SYMBOL_MAPPING = {
+    "ES": "S&P 500 선물",
+    "NQ": "나스닥 100 선물",
+    "YM": "다우존스 선물",
+    "CL": "크루드 오일",
+    "GC": "골드",
+    "ZB": "30년 국채",
+    "ZN": "10년 국채",
+    "ZF": "5년 국채",
+    "6E": "유로",
+    "6J": "일본 엔"
+}
+
+
+class FuturesDataset:
+    """Immutable snapshot of loaded price series and their precomputed stats.
+
+    The service swaps whole snapshots on reload, so a reader that grabbed one
+    never sees a half-loaded dataset.
+    """
+
+    def __init__(self, price_data: Dict[str, PriceSeries], source_version=None,
+                 previous: Optional["FuturesDataset"] = None,
+                 analytics: Optional[Dict[str, RollingAnalytics]] = None):
+        # In database mode price_data holds only each symbol's latest bars and
+        # analytics comes in already advanced over the full history
+        self.price_data = price_data
+        self.source_version = source_version
+        self.analytics = {}
+        self.stats = {}
+
+        # Align every series on the union of dates so batch reads are one matrix slice
+        self.symbols = list(price_data)
+        self.columns = {symbol: i for i, symbol in enumerate(self.symbols)}
+        self.dates, self.matrix = align_series(price_data, self.symbols)
+
+        # Indicators for every symbol in one vectorized pass, each over its own bars
+        self.indicators = compute_indicators(price_data)
+
+        # Carry each analytics engine over from the previous load and push only the new bars
+        for symbol, series in price_data.items():
+            if analytics is not None:
+                engine = analytics[symbol]
+            else:
+                engine = _resume_analytics(previous, symbol, series)
+            self.analytics[symbol] = engine
+            self.stats[symbol] = {
+                **engine.snapshot(),
+                "support": self.indicators[symbol]["support"],
+                "resistance": self.indicators[symbol]["resistance"],
+            }
+
+    def select_indicators(self, symbol: str, names: List[str]) -> Dict:
+        return {name: self.indicators[symbol][name] for name in names}
+
+
+def align_series(price_data: Dict[str, PriceSeries], symbols: List[str]):
+    """Union of the series' dates and a (dates x symbols) price matrix, NaN where a symbol has no bar"""
+    present = [series for series in (price_data.get(symbol) for symbol in symbols) if series is not None]
+    dates = (
+        np.unique(np.concatenate([series.dates for series in present]))
+        if present else np.array([], dtype="datetime64[D]")
+    )
+    matrix = np.full((len(dates), len(symbols)), np.nan)
+    for column, symbol in enumerate(symbols):
+        series = price_data.get(symbol)
+        if series is not None:
+            matrix[np.searchsorted(dates, series.dates), column] = series.prices
+    return dates, matrix
+
+
+def _append_tail(tail: Optional[PriceSeries], chunk: PriceSeries, size: int) -> PriceSeries:
+    """The last size bars of tail followed by chunk"""
+    if tail is None or len(tail) == 0:
+        return chunk.slice(max(len(chunk) - size, 0), len(chunk))
+    return PriceSeries(
+        np.concatenate([tail.dates, chunk.dates])[-size:],
+        np.concatenate([tail.prices, chunk.prices])[-size:],
+        np.concatenate([tail.volumes, chunk.volumes])[-size:],
+    )
+
+
+def fold_price_chunks(chunks, previous: Optional[FuturesDataset], tail_size: int):
+    """Advance the previous dataset's engines and tails over streamed (symbol, chunk) pairs.
+
+    Returns (tails, engines), or None when a chunk rewrites a bar at or before
+    one already folded in, which needs a replay from the start.
+    """
+    tails = dict(previous.price_data) if previous is not None else {}
+    engines = dict(previous.analytics) if previous is not None else {}
+    copied = set()
+    for symbol, chunk in chunks:
+        tail = tails.get(symbol)
+        if tail is not None and len(tail) and chunk.dates[0] <= tail.dates[-1]:
+            return None
+        if symbol in copied:
+            engines[symbol].extend(chunk)
+        else:
+            # Engines in the previous dataset are still being read, so advance a copy
+            engines[symbol] = extend_analytics(engines.get(symbol, RollingAnalytics()), chunk)
+            copied.add(symbol)
+        tails[symbol] = _append_tail(tail, chunk, tail_size)
+    return tails, engines
+
+
+def _resume_analytics(previous: Optional[FuturesDataset], symbol: str, series: PriceSeries) -> RollingAnalytics:
+    """The previous load's engine advanced over the appended bars, or a full replay if older bars changed"""
+    if previous is not None and symbol in previous.analytics:
+        seen = previous.price_data[symbol]
+        n = len(seen)
+        if (
+            n <= len(series)
+            and np.array_equal(seen.dates, series.dates[:n])
+            and np.array_equal(seen.prices, series.prices[:n])
+        ):
+            engine = previous.analytics[symbol]
+            # Engines are never mutated once built, so an unchanged one is shared as is
+            return engine if n == len(series) else extend_analytics(engine, series, n)
+    return build_analytics(series)
+
 
 class FuturesService:
     def __init__(self):
         # Map our futures symbols to data files or external API symbols
-        self.symbol_mapping = {
-            "ES": "S&P 500 선물",
-            "NQ": "나스닥 100 선물",
-            "YM": "다우존스 선물",
-            "CL": "크루드 오일",
-            "GC": "골드",
-            "ZB": "30년 국채",
-            "ZN": "10년 국채",
-            "ZF": "5년 국채",
-            "6E": "유로",
-            "6J": "일본 엔"
+        self.symbol_mapping = SYMBOL_MAPPING
+        
+        # Attempt to load data from the futures_prices table or the CSV file
+        self.source = settings.FUTURES_SOURCE
+        self.data_path = settings.FUTURES_DATA_PATH
+        self.reload_stats = {
+            "reloads": 0,
+            "failures": 0,
+            "lastDurationMs": None,
+            "totalDurationMs": 0.0,
+            "lastReloadedAt": None,
         }
+        self._reload_lock = threading.Lock()
+        self._dataset = self._load_data()
+        self._seen_version = self._dataset.source_version
+    
+    @property
+    def price_data(self) -> Dict[str, PriceSeries]:
+        return self._dataset.price_data
+    
+    @property
+    def stats(self) -> Dict[str, Dict]:
+        return self._dataset.stats
+    
+    @property
+    def data_version(self):
+        """Source version of the dataset being served, None for mock data"""
+        return self._dataset.source_version
+    
+    def _source_version(self):
+        """Data file mtime, or the table fingerprint in database mode"""
+        if self.source == "db":
+            with SessionLocal() as db:
+                return futures_db.data_version(db)
+        try:
+            return os.path.getmtime(self.data_path)
+        except OSError:
+            return None
+    
+    def _read_dataset(self, previous: Optional[FuturesDataset] = None) -> FuturesDataset:
+        """Read the database, binary cache or CSV into a new dataset, raising on any error"""
+        if self.source == "db":
+            return self._read_db_dataset(previous)
         
-        # Attempt to load data from CSV file
-        self.data_path = "data/all_financial_data.csv"
-        self.price_data = {}
-        self._load_data()
+        version = self._source_version()
+        columns = load_price_columns(self.data_path)
+        price_data = {
+            symbol: columns[korean_name]
+            for symbol, korean_name in self.symbol_mapping.items()
+            if korean_name in columns
+        }
+        if not price_data:
+            raise ValueError(f"No futures columns found in {self.data_path}")
+        return FuturesDataset(price_data, version, previous)
+    
+    def _read_db_dataset(self, previous: Optional[FuturesDataset] = None) -> FuturesDataset:
+        """Fold rows written since the previous load into its engines and tails.
+
+        Only the last FUTURES_DB_TAIL_BARS bars per symbol stay in memory; the
+        full history is streamed through the engines once and later ranges are
+        read from the table. A rewrite of a bar already folded in falls back to
+        streaming the whole table again.
+        """
+        symbols = list(self.symbol_mapping)
+        tail_size = settings.FUTURES_DB_TAIL_BARS
+        with SessionLocal() as db:
+            version = futures_db.data_version(db)
+            if version is None:
+                raise ValueError("No futures rows found in futures_prices")
+            folded = None
+            if previous is not None and previous.source_version is not None:
+                changes = futures_db.iter_price_chunks(db, symbols, updated_after=previous.source_version)
+                folded = fold_price_chunks(changes, previous, tail_size)
+            if folded is None:
+                folded = fold_price_chunks(futures_db.iter_price_chunks(db, symbols), None, tail_size)
+        tails, engines = folded
+        return FuturesDataset(tails, version, analytics=engines)
     
-    def _load_data(self):
+    def _load_data(self) -> FuturesDataset:
         """Load real data if available, otherwise generate mock data"""
         try:
-            if os.path.exists(self.data_path):
-                df = pd.read_csv(self.data_path)
-                df.set_index('Date', inplace=True)
-                
-                # Convert data to our internal format for each symbol
-                for symbol, korean_name in self.symbol_mapping.items():
-                    if korean_name in df.columns:
-                        prices = df[korean_name].dropna()
-                        dates = prices.index.tolist()
-                        
-                        # Create price history with realistic volume
-                        price_history = []
-                        for i, (date_str, price) in enumerate(zip(dates, prices.values)):
-                            price_history.append({
-                                "date": date_str,
-                                "price": price,
-                                "volume": int(np.random.normal(1000000, 300000))  # Random volume
-                            })
-                        
-                        self.price_data[symbol] = price_history
-                print("Loaded real futures data from CSV")
-            else:
-                # Generate mock data if file doesn't exist
-                self._generate_mock_data()
+            if self.source == "db" or os.path.exists(self.data_path):
+                dataset = self._read_dataset()
+                print(f"Loaded real futures data from {'database' if self.source == 'db' else self.data_path}")
+                return dataset
         except Exception as e:
             print(f"Error loading futures data: {e}")
-            self._generate_mock_data()
+        # Generate mock data if the file doesn't exist or can't be read
+        return FuturesDataset(self._generate_mock_data())
+    
+    def reload(self) -> bool:
+        """Rebuild the dataset from disk and swap it in atomically.
+
+        Readers keep using the previous snapshot until the new one is
+        complete; if the rebuild fails the previous snapshot stays live.
+        """
+        with self._reload_lock:
+            started = time.perf_counter()
+            try:
+                dataset = self._read_dataset(self._dataset)
+            except Exception as e:
+                self.reload_stats["failures"] += 1
+                print(f"Error reloading futures data: {e}")
+                return False
+            
+            self._dataset = dataset
+            # Only a successful load counts as seen, so a failed one is retried on the next poll
+            self._seen_version = dataset.source_version
+            duration_ms = (time.perf_counter() - started) * 1000
+            self.reload_stats["reloads"] += 1
+            self.reload_stats["lastDurationMs"] = round(duration_ms, 2)
+            self.reload_stats["totalDurationMs"] = round(self.reload_stats["totalDurationMs"] + duration_ms, 2)
+            self.reload_stats["lastReloadedAt"] = datetime.now().isoformat()
+            print(f"Reloaded futures data in {duration_ms:.1f} ms")
+            return True
+    
+    def reload_if_changed(self) -> bool:
+        """Reload when the data file or table changed since the last successful load"""
+        version = self._source_version()
+        if version is None or version == self._seen_version:
+            return False
+        return self.reload()
     
-    def _generate_mock_data(self):
+    def _generate_mock_data(self) -> Dict[str, PriceSeries]:
         """Generate mock price data for futures"""
         print("Generating mock futures data")
         end_date = datetime.now()
         start_date = end_date - timedelta(days=180)
         
-        # Generate dates
-        date_range = []
-        current_date = start_date
-        while current_date <= end_date:
-            if current_date.weekday() < 5:  # Only weekdays
-                date_range.append(current_date)
-            current_date += timedelta(days=1)
+        # Only weekdays
+        dates = pd.bdate_range(start_date, end_date).to_numpy().astype("datetime64[D]")
         
         # Base prices for different symbols
         base_prices = {
@@ -80,91 +283,143 @@ class FuturesService:
         }
         
         # Generate random walk price data for each symbol
+        price_data = {}
         for symbol, base_price in base_prices.items():
-            price = base_price
-            price_history = []
-            
-            for date in date_range:
-                # Random daily change
-                daily_change_pct = np.random.normal(0, 0.01)  # Mean 0, std 1%
-                price = price * (1 + daily_change_pct)
-                
-                # Add some volume
-                volume = int(np.random.normal(1000000, 300000))
-                
-                price_history.append({
-                    "date": date.strftime("%Y-%m-%d"),
-                    "price": price,
-                    "volume": volume
-                })
-            
-            self.price_data[symbol] = price_history
+            daily_change_pct = np.random.normal(0, 0.01, len(dates))  # Mean 0, std 1%
+            prices = base_price * np.cumprod(1 + daily_change_pct)
+            price_data[symbol] = PriceSeries(dates, prices, mock_volumes(len(dates)))
+        return price_data
     
-    def get_futures_data(self, symbol: str) -> Dict:
-        """Get complete futures data including price history"""
-        if symbol not in self.price_data:
+    def get_futures_data(
+        self,
+        symbol: str,
+        start: Optional[date] = None,
+        end: Optional[date] = None,
+        interval: str = "daily",
+        max_points: Optional[int] = None,
+        db: Optional[Session] = None,
+        indicators: Optional[List[str]] = None,
+    ) -> Dict:
+        """Get complete futures data including price history.
+
+        Stats are precomputed per data load and always describe the full
+        history; start/end, interval and max_points only shape the returned
+        priceHistory. Indicators are cached per data load as well and only
+        the requested ones are returned.
+        """
+        dataset = self._dataset
+        if symbol not in dataset.price_data:
             return None
         
-        price_history = self.price_data[symbol]
-        
-        # Calculate current price and stats from the latest data point
-        latest = price_history[-1]
-        previous = price_history[-2] if len(price_history) > 1 else {"price": latest["price"]}
-        
-        daily_change = latest["price"] - previous["price"]
-        daily_change_percent = (daily_change / previous["price"]) * 100
-        
-        # Calculate volatility (standard deviation of daily returns)
-        prices = [point["price"] for point in price_history]
-        daily_returns = [prices[i]/prices[i-1]-1 for i in range(1, len(prices))]
-        volatility = np.std(daily_returns) * 100 * np.sqrt(252)  # Annualized
-        
-        # Create a complete futures data response
-        return {
-            "currentPrice": latest["price"],
-            "dailyChange": daily_change,
-            "dailyChangePercent": daily_change_percent,
-            "volume": latest["volume"],
-            "openInterest": int(latest["volume"] * 1.5),  # Mock value
-            "volatility": round(volatility, 1),
-            "priceHistory": price_history,
-            # Additional data remains the same as your dummy data
-            "support": self._calculate_support_levels(prices),
-            "resistance": self._calculate_resistance_levels(prices),
-            "sentiment": self._calculate_sentiment(daily_returns),
-            # Rest of the data structure remains the same as in your dummy data
-        }
+        series = dataset.price_data[symbol]
+        if db is not None and not self._in_memory(dataset, symbol, start):
+            # Bars older than the in-memory tail come from the (symbol, timestamp) index
+            series = futures_db.query_price_range(db, symbol, start, end)
+        history = self._build_price_history(series, start, end, interval, max_points)
+        result = {**dataset.stats[symbol], "priceHistory": history}
+        if indicators:
+            result["indicators"] = dataset.select_indicators(symbol, indicators)
+        return result
+    
+    def iter_futures_data(
+        self,
+        symbol: str,
+        start: Optional[date] = None,
+        end: Optional[date] = None,
+        interval: str = "daily",
+        max_points: Optional[int] = None,
+        db: Optional[Session] = None,
+        indicators: Optional[List[str]] = None,
+    ) -> Optional[Iterator[Dict]]:
+        """Streaming form of get_futures_data for NDJSON responses.
+
+        Yields the stats (and indicators) first, then one priceHistory record
+        at a time. Plain daily ranges read from the table come straight off a
+        server-side cursor; anything resampled or downsampled needs the whole
+        range first and is converted in chunks.
+        """
+        dataset = self._dataset
+        if symbol not in dataset.price_data:
+            return None
+
+        header = dict(dataset.stats[symbol])
+        if indicators:
+            header["indicators"] = dataset.select_indicators(symbol, indicators)
+
+        if db is not None and not self._in_memory(dataset, symbol, start):
+            if interval == "daily" and max_points is None:
+                records = futures_db.stream_price_range(db, symbol, start, end)
+            else:
+                series = futures_db.query_price_range(db, symbol, start, end)
+                records = iter_records(self._shape_history(series, start, end, interval, max_points))
+        else:
+            series = dataset.price_data[symbol]
+            records = iter_records(self._shape_history(series, start, end, interval, max_points))
+        return self._stream(header, records)
+
+    def _in_memory(self, dataset: FuturesDataset, symbol: str, start: Optional[date]) -> bool:
+        """Whether the loaded series holds every bar from start on (always true for the CSV)"""
+        if self.source != "db":
+            return True
+        series = dataset.price_data[symbol]
+        if dataset.analytics[symbol].count == len(series):
+            return True  # The whole history fits in the tail
+        return start is not None and len(series) > 0 and np.datetime64(start, "D") >= series.dates[0]
     
-    def _calculate_support_levels(self, prices):
-        """Calculate support levels based on price history"""
-        min_price = min(prices)
-        max_price = max(prices)
-        current = prices[-1]
+    def _stream(self, header: Dict, records: Iterator[Dict]) -> Iterator[Dict]:
+        yield header
+        yield from records
+    
+    def get_futures_batch(
+        self,
+        symbols: Optional[List[str]] = None,
+        history: bool = False,
+        start: Optional[date] = None,
+        end: Optional[date] = None,
+        indicators: Optional[List[str]] = None,
+        db: Optional[Session] = None,
+    ) -> Dict:
+        """Get latest stats for several contracts, optionally with aligned history.
+
+        Stats come from the per-load snapshots; history is a single slice of
+        the aligned price matrix shared by every requested symbol, or one
+        range query when it reaches past the in-memory tail in db mode.
+        """
+        dataset = self._dataset
+        if symbols is None:
+            symbols = dataset.symbols
+        found = [symbol for symbol in symbols if symbol in dataset.columns]
         
-        return [
-            round(current * 0.99, 2),
-            round(current * 0.97, 2),
-            round(current * 0.95, 2)
-        ]
-    
-    def _calculate_resistance_levels(self, prices):
-        """Calculate resistance levels based on price history"""
-        min_price = min(prices)
-        max_price = max(prices)
-        current = prices[-1]
+        result = {
+            "symbols": {
+                symbol: {**dataset.stats[symbol], "indicators": dataset.select_indicators(symbol, indicators)}
+                if indicators else dataset.stats[symbol]
+                for symbol in found
+            },
+            "missing": [symbol for symbol in symbols if symbol not in dataset.columns],
+        }
         
-        return [
-            round(current * 1.01, 2),
-            round(current * 1.03, 2),
-            round(current * 1.05, 2)
-        ]
-    
-    def _calculate_sentiment(self, returns):
-        """Calculate sentiment based on recent returns"""
-        if not returns:
-            return 0
-            
-        # Weight recent returns more heavily
-        weighted_returns = np.array(returns[-10:]) * np.linspace(0.5, 1.0, min(10, len(returns)))
-        sentiment = np.mean(weighted_returns) * 20  # Scale to roughly -1 to 1
-        return max(min(sentiment, 1.0), -1.0)  # Clamp to [-1, 1]
\ No newline at end of file
+        if history:
+            if db is not None and not all(self._in_memory(dataset, symbol, start) for symbol in found):
+                dates, block = align_series(futures_db.load_price_series(db, found, start, end), found)
+            else:
+                lo, hi = date_bounds(dataset.dates, start, end)
+                dates = dataset.dates[lo:hi]
+                block = dataset.matrix[lo:hi, [dataset.columns[symbol] for symbol in found]]
+            values = block.astype(object)
+            values[np.isnan(block)] = None  # Dates a contract didn't trade
+            result["history"] = {
+                "dates": np.datetime_as_string(dates, unit="D").tolist(),
+                "prices": dict(zip(found, values.T.tolist())),
+            }
+        return result
+    
+    def _build_price_history(self, series, start, end, interval, max_points) -> List[Dict]:
+        """Slice, resample and downsample the price history for the chart"""
+        return self._shape_history(series, start, end, interval, max_points).to_records()
+    
+    def _shape_history(self, series, start, end, interval, max_points):
+        history = series.between(start, end)
+        if interval != "daily":
+            history = resample_ohlc(history, interval)
+        return downsample(history, max_points)
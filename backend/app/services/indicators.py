@@ -0,0 +1,108 @@
+import math
+from typing import Dict, List, Optional
+
+import numpy as np
+import pandas as pd
+
+from app.services.price_series import PriceSeries
+
+# Indicators selectable through the indicators= query parameter
+INDICATORS = ("sma", "ema", "rsi", "bollinger", "atr")
+
+SMA_WINDOWS = (20, 50)
+EMA_SPANS = (12, 26)
+RSI_PERIOD = 14
+ATR_PERIOD = 14
+BOLLINGER_WINDOW = 20
+BOLLINGER_WIDTH = 2.0
+PIVOT_RADIUS = 5
+LEVEL_COUNT = 3
+
+
+def _value(x) -> Optional[float]:
+    x = float(x)
+    return None if math.isnan(x) else x
+
+
+def compute_indicators(price_data: Dict[str, PriceSeries]) -> Dict[str, Dict]:
+    """Latest technical indicators for every symbol, each over its own bars.
+
+    Series are right-aligned by bar position (latest bar in the last row,
+    shorter ones NaN-padded at the top) rather than by date, so contracts on
+    different trading calendars never get flat filler bars, and each indicator
+    is still one vectorized pass over all symbols at once. Only closes are
+    stored, so ATR uses the close-to-close true range.
+    """
+    symbols = list(price_data)
+    length = max((len(series) for series in price_data.values()), default=0)
+    if length == 0:
+        return {symbol: {} for symbol in symbols}
+
+    matrix = np.full((length, len(symbols)), np.nan)
+    for column, symbol in enumerate(symbols):
+        prices = price_data[symbol].prices
+        matrix[length - len(prices):, column] = prices
+    frame = pd.DataFrame(matrix, columns=symbols)
+    latest = frame.iloc[-1]
+
+    sma = {w: frame.rolling(w, min_periods=w).mean().iloc[-1] for w in SMA_WINDOWS}
+    ema = {s: frame.ewm(span=s, adjust=False, min_periods=s).mean().iloc[-1] for s in EMA_SPANS}
+
+    delta = frame.diff()
+    avg_gain = delta.clip(lower=0).ewm(alpha=1 / RSI_PERIOD, adjust=False, min_periods=RSI_PERIOD).mean()
+    avg_loss = (-delta.clip(upper=0)).ewm(alpha=1 / RSI_PERIOD, adjust=False, min_periods=RSI_PERIOD).mean()
+    rsi = (100 - 100 / (1 + avg_gain / avg_loss)).iloc[-1]
+
+    window = frame.rolling(BOLLINGER_WINDOW, min_periods=BOLLINGER_WINDOW)
+    middle = window.mean().iloc[-1]
+    width = window.std(ddof=0).iloc[-1] * BOLLINGER_WIDTH
+
+    atr = delta.abs().ewm(alpha=1 / ATR_PERIOD, adjust=False, min_periods=ATR_PERIOD).mean().iloc[-1]
+
+    # A pivot is the extreme of the window centred on it
+    span = 2 * PIVOT_RADIUS + 1
+    pivot_lows = frame.where(frame == frame.rolling(span, center=True, min_periods=span).min())
+    pivot_highs = frame.where(frame == frame.rolling(span, center=True, min_periods=span).max())
+    lows, highs = frame.min(), frame.max()
+
+    results = {}
+    for symbol in symbols:
+        current = float(latest[symbol])
+        results[symbol] = {
+            "sma": {str(w): _value(sma[w][symbol]) for w in SMA_WINDOWS},
+            "ema": {str(s): _value(ema[s][symbol]) for s in EMA_SPANS},
+            "rsi": _value(rsi[symbol]),
+            "bollinger": {
+                "upper": _value(middle[symbol] + width[symbol]),
+                "middle": _value(middle[symbol]),
+                "lower": _value(middle[symbol] - width[symbol]),
+            },
+            "atr": _value(atr[symbol]),
+            "support": _support_levels(pivot_lows[symbol].dropna().to_numpy(), current, float(lows[symbol])),
+            "resistance": _resistance_levels(pivot_highs[symbol].dropna().to_numpy(), current, float(highs[symbol])),
+        }
+    return results
+
+
+def _support_levels(pivots: np.ndarray, current: float, min_price: float) -> List[float]:
+    """Nearest distinct pivot lows below the current price, padded with the range low"""
+    levels = np.unique(np.round(pivots[pivots < current], 2))[::-1].tolist()
+    if min_price < current:
+        levels.append(round(min_price, 2))
+    levels = list(dict.fromkeys(levels))[:LEVEL_COUNT]
+    # Step 2% lower when price sits near the bottom of its range
+    while len(levels) < LEVEL_COUNT:
+        levels.append(round((levels[-1] if levels else current) * 0.98, 2))
+    return levels
+
+
+def _resistance_levels(pivots: np.ndarray, current: float, max_price: float) -> List[float]:
+    """Nearest distinct pivot highs above the current price, padded with the range high"""
+    levels = np.unique(np.round(pivots[pivots > current], 2)).tolist()
+    if max_price > current:
+        levels.append(round(max_price, 2))
+    levels = list(dict.fromkeys(levels))[:LEVEL_COUNT]
+    # Step 2% higher when price sits near the top of its range
+    while len(levels) < LEVEL_COUNT:
+        levels.append(round((levels[-1] if levels else current) * 1.02, 2))
+    return levels
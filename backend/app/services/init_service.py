@@ -1,8 +1,10 @@
 # backend/app/services/init_service.py
+from sqlalchemy import inspect, text
 from sqlalchemy.orm import Session
 from app.db import models
 from app.db.database import engine, SessionLocal
 from app.core.config import settings
+from app.services.news_search import create_sqlite_fts
 import datetime
 
 def init_db():
@@ -11,9 +13,93 @@ def init_db():
     # with engine.connect() as connection:
     #     connection.execute(f"CREATE SCHEMA IF NOT EXISTS {settings.DB_SCHEMA}")
     
+    # Extensions first: the trigram indexes in create_all need pg_trgm's operator classes
+    ensure_extensions()
+    
     # Create tables
     models.Base.metadata.create_all(bind=engine)
     print(f"Database tables created in schema '{settings.DB_SCHEMA}'.")
+    
+    migrate_macro_json_columns()
+    ensure_search_support()
+    ensure_indexes()
+
+# MacroAnalysisState payloads that used to be TEXT holding JSON strings
+MACRO_JSON_COLUMNS = [
+    "economic_indicator_values",
+    "news_items",
+    "economic_raw_data",
+    "economic_analysis",
+    "extracted_contents",
+    "summarized_contents",
+    "filtered_summarized_contents",
+    "final_analysis_results",
+]
+
+def migrate_macro_json_columns():
+    """Convert legacy TEXT JSON columns on macro_analysis_states to JSONB (PostgreSQL only)"""
+    if engine.dialect.name != "postgresql":
+        return
+    
+    table = models.MacroAnalysisState.__table__
+    columns = {
+        c["name"]: c["type"]
+        for c in inspect(engine).get_columns(table.name, schema=table.schema)
+    }
+    pending = [name for name in MACRO_JSON_COLUMNS if type(columns.get(name)).__name__ == "TEXT"]
+    if not pending:
+        return
+    
+    with engine.begin() as connection:
+        # Python's json.dumps can emit NaN/Infinity, which jsonb rejects; anything
+        # still unparseable is kept as a JSON string rather than dropped
+        connection.execute(text(f"""
+            CREATE OR REPLACE FUNCTION {settings.DB_SCHEMA}.text_to_jsonb(value text) RETURNS jsonb AS $$
+            BEGIN
+                RETURN value::jsonb;
+            EXCEPTION WHEN others THEN
+                BEGIN
+                    RETURN regexp_replace(value, '-?\\m(NaN|Infinity)\\M', 'null', 'g')::jsonb;
+                EXCEPTION WHEN others THEN
+                    RETURN to_jsonb(value);
+                END;
+            END;
+            $$ LANGUAGE plpgsql IMMUTABLE
+        """))
+        for name in pending:
+            connection.execute(text(
+                f"ALTER TABLE {table.schema}.{table.name} ALTER COLUMN {name} TYPE jsonb "
+                f"USING {settings.DB_SCHEMA}.text_to_jsonb(NULLIF({name}, ''))"
+            ))
+    print(f"Converted macro_analysis_states columns to JSONB: {', '.join(pending)}")
+
+def ensure_extensions():
+    """Create the PostgreSQL extensions models.py depends on"""
+    if engine.dialect.name != "postgresql":
+        return
+    with engine.begin() as connection:
+        # Needed by the Korean news trigram indexes
+        connection.execute(text("CREATE EXTENSION IF NOT EXISTS pg_trgm"))
+
+def ensure_search_support():
+    """Prepare news full-text search on SQLite, which indexes through FTS5 tables"""
+    if engine.dialect.name != "sqlite":
+        return
+    try:
+        with engine.begin() as connection:
+            create_sqlite_fts(connection)
+    except Exception as e:
+        print(f"Could not set up news search: {e}")
+
+def ensure_indexes():
+    """Create indexes declared in models.py that create_all skips on existing tables"""
+    for table in models.Base.metadata.sorted_tables:
+        for index in table.indexes:
+            try:
+                index.create(bind=engine, checkfirst=True)
+            except Exception as e:
+                # e.g. no privileges on tables owned by another service (agii)
+                print(f"Could not create index {index.name}: {e}")
 
 def get_or_create_default_data():
     """Add some default data if tables are empty"""
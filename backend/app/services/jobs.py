@@ -0,0 +1,81 @@
+import importlib.util
+import logging
+from datetime import datetime
+from functools import partial
+from typing import List
+
+from sqlalchemy.ext.asyncio import async_sessionmaker
+
+from app.core.config import settings
+from app.core.scheduler import Scheduler
+from app.db.database import AsyncSessionLocal, SessionLocal
+from app.services.futures_db import frame_to_rows, upsert_futures_prices
+from app.services.futures_service import SYMBOL_MAPPING, FuturesService
+from app.services.macro_service import MacroService
+from app.services.market_data import MarketDataFetcher, YFinanceSource
+
+logger = logging.getLogger(__name__)
+
+# Started and stopped by the app lifespan; GET /api/system/jobs reports on it
+scheduler = Scheduler()
+
+
+def refresh_market_data(futures_service: FuturesService):
+    """What `python fetch_data.py` does, followed by an immediate dataset reload"""
+    fetcher = MarketDataFetcher(YFinanceSource(), settings.FUTURES_DATA_PATH)
+    fetcher.run()
+    if settings.FUTURES_SOURCE == "db":
+        rows = frame_to_rows(fetcher.last_fetched, SYMBOL_MAPPING)
+        with SessionLocal() as db:
+            upsert_futures_prices(db, rows)
+    # Stats and indicators are computed while the new dataset is built,
+    # here rather than on the next request
+    futures_service.reload_if_changed()
+
+
+async def latest_macro_days(macro_service: MacroService, sessions: async_sessionmaker) -> List[str]:
+    """The day the dashboard opens on, plus today if different"""
+    async with sessions() as db:
+        dates = await macro_service.get_available_dates_async(db)
+    today = datetime.now().strftime("%Y-%m-%d")
+    days = dates["dates"][:1]
+    return days + [today] if today not in days else days
+
+
+async def precompute_macro(macro_service: MacroService, sessions: async_sessionmaker):
+    """Build the indicator and dashboard snapshots for the latest days"""
+    for day in await latest_macro_days(macro_service, sessions):
+        day, dates, version = await macro_service.dashboard_version_async(sessions, day)
+        await macro_service.get_dashboard_async(sessions, day, dates, version)
+
+
+def register_reload_job(futures_service: FuturesService):
+    """Add the futures hot reload, which runs whether or not SCHEDULER_ENABLED is set"""
+    if settings.FUTURES_RELOAD_INTERVAL_SECONDS > 0:
+        # Picks up data files or tables refreshed outside this process
+        scheduler.add(
+            "futures-reload",
+            futures_service.reload_if_changed,
+            every=settings.FUTURES_RELOAD_INTERVAL_SECONDS,
+        )
+
+
+def register_jobs(futures_service: FuturesService, macro_service: MacroService):
+    """Add the market data refresh and macro precompute jobs to the app scheduler"""
+    if importlib.util.find_spec("yfinance") is None:
+        # Every run would fail on the import in YFinanceSource
+        logger.warning("Skipping market-data-refresh: the yfinance package is not installed")
+    else:
+        scheduler.add(
+            "market-data-refresh",
+            partial(refresh_market_data, futures_service),
+            cron=settings.MARKET_REFRESH_CRON,
+            jitter=60,
+        )
+    scheduler.add(
+        "macro-precompute",
+        partial(precompute_macro, macro_service, AsyncSessionLocal),
+        every=settings.MACRO_PRECOMPUTE_INTERVAL_SECONDS,
+        jitter=5,
+        run_at_start=True,
+    )
@@ -1,197 +1,394 @@
 from datetime import date, datetime, timedelta
+import asyncio
+import base64
+import binascii
 import json
-from typing import List, Optional, Dict
+import logging
+from typing import AsyncIterator, Dict, List, Optional, Sequence, Tuple
 import random
-from sqlalchemy.orm import Session
-from sqlalchemy.sql.expression import extract
-from app.db.database import get_db
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+from sqlalchemy.orm import defer, undefer_group
+from app.core.cache import CommitInvalidation, LRUCache, MISSING
+from app.core.config import settings
 from app.db.models import KoreanNews, MacroAnalysisState, News
-from sqlalchemy import func
+from app.services.news_search import parse_news_tag
+from sqlalchemy import func, tuple_
 from urllib.parse import quote
 from calendar import monthrange
 
+logger = logging.getLogger(__name__)
+
+
+# Indicator names in economic_indicator_values -> frontend display names
+INDICATOR_MAPPING = {
+    "ISM_Manufacturing_PMI": "ismPMI",
+    "ADP_Nonfarm_Employment_Change": "adpNonfarm",
+    "Nonfarm_Payrolls": "nonfarmPayrolls",
+    "Unemployment_Rate": "unemploymentRate",
+    "CPI_(YoY)": "cpi",
+    "Core_CPI": "coreCPI",
+    "GDP": "gdp"
+}
+
+def _deferred_groups(model) -> Dict[str, List[str]]:
+    groups = {}
+    for prop in model.__mapper__.column_attrs:
+        if prop.deferred:
+            groups.setdefault(prop.group, []).append(prop.key)
+    return groups
+
+
+# Deferred column groups on MacroAnalysisState (see models.py), by attribute name
+STATE_GROUPS = _deferred_groups(MacroAnalysisState)
+
+# Groups read by the indicators endpoint when it has to load whole documents
+INDICATOR_GROUPS = ("indicators", "analysis")
+
+# Sections of final_analysis_results used in each indicator's description
+ANALYSIS_SECTIONS = ("interest_rate_final", "stock_market_final")
+
+# Basic descriptions for each indicator (fallback if analysis data is not available)
+BASE_DESCRIPTION_MAPPING = {
+    "ismPMI": "Manufacturing activity index, values above 50 indicate expansion.",
+    "adpNonfarm": "Private sector employment change report by ADP.",
+    "nonfarmPayrolls": "Total number of paid U.S. workers, excluding farm workers and some other categories.",
+    "unemploymentRate": "Percentage of the total labor force that is unemployed but actively seeking employment.",
+    "cpi": "Consumer prices year-over-year change, measuring inflation.",
+    "coreCPI": "Core inflation, excluding food and energy, year-over-year.",
+    "gdp": "Gross Domestic Product growth rate, annualized."
+}
+
+def month_range(year: int, month: int):
+    """Half-open [first day, first day of next month) bounds, so indexes stay usable"""
+    start = datetime(year, month, 1)
+    end = datetime(year + 1, 1, 1) if month == 12 else datetime(year, month + 1, 1)
+    return start, end
+
+
+def day_range(day: datetime):
+    """Half-open [midnight, next midnight) bounds for one calendar day"""
+    start = datetime(day.year, day.month, day.day)
+    return start, start + timedelta(days=1)
+
+
+# Rows per server-side cursor fetch when streaming news
+NEWS_STREAM_BATCH = 500
+
+
+# Every live MacroService, invalidated when a commit changes MacroAnalysisState
+macro_state_changes = CommitInvalidation(MacroAnalysisState, "macro_state_changed")
+
 
-# Temporary dummy data - replace with database queries later
 class MacroService:
     def __init__(self):
-        # Generate some sample dates for the last 30 days
-        today = datetime.now()
-        self.available_dates = [(today - timedelta(days=i)).strftime("%Y-%m-%d") for i in range(90)]
-        self.available_months = list(set([d[:7] for d in self.available_dates]))
+        # Parsed indicator payloads keyed on (MacroAnalysisState.id, updated_at)
+        self._state_cache = LRUCache(maxsize=settings.MACRO_CACHE_SIZE)
+        # Dates list and month -> state lookups; the TTL covers writers in other processes
+        self._lookup_cache = LRUCache(maxsize=settings.MACRO_CACHE_SIZE, ttl=settings.MACRO_CACHE_TTL_SECONDS)
+        # Assembled dashboard payloads keyed on their dashboard_version key
+        self._dashboard_cache = LRUCache(maxsize=settings.MACRO_CACHE_SIZE)
+        macro_state_changes.register(self)
+    
+    def invalidate(self):
+        """Drop cached lookups and payloads after MacroAnalysisState changes"""
+        self._lookup_cache.clear()
+        self._state_cache.clear()
+        self._dashboard_cache.clear()
     
-    def get_available_dates(self, db: Session = None) -> Dict:
+    # Queries run on an AsyncSession. Each select() is built by a *_statement
+    # helper, so it can be inspected and tested without a database round trip.
+    
+    async def get_available_dates_async(self, db: AsyncSession) -> Dict:
         """Return all dates within months that exist in MacroAnalysisState.year_month_date"""
-        if db is None:
-            db = next(get_db())
+        cached = self._lookup_cache.get("dates")
+        if cached is not MISSING:
+            return cached
 
         try:
-            # Step 1: Get distinct year-month values from the DB
-            results = db.query(MacroAnalysisState.year_month_date).distinct().all()
-            raw_dates = [r[0] for r in results if r[0]]
+            results = (await db.execute(self._dates_statement())).all()
+        except Exception as e:
+            return self._dates_error(e)
+        return self._build_dates(results)
+    
+    def _dates_statement(self):
+        # Step 1: Get distinct year-month values from the DB
+        return select(MacroAnalysisState.year_month_date).distinct()
+    
+    def _build_dates(self, results) -> Dict:
+        raw_dates = [r[0] for r in results if r[0]]
 
-            # Step 2: Normalize to year-month (e.g., '2025-03')
-            unique_months = set(dt.strftime("%Y-%m") for dt in raw_dates)
+        # Step 2: Normalize to year-month (e.g., '2025-03')
+        unique_months = set(dt.strftime("%Y-%m") for dt in raw_dates)
 
-            all_dates = []
-            month_labels = []
+        all_dates = []
+        month_labels = []
 
-            for ym in unique_months:
-                year, month = map(int, ym.split("-"))
-                _, last_day = monthrange(year, month)  # get number of days in the month
+        for ym in unique_months:
+            year, month = map(int, ym.split("-"))
+            _, last_day = monthrange(year, month)  # get number of days in the month
 
-                # Add all dates in this month
-                for day in range(1, last_day + 1):
-                    date_str = f"{year}-{str(month).zfill(2)}-{str(day).zfill(2)}"
-                    all_dates.append(date_str)
+            # Add all dates in this month
+            for day in range(1, last_day + 1):
+                date_str = f"{year}-{str(month).zfill(2)}-{str(day).zfill(2)}"
+                all_dates.append(date_str)
 
-                # Add to month label for dropdown
-                dt = datetime(year, month, 1)
-                month_labels.append(dt.strftime("%B %Y"))
+            # Add to month label for dropdown
+            dt = datetime(year, month, 1)
+            month_labels.append(dt.strftime("%B %Y"))
 
-            return {
-                "dates": sorted(all_dates, reverse=True),
-                "months": sorted(month_labels, reverse=True)
-            }
+        result = {
+            "dates": sorted(all_dates, reverse=True),
+            "months": sorted(month_labels, reverse=True)
+        }
+        self._lookup_cache.set("dates", result)
+        return result
+    
+    def _dates_error(self, e: Exception) -> Dict:
+        print(f"Error retrieving available dates: {e}")
+        return {
+            "dates": [],
+            "months": [],
+            "error": "Unable to retrieve available dates"
+        }
+    
+    def _parse_month(self, month: Optional[str]):
+        """Resolve the month parameter to (year, month number, "Month Year" label)"""
+        year = datetime.now().year
+        
+        # Case 1: Month provided as a numeric value (1-12)
+        if month and month.isdigit():
+            month_num = int(month)
+            # Create a datetime object with year and month to get the month name
+            month_date = datetime(year, month_num, 1)
+            return year, month_num, month_date.strftime("%B %Y")
+        
+        # Case 2: Month provided as "Month Year" format
+        if month:
+            try:
+                month_date = datetime.strptime(month, "%B %Y")
+                return month_date.year, month_date.month, month
+            except ValueError:
+                # Handle invalid format
+                pass
+        
+        # Case 3: No month provided (or invalid), use current month
+        month_date = datetime.now()
+        return month_date.year, month_date.month, month_date.strftime("%B %Y")
+    
+    async def _resolve_state_async(self, db: AsyncSession, year: int, month_num: int):
+        """(id, last modified) of the latest MacroAnalysisState row in a month, or None"""
+        key = ("state", year, month_num)
+        cached = self._lookup_cache.get(key)
+        if cached is not MISSING:
+            return cached
+        
+        result = (await db.execute(self._state_statement(year, month_num))).first()
+        return self._cache_state(key, result)
+    
+    def _state_statement(self, year: int, month_num: int):
+        month_start, month_end = month_range(year, month_num)
+        return select(
+            MacroAnalysisState.id,
+            # updated_at is only set by updates, so new rows fall back to created_at
+            func.coalesce(MacroAnalysisState.updated_at, MacroAnalysisState.created_at)
+        ).where(
+            MacroAnalysisState.year_month_date >= month_start,
+            MacroAnalysisState.year_month_date < month_end,
+        ).order_by(MacroAnalysisState.year_month_date.desc()).limit(1)
+    
+    def _cache_state(self, key, result):
+        state = (result[0], result[1]) if result else None
+        self._lookup_cache.set(key, state)
+        return state
+    
+    # Versions identify what a response would be built from without building it,
+    # so routes can answer conditional requests with a 304 up front. Each is a
+    # (key, last modified) pair, or None when the lookup itself failed.
+    
+    async def indicators_version_async(self, db: AsyncSession, month: Optional[str] = None) -> Optional[Tuple]:
+        """Version of get_economic_indicators_async(month): the resolved state row"""
+        try:
+            year, month_num, month_str = self._parse_month(month)
+            state = await self._resolve_state_async(db, year, month_num)
+        except Exception as e:
+            print(f"Error resolving economic indicators version: {e}")
+            return None
+        return self._indicators_version(month, month_str, state)
+    
+    def _indicators_version(self, month: Optional[str], month_str: str, state) -> Tuple:
+        if state is None:
+            # The empty response echoes the month parameter back
+            return (month_str, month), None
+        return (month_str, state[0], state[1]), state[1]
+    
+    async def news_version_async(self, db: AsyncSession, date_str: Optional[str] = None) -> Optional[Tuple]:
+        """Version of get_macro_news_async(date_str): row count and newest updated_at for the day.
 
+        Raises ValueError for a malformed date, like get_macro_news_async.
+        """
+        day, stmt = self._news_version_request(date_str)
+        try:
+            row = (await db.execute(stmt)).one()
         except Exception as e:
-            print(f"Error retrieving available dates: {e}")
-            return {
-                "dates": [],
-                "months": [],
-                "error": "Unable to retrieve available dates"
-            }
-    
-    def get_economic_indicators(self, month: Optional[str] = None, db: Session = None) -> Dict:
+            print(f"Error resolving macro news version: {e}")
+            return None
+        return self._news_version(day, row)
+    
+    def _news_version_request(self, date_str: Optional[str]):
+        day_start, day_end = day_range(self._news_day(date_str))
+        stmt = self._news_join(
+            select(func.count(), func.max(News.updated_at), func.max(KoreanNews.updated_at)).select_from(News),
+            day_start,
+            day_end
+        )
+        return day_start.date(), stmt
+    
+    def _news_version(self, day: date, row) -> Tuple:
+        count, news_updated, korean_updated = row
+        # The count catches deletions, which leave the max timestamps alone
+        updated = [ts for ts in (news_updated, korean_updated) if ts is not None]
+        last_modified = max(updated) if updated else None
+        return (day, count, news_updated, korean_updated), last_modified
+    
+    async def get_economic_indicators_async(self, db: AsyncSession, month: Optional[str] = None) -> Dict:
         """Get economic indicators data for a specific month"""
-        # Get the database session
-        if db is None:
-            db = next(get_db())
-        
         try:
-            # Handle different month parameter formats
-            year = datetime.now().year
-            month_num = None
-            month_str = None
-            
-            # Case 1: Month provided as a numeric value (1-12)
-            if month and month.isdigit():
-                month_num = int(month)
-                # Create a datetime object with year and month to get the month name
-                month_date = datetime(year, month_num, 1)
-                month_str = month_date.strftime("%B %Y")
-            
-            # Case 2: Month provided as "Month Year" format
-            elif month:
-                try:
-                    month_date = datetime.strptime(month, "%B %Y")
-                    year = month_date.year
-                    month_num = month_date.month
-                    month_str = month
-                except ValueError:
-                    # Handle invalid format
-                    month_date = datetime.now()
-                    year = month_date.year
-                    month_num = month_date.month
-                    month_str = month_date.strftime("%B %Y")
-            
-            # Case 3: No month provided, use current month
-            else:
-                month_date = datetime.now()
-                year = month_date.year
-                month_num = month_date.month
-                month_str = month_date.strftime("%B %Y")
-            
-            # Query using extract for proper date filtering and include final_analysis_results
-            result = db.query(
-                MacroAnalysisState.id,
-                MacroAnalysisState.year_month_date,
-                MacroAnalysisState.economic_indicator_values,
-                MacroAnalysisState.final_analysis_results
-            ).filter(
-                extract('year', MacroAnalysisState.year_month_date) == year,
-                extract('month', MacroAnalysisState.year_month_date) == month_num,
-            ).order_by(MacroAnalysisState.year_month_date.desc()).first()
-            
-            # Default response if no data found
-            if not result:
-                return {
-                    "month": month,
-                    "indicators": {}
-                }
+            year, month_num, month_str = self._parse_month(month)
             
-            # Parse the economic indicator values from JSON field
-            # When using query with specific columns, the result is a tuple
-            economic_indicator_values = result[2]  # Index 2 corresponds to economic_indicator_values
-            final_analysis_results = result[3]  # Index 3 corresponds to final_analysis_results
-            
-            # Handle None values
-            if not economic_indicator_values:
+            state = await self._resolve_state_async(db, year, month_num)
+            if state is None:
                 return {
                     "month": month,
                     "indicators": {}
                 }
-                
-            # Parse economic indicator values
-            if isinstance(economic_indicator_values, dict):
-                indicator_data = economic_indicator_values
-            else:
-                try:
-                    indicator_data = json.loads(economic_indicator_values)
-                except (json.JSONDecodeError, TypeError):
-                    print(f"Error parsing JSON economic_indicator_values: {economic_indicator_values}")
-                    return {
-                        "month": month,
-                        "indicators": {},
-                        "error": "Unable to parse economic indicators data"
-                    }
             
-            # Parse final analysis results
-            analysis_data = {}
-            if final_analysis_results:
-                if isinstance(final_analysis_results, dict):
-                    analysis_data = final_analysis_results
-                else:
-                    try:
-                        analysis_data = json.loads(final_analysis_results)
-                    except (json.JSONDecodeError, TypeError):
-                        print(f"Error parsing JSON final_analysis_results: {final_analysis_results}")
-                        # Continue without analysis data
-                        pass
+            processed_indicators = self._state_cache.get(state)
+            if processed_indicators is MISSING:
+                processed_indicators = await self._load_indicators_async(db, state[0])
+                if processed_indicators is None:
+                    return self._indicators_error(month, "Unable to parse economic indicators data")
+                self._state_cache.set(state, processed_indicators)
                 
         except Exception as e:
-            # Log the error for debugging
             print(f"Error retrieving economic indicators: {e}")
-            return {
-                "month": month,
-                "indicators": {},
-                "error": "Unable to retrieve economic indicators data"
-            }
+            return self._indicators_error(month, "Unable to retrieve economic indicators data")
         
-        # Map indicator names from database to frontend display names
-        indicator_mapping = {
-            "ISM_Manufacturing_PMI": "ismPMI",
-            "ADP_Nonfarm_Employment_Change": "adpNonfarm",
-            "Nonfarm_Payrolls": "nonfarmPayrolls",
-            "Unemployment_Rate": "unemploymentRate",
-            "CPI_(YoY)": "cpi",
-            "Core_CPI": "coreCPI",
-            "GDP": "gdp"
+        return {
+            "month": month_str,
+            "indicators": processed_indicators
         }
-        
-        # Basic descriptions for each indicator (fallback if analysis data is not available)
-        base_description_mapping = {
-            "ismPMI": "Manufacturing activity index, values above 50 indicate expansion.",
-            "adpNonfarm": "Private sector employment change report by ADP.",
-            "nonfarmPayrolls": "Total number of paid U.S. workers, excluding farm workers and some other categories.",
-            "unemploymentRate": "Percentage of the total labor force that is unemployed but actively seeking employment.",
-            "cpi": "Consumer prices year-over-year change, measuring inflation.",
-            "coreCPI": "Core inflation, excluding food and energy, year-over-year.",
-            "gdp": "Gross Domestic Product growth rate, annualized."
+    
+    def _indicators_error(self, month: Optional[str], message: str) -> Dict:
+        return {
+            "month": month,
+            "indicators": {},
+            "error": message
         }
+    
+    async def _load_indicators_async(self, db: AsyncSession, state_id: int) -> Optional[Dict]:
+        """Read one state's indicators and their analysis, None if unparseable.
+
+        Only the mapped indicator keys (and the two analysis sections used
+        per indicator) are extracted server-side with JSON operators, so the
+        rest of the payloads never leave the database.
+        """
+        result = (await db.execute(self._indicators_statement(state_id))).first()
+        if result is None:
+            return {}
         
-        # Process the indicators
+        parsed = self._parse_indicator_row(result)
+        if parsed is None:
+            # Rows written as JSON-encoded strings predate the JSONB migration
+            return await self._load_legacy_indicators_async(db, state_id)
+        return self._process_indicators(*parsed)
+    
+    def _indicators_statement(self, state_id: int):
+        values = MacroAnalysisState.economic_indicator_values
+        analysis = MacroAnalysisState.final_analysis_results
+        columns = [values[db_name] for db_name in INDICATOR_MAPPING]
+        for db_name in INDICATOR_MAPPING:
+            columns += [analysis[(db_name, section)] for section in ANALYSIS_SECTIONS]
+        return select(*columns).where(MacroAnalysisState.id == state_id)
+    
+    def _parse_indicator_row(self, result):
+        """(indicator_data, analysis_data) from the extracted keys, None if nothing was found"""
+        names = list(INDICATOR_MAPPING)
+        indicator_data = {name: value for name, value in zip(names, result[:len(names)]) if value is not None}
+        if not indicator_data:
+            return None
+        
+        analysis_data = {}
+        sections = iter(result[len(names):])
+        for name in names:
+            found = {section: next(sections) for section in ANALYSIS_SECTIONS}
+            found = {section: text for section, text in found.items() if text is not None}
+            if found:
+                analysis_data[name] = found
+        
+        return indicator_data, analysis_data
+    
+    async def load_state_async(self, db: AsyncSession, state_id: int, groups: Sequence[str] = ()) -> Optional[MacroAnalysisState]:
+        """Load one MacroAnalysisState with only the named deferred column groups.
+
+        Columns in other groups raise on access instead of quietly issuing
+        one more query each, so every caller has to list what it reads.
+        """
+        return (await db.execute(self._state_entity_statement(state_id, groups))).scalars().first()
+    
+    def _state_entity_statement(self, state_id: int, groups: Sequence[str]):
+        unknown = set(groups) - set(STATE_GROUPS)
+        if unknown:
+            raise ValueError(f"Unknown MacroAnalysisState groups: {', '.join(sorted(unknown))}")
+        
+        options = [undefer_group(group) for group in groups]
+        for group, keys in STATE_GROUPS.items():
+            if group not in groups:
+                options += [defer(getattr(MacroAnalysisState, key), raiseload=True) for key in keys]
+        
+        return select(MacroAnalysisState).options(*options).where(MacroAnalysisState.id == state_id)
+    
+    async def _load_legacy_indicators_async(self, db: AsyncSession, state_id: int) -> Optional[Dict]:
+        """Parse whole indicator and analysis documents stored as JSON strings"""
+        return self._parse_legacy_state(await self.load_state_async(db, state_id, INDICATOR_GROUPS))
+    
+    def _parse_legacy_state(self, result: Optional[MacroAnalysisState]) -> Optional[Dict]:
+        economic_indicator_values = result.economic_indicator_values if result else None
+        final_analysis_results = result.final_analysis_results if result else None
+        
+        # Handle None values
+        if not economic_indicator_values:
+            return {}
+            
+        # Parse economic indicator values
+        if isinstance(economic_indicator_values, dict):
+            indicator_data = economic_indicator_values
+        else:
+            try:
+                indicator_data = json.loads(economic_indicator_values)
+            except (json.JSONDecodeError, TypeError):
+                print(f"Error parsing JSON economic_indicator_values: {economic_indicator_values}")
+                return None
+        
+        # Parse final analysis results
+        analysis_data = {}
+        if final_analysis_results:
+            if isinstance(final_analysis_results, dict):
+                analysis_data = final_analysis_results
+            else:
+                try:
+                    analysis_data = json.loads(final_analysis_results)
+                except (json.JSONDecodeError, TypeError):
+                    print(f"Error parsing JSON final_analysis_results: {final_analysis_results}")
+                    # Continue without analysis data
+                    pass
+        
+        return self._process_indicators(indicator_data, analysis_data)
+    
+    def _process_indicators(self, indicator_data: Dict, analysis_data: Dict) -> Dict:
+        """Map raw indicator values and analysis text to the frontend structure"""
         processed_indicators = {}
-        for db_name, front_name in indicator_mapping.items():
+        for db_name, front_name in INDICATOR_MAPPING.items():
             if db_name in indicator_data:
                 indicator_info = indicator_data[db_name]
 
@@ -199,7 +396,7 @@ class MacroService:
                     continue
                 
                 # Get the basic description
-                base_description = base_description_mapping.get(front_name, "")
+                base_description = BASE_DESCRIPTION_MAPPING.get(front_name, "")
                 
                 # Extract detailed analysis if available
                 detailed_description = ""
@@ -242,10 +439,7 @@ class MacroService:
                     "description": final_description
                 }
         
-        return {
-            "month": month_str,
-            "indicators": processed_indicators
-        }
+        return processed_indicators
     
     def get_daily_analysis(self, date_str: Optional[str] = None) -> Dict:
         """Get daily market analysis for a specific date"""
@@ -276,111 +470,226 @@ class MacroService:
             ]
         }
     
-    def get_macro_news(self, date_str: Optional[str] = None, db: Session = None) -> Dict:
-        """Get macro-related news for a specific date, only including items that have Korean translations"""
+    async def get_macro_news_async(
+        self,
+        db: AsyncSession,
+        date_str: Optional[str] = None,
+        limit: Optional[int] = None,
+        after: Optional[str] = None,
+    ) -> Dict:
+        """Get macro-related news for a specific date, only including items that have Korean translations.
+
+        English and Korean rows come back from one inner join, newest first.
+        With a limit, pages are keyed on (date, id) so each page is an index
+        range scan instead of an OFFSET; pass the returned next_cursor as after.
+        """
+        filter_date, stmt = self._news_request(date_str, limit, after)
+        try:
+            rows = (await db.execute(stmt)).all()
+        except Exception as e:
+            print(f"Error retrieving macro news with error:{e}")
+            # Still an empty page for the frontend, but marked so it is never cached
+            return {**self._news_page(filter_date, [], limit), "error": "Unable to retrieve macro news"}
+        return self._news_page(filter_date, rows, limit)
+
+    def iter_macro_news_async(
+        self,
+        db: AsyncSession,
+        date_str: Optional[str] = None,
+        limit: Optional[int] = None,
+        after: Optional[str] = None,
+    ) -> AsyncIterator[Dict]:
+        """Streaming form of get_macro_news_async for NDJSON responses.
+
+        Yields a {"date"} header, then one item per row read through a
+        server-side cursor, then {"next_cursor"} if another page exists.
+        A query that fails mid-stream ends it with an {"error"} line.
+        """
+        filter_date, stmt = self._news_request(date_str, limit, after)
+        return self._stream_news_async(db, stmt, filter_date.date(), limit)
+
+    async def _stream_news_async(self, db: AsyncSession, stmt, day: date, limit: Optional[int]) -> AsyncIterator[Dict]:
+        yield {"date": day}
+        sent = 0
+        last = None
+        try:
+            result = await db.stream(stmt.execution_options(yield_per=NEWS_STREAM_BATCH))
+            async for item in result:
+                if limit is not None and sent == limit:
+                    yield {"next_cursor": encode_news_cursor(last.date, last.id)}
+                    break
+                yield format_news_item(item)
+                last = item
+                sent += 1
+        except Exception:
+            # Headers are already sent, so end with a line the client can tell
+            # apart from a complete stream (which ends on an item or next_cursor)
+            logger.exception("Error streaming macro news for %s", day)
+            yield {"error": "Unable to retrieve macro news"}
+
+    def _news_request(self, date_str: Optional[str], limit: Optional[int], after: Optional[str]):
+        """(day, statement) for a news request; raises ValueError for a bad date or cursor"""
+        filter_date = self._news_day(date_str)
+        # Half-open [day, next day) range for filtering
+        day_start, day_end = day_range(filter_date)
+
+        # Decode before querying so a bad token surfaces to the caller
+        cursor = decode_news_cursor(after) if after else None
+
+        stmt = self._news_statement(day_start, day_end, cursor)
+        if limit is not None:
+            # One extra row tells us whether another page exists
+            stmt = stmt.limit(limit + 1)
+        return filter_date, stmt
+
+    def _news_day(self, date_str: Optional[str]) -> datetime:
         # If no date provided, use today's date
         if not date_str:
             date_str = datetime.now().strftime("%Y-%m-%d")
-
-        if db is None:
-            db = next(get_db())
-        
-        news_items = []
-        try:
-            # Convert date_str to datetime for filtering
-            filter_date = datetime.strptime(date_str, "%Y-%m-%d")
-            
-            # First, query the Korean news table to get all available IDs for the date
-            # This ensures we only get news that have Korean translations
-            korean_news_ids = db.query(
-                KoreanNews.id
-            ).filter(
-                func.date(KoreanNews.date) == filter_date.date()
-            ).all()
-            
-            # Extract just the IDs from the query result
-            korean_ids = [item.id for item in korean_news_ids]
-            
-            # If no Korean translations are available for this date, return empty list
-            if not korean_ids:
-                return {
-                    "date": filter_date.date(),
-                    "news": []
-                }
-            
-            # Query English news that match the Korean IDs
-            english_news = db.query(
+        return datetime.strptime(date_str, "%Y-%m-%d")
+    
+    def _news_statement(self, day_start: datetime, day_end: datetime, cursor=None):
+        """Translated news for one day, newest first, optionally after a (date, id) cursor"""
+        stmt = self._news_join(
+            select(
                 News.id,
                 News.date,
                 News.category,
                 News.headline,
                 News.url,
-                News.body
-            ).filter(
-                News.id.in_(korean_ids),
-                func.date(News.date) == filter_date.date()
-            ).order_by(News.date.desc()).all()
-            
-            # Now get the full Korean news data for these IDs
-            korean_news = db.query(
-                KoreanNews.id,
-                KoreanNews.headline,
-                KoreanNews.body
-            ).filter(
-                KoreanNews.id.in_(korean_ids)
-            ).all()
-            
-            # Convert Korean news to a dictionary for easier lookup
-            korean_dict = {item.id: {"headline": item.headline, "body": item.body} for item in korean_news}
-            
-            now = datetime.now()
-            
-            # Process the results and format dates
-            for item in english_news:
-                news_date = item.date
-                time_diff = now - news_date
-                
-                # Format the date string based on how old it is
-                if time_diff.days == 0:  # Today
-                    if time_diff.seconds < 3600:  # Less than an hour
-                        minutes = time_diff.seconds // 60
-                        date_formatted = f"{minutes} min ago"
-                    else:  # Hours ago
-                        hours = time_diff.seconds // 3600
-                        date_formatted = f"{hours} hours ago"
-                else:  # Days ago
-                    date_formatted = f"{time_diff.days} days ago"
-                
-                # Only include news items that have Korean translations
-                if item.id in korean_dict:
-                    if isinstance(item.category, str):
-                        try:
-                            category_list = json.loads(item.category)  # Parse the stringified list
-                        except json.JSONDecodeError:
-                            category_list = [item.category]  # Fallback to treat it as a single string
-                    else:
-                        category_list = item.category if isinstance(item.category, (list, tuple)) else [item.category]
-                    category_fixed = category_list[0] if category_list else "Uncategorized"
-
-                    # Create a dictionary with both English and Korean content
-                    news_items.append({
-                        "id": item.id,
-                        "title": item.headline,
-                        "date": date_formatted,
-                        "tag": category_fixed,
-                        "url": item.url if item.url and item.url != 'NaN' else f"https://www.google.com/search?q={quote(item.headline)}",
-                        "body": item.body if item.body else "Breaking News",
-                        "kor_title": korean_dict[item.id]["headline"],
-                        "kor_body": korean_dict[item.id]["body"]
-                    })
-                    
-        except Exception as e:
-            print(f"Error retrieving macro news with error:{e}")
-            # Return empty list if there's an error
-            news_items = []
+                News.body,
+                KoreanNews.headline.label("kor_headline"),
+                KoreanNews.body.label("kor_body")
+            ),
+            day_start,
+            day_end
+        )
+
+        if cursor is not None:
+            cursor_date, cursor_id = cursor
+            stmt = stmt.where(tuple_(News.date, News.id) < tuple_(cursor_date, cursor_id))
+
+        return stmt.order_by(News.date.desc(), News.id.desc())
+    
+    def _news_join(self, stmt, day_start: datetime, day_end: datetime):
+        # The inner join keeps only news that have a Korean translation
+        return stmt.join(
+            KoreanNews, KoreanNews.id == News.id
+        ).where(
+            News.date >= day_start,
+            News.date < day_end,
+            KoreanNews.date >= day_start,
+            KoreanNews.date < day_end
+        )
+
+    # The dashboard bundles dates, indicators, analysis and news for one day.
+    # An AsyncSession runs one query at a time, so each independent query gets
+    # its own pooled session and they are awaited together.
+    
+    async def dashboard_version_async(self, sessions: async_sessionmaker, date_str: Optional[str] = None) -> Tuple:
+        """(day, dates payload, version) for get_dashboard_async.
+
+        Without a date the most recent available day is used. The version
+        combines the month list, the indicators state and the day's news,
+        and is None if any part is unknown. Raises ValueError for a bad date.
+        """
+        if date_str:
+            self._news_day(date_str)
+            dates, indicators_version, news_version = await asyncio.gather(
+                self._in_session(sessions, self.get_available_dates_async),
+                self._in_session(sessions, self.indicators_version_async, self._dashboard_month(date_str)),
+                self._in_session(sessions, self.news_version_async, date_str),
+            )
+        else:
+            # The default day comes from the dates list, so that lookup goes first
+            dates = await self._in_session(sessions, self.get_available_dates_async)
+            date_str = dates["dates"][0] if dates["dates"] else datetime.now().strftime("%Y-%m-%d")
+            indicators_version, news_version = await asyncio.gather(
+                self._in_session(sessions, self.indicators_version_async, self._dashboard_month(date_str)),
+                self._in_session(sessions, self.news_version_async, date_str),
+            )
+        
+        if "error" in dates or indicators_version is None or news_version is None:
+            return date_str, dates, None
+        
+        modified = [ts for ts in (indicators_version[1], news_version[1]) if ts is not None]
+        key = (date_str, tuple(dates["months"]), indicators_version[0], news_version[0])
+        return date_str, dates, (key, max(modified) if modified else None)
+    
+    async def get_dashboard_async(self, sessions: async_sessionmaker, date_str: str, dates: Dict, version: Optional[Tuple]) -> Dict:
+        """Dashboard payload for a day resolved by dashboard_version_async, cached per version"""
+        if version is not None:
+            cached = self._dashboard_cache.get(version[0])
+            if cached is not MISSING:
+                return cached
+        
+        indicators, news = await asyncio.gather(
+            self._in_session(sessions, self.get_economic_indicators_async, self._dashboard_month(date_str)),
+            self._in_session(sessions, self.get_macro_news_async, date_str),
+        )
+        result = {
+            "date": date_str,
+            "dates": dates,
+            "indicators": indicators,
+            "analysis": self.get_daily_analysis(date_str),
+            "news": news,
+        }
+        # Error payloads are not stored, so the next request retries them
+        if version is not None and "error" not in indicators and "error" not in news:
+            self._dashboard_cache.set(version[0], result)
+        return result
+    
+    async def _in_session(self, sessions: async_sessionmaker, method, *args):
+        async with sessions() as db:
+            return await method(db, *args)
+    
+    def _dashboard_month(self, date_str: str) -> str:
+        # "Month Year", so the indicators follow the selected day's year too
+        return self._news_day(date_str).strftime("%B %Y")
+    
+    def _news_page(self, filter_date: datetime, rows: List, limit: Optional[int]) -> Dict:
+        next_cursor = None
+        if limit is not None and len(rows) > limit:
+            rows = rows[:limit]
+            next_cursor = encode_news_cursor(rows[-1].date, rows[-1].id)
         
         # Return formatted response
         return {
             "date": filter_date.date(),  # Return as date object
-            "news": news_items
-        }
\ No newline at end of file
+            "news": [format_news_item(item) for item in rows],
+            "next_cursor": next_cursor
+        }
+
+
+def format_news_item(item) -> Dict:
+    """Shape one joined news row for the frontend"""
+    # Create a dictionary with both English and Korean content
+    return {
+        "id": item.id,
+        "title": item.headline,
+        # Absolute timestamp, so the payload only changes when the news does;
+        # the frontend renders the relative age
+        "date": item.date.isoformat(),
+        "tag": parse_news_tag(item.category),
+        "url": item.url if item.url and item.url != 'NaN' else f"https://www.google.com/search?q={quote(item.headline)}",
+        "body": item.body if item.body else "Breaking News",
+        "kor_title": item.kor_headline,
+        "kor_body": item.kor_body
+    }
+
+
+def encode_news_cursor(news_date: datetime, news_id: int) -> str:
+    """Opaque page token for the last (date, id) row of a page"""
+    raw = f"{news_date.isoformat()}|{news_id}".encode()
+    return base64.urlsafe_b64encode(raw).decode().rstrip("=")
+
+
+def decode_news_cursor(cursor: str):
+    """Inverse of encode_news_cursor; raises ValueError on a malformed token"""
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        news_date, news_id = base64.urlsafe_b64decode(padded).decode().split("|")
+        return datetime.fromisoformat(news_date), int(news_id)
+    except (binascii.Error, UnicodeDecodeError, ValueError) as e:
+        raise ValueError(f"Invalid news cursor: {cursor}") from e
+
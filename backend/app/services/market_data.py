@@ -0,0 +1,156 @@
+import os
+from abc import ABC, abstractmethod
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date, timedelta
+from typing import Dict, Optional
+
+import pandas as pd
+
+from app.services.price_series import read_price_csv, write_price_cache
+
+# Column name in all_financial_data.csv -> Yahoo Finance ticker
+SYMBOLS = {
+    "나스닥 100 선물": "NQ=F",
+    "다우존스 선물": "YM=F",
+    "S&P 500 선물": "ES=F",
+    "크루드 오일": "CL=F",
+    "골드": "GC=F",
+    "30년 국채": "^TYX",
+    "10년 국채": "^TNX",
+    "5년 국채": "^FVX",
+    "유로": "EURUSD=X",
+    "일본 엔": "JPY=X"
+}
+
+# Days before the last stored close that every incremental run fetches again, so
+# a bar written while still partial (intraday, FX) is replaced by its final value
+REFETCH_OVERLAP_DAYS = 5
+
+
+class MarketDataSource(ABC):
+    """Where daily closing prices come from"""
+
+    @abstractmethod
+    def fetch(self, name: str, ticker: str, start: Optional[date] = None) -> pd.Series:
+        """Return closing prices indexed by date, from start (inclusive) or for the last year"""
+
+
+class YFinanceSource(MarketDataSource):
+    """Daily closes from Yahoo Finance.
+
+    Uses one Ticker per call: yf.download keeps its results in a module-level
+    dict that every call resets, so concurrent downloads clobber each other.
+    """
+
+    def fetch(self, name: str, ticker: str, start: Optional[date] = None) -> pd.Series:
+        import yfinance as yf
+
+        if start is None:
+            df = yf.Ticker(ticker).history(interval="1d", period="1y")
+        else:
+            df = yf.Ticker(ticker).history(interval="1d", start=start.isoformat())
+        if df.empty:
+            return pd.Series(dtype="float64")
+        return df["Close"]
+
+
+class FixtureSource(MarketDataSource):
+    """Daily closes read from a local CSV in the all_financial_data.csv format"""
+
+    def __init__(self, path: str):
+        self.frame = read_price_csv(path)
+
+    def fetch(self, name: str, ticker: str, start: Optional[date] = None) -> pd.Series:
+        if name not in self.frame.columns:
+            return pd.Series(dtype="float64")
+        column = self.frame[name].dropna()
+        if start is not None:
+            column = column[column.index >= pd.Timestamp(start)]
+        return column
+
+
+class MarketDataFetcher:
+    """Incrementally refresh the futures price CSV from a MarketDataSource.
+
+    Symbols are fetched concurrently on a bounded pool, only for dates from a
+    short overlap before the last stored close, and merged into the existing
+    frame in one aligned concat (fetched values win) before an atomic write.
+    """
+
+    def __init__(
+        self,
+        source: MarketDataSource,
+        csv_path: str,
+        symbols: Dict[str, str] = SYMBOLS,
+        max_workers: int = 4,
+    ):
+        self.source = source
+        self.csv_path = csv_path
+        self.symbols = symbols
+        self.max_workers = max_workers
+        # Closes fetched by the last run, before merging and interpolation
+        self.last_fetched = pd.DataFrame()
+
+    def _read_existing(self) -> pd.DataFrame:
+        if not os.path.exists(self.csv_path):
+            return pd.DataFrame()
+        return read_price_csv(self.csv_path)
+
+    def _start_dates(self, existing: pd.DataFrame) -> Dict[str, Optional[date]]:
+        """First date to request per column: a few days before its last stored close"""
+        starts = {}
+        for name in self.symbols:
+            if name in existing.columns and existing[name].notna().any():
+                starts[name] = existing[name].last_valid_index().date() - timedelta(days=REFETCH_OVERLAP_DAYS)
+            else:
+                starts[name] = None
+        return starts
+
+    def _fetch_one(self, name: str, start: Optional[date]) -> Optional[pd.Series]:
+        print(f"{name} ({self.symbols[name]}) 데이터 수집 중...")
+        try:
+            series = self.source.fetch(name, self.symbols[name], start)
+        except Exception as e:
+            print(f"{name} 데이터 수집 실패: {e}")
+            return None
+        series.index = pd.to_datetime(series.index).tz_localize(None).normalize()
+        if start is not None:
+            series = series[series.index >= pd.Timestamp(start)]
+        print(f"{name} 데이터 수집 완료 ({len(series)}건)")
+        return series.rename(name)
+
+    def run(self, full: bool = False) -> pd.DataFrame:
+        """Fetch new closes, merge them in and write the CSV and binary cache"""
+        existing = pd.DataFrame() if full else self._read_existing()
+        starts = self._start_dates(existing)
+
+        with ThreadPoolExecutor(max_workers=self.max_workers) as pool:
+            results = list(pool.map(lambda name: self._fetch_one(name, starts[name]), self.symbols))
+        fetched = [series for series in results if series is not None and len(series)]
+        self.last_fetched = pd.concat(fetched, axis=1).sort_index() if fetched else pd.DataFrame()
+
+        if not fetched:
+            print("새로 수집된 데이터 없음")
+            return existing
+
+        # One aligned concat; per date keep the newest non-null value of each column
+        frames = ([existing] if not existing.empty else []) + [series.to_frame() for series in fetched]
+        merged = pd.concat(frames, axis=0, sort=False)
+        merged = merged.groupby(level=0).last().sort_index()
+        merged = merged.reindex(columns=[name for name in self.symbols if name in merged.columns])
+
+        # Fill gaps between closes only, trailing dates are fetched next run
+        merged = merged.interpolate(method="linear", limit_area="inside")
+        merged.index.name = "Date"
+
+        self._write_atomic(merged)
+        write_price_cache(merged, self.csv_path)
+        return merged
+
+    def _write_atomic(self, df: pd.DataFrame):
+        """Write the CSV to a temporary file and rename it over the old one"""
+        directory = os.path.dirname(self.csv_path) or "."
+        os.makedirs(directory, exist_ok=True)
+        tmp_path = f"{self.csv_path}.{os.getpid()}.tmp"
+        df.to_csv(tmp_path, date_format="%Y-%m-%d")
+        os.replace(tmp_path, self.csv_path)
@@ -0,0 +1,209 @@
+import json
+import re
+from typing import Dict, List, Optional
+from urllib.parse import quote
+
+from sqlalchemy import DateTime, and_, func, or_, select, text
+from sqlalchemy.engine import Connection
+from sqlalchemy.orm import Session
+
+from app.core.config import settings
+from app.db.models import NEWS_SEARCH_VECTOR, ENGLISH_CONFIG, KoreanNews, News
+
+# Hangul syllables and jamo
+HANGUL = re.compile(r"[가-힣ᄀ-ᇿ㄰-㆏]")
+
+# The SQLite trigram tokenizer can only MATCH terms of three or more characters
+TRIGRAM_MIN_LENGTH = 3
+
+
+def detect_language(q: str) -> str:
+    """'ko' when the query contains Hangul, otherwise 'en'"""
+    return "ko" if HANGUL.search(q) else "en"
+
+
+def parse_news_tag(category) -> str:
+    """First entry of a news category, which is usually a stringified list"""
+    if isinstance(category, str):
+        try:
+            category_list = json.loads(category)  # Parse the stringified list
+        except json.JSONDecodeError:
+            category_list = [category]  # Fallback to treat it as a single string
+    else:
+        category_list = category if isinstance(category, (list, tuple)) else [category]
+    if isinstance(category_list, str):
+        category_list = [category_list]
+    return category_list[0] if category_list else "Uncategorized"
+
+
+def search_news(db: Session, q: str, lang: Optional[str] = None, limit: int = 20, offset: int = 0) -> Dict:
+    """Ranked full-text search over English (agii) or Korean (qfind) news.
+
+    English uses a weighted tsvector (headline above body) on PostgreSQL and
+    FTS5 with the porter stemmer on SQLite. Korean has no stemmer, so it falls
+    back to substring matching on trigram indexes. Every term must match;
+    results are ordered by rank, then newest first.
+    """
+    q = q.strip()
+    lang = lang or detect_language(q)
+    terms = q.split()
+
+    if not terms:
+        rows = []
+    elif db.get_bind().dialect.name == "postgresql":
+        stmt = _english_statement(q) if lang == "en" else _korean_statement(q, terms)
+        rows = db.execute(stmt.limit(limit + 1).offset(offset)).all()
+    else:
+        rows = _search_sqlite(db, terms, lang, limit + 1, offset)
+
+    # One extra row tells us whether another page exists
+    next_offset = offset + limit if len(rows) > limit else None
+    return {
+        "query": q,
+        "lang": lang,
+        "results": [_format_hit(row) for row in rows[:limit]],
+        "next_offset": next_offset,
+    }
+
+
+def _english_statement(q: str):
+    query = func.websearch_to_tsquery(ENGLISH_CONFIG, q)
+    score = func.ts_rank_cd(NEWS_SEARCH_VECTOR, query)
+    return (
+        select(
+            News.id,
+            News.date,
+            News.category,
+            News.headline,
+            News.url,
+            News.body,
+            KoreanNews.headline.label("kor_headline"),
+            KoreanNews.body.label("kor_body"),
+            score.label("score"),
+        )
+        .outerjoin(KoreanNews, KoreanNews.id == News.id)
+        .where(NEWS_SEARCH_VECTOR.op("@@")(query))
+        .order_by(score.desc(), News.date.desc(), News.id.desc())
+    )
+
+
+def _korean_statement(q: str, terms: List[str]):
+    # ILIKE '%term%' on each column is what the gin_trgm_ops indexes accelerate
+    matches = []
+    for term in terms:
+        pattern = f"%{_escape_like(term)}%"
+        matches.append(or_(
+            KoreanNews.headline.ilike(pattern, escape="!"),
+            KoreanNews.body.ilike(pattern, escape="!"),
+        ))
+    score = func.word_similarity(q, KoreanNews.headline) * 2 + func.word_similarity(q, KoreanNews.body)
+    return (
+        select(
+            KoreanNews.id,
+            func.coalesce(News.date, KoreanNews.date).label("date"),
+            func.coalesce(News.category, KoreanNews.category).label("category"),
+            News.headline,
+            func.coalesce(News.url, KoreanNews.url).label("url"),
+            News.body,
+            KoreanNews.headline.label("kor_headline"),
+            KoreanNews.body.label("kor_body"),
+            score.label("score"),
+        )
+        .outerjoin(News, News.id == KoreanNews.id)
+        .where(and_(*matches))
+        .order_by(score.desc(), KoreanNews.date.desc(), KoreanNews.id.desc())
+    )
+
+
+def _search_sqlite(db: Session, terms: List[str], lang: str, limit: int, offset: int) -> List:
+    if lang == "en":
+        fts, table, other = f"{settings.DB_AGII}.market_news_fts", f"{settings.DB_AGII}.market_news", f"{settings.DB_SCHEMA}.market_news"
+        english, korean = "n", "o"
+    else:
+        fts, table, other = f"{settings.DB_SCHEMA}.market_news_fts", f"{settings.DB_SCHEMA}.market_news", f"{settings.DB_AGII}.market_news"
+        english, korean = "o", "n"
+
+    params = {"limit": limit, "offset": offset}
+    if lang == "ko" and any(len(term) < TRIGRAM_MIN_LENGTH for term in terms):
+        # Short Korean words (e.g. two-syllable nouns) can't be MATCHed by the
+        # trigram tokenizer, but LIKE on the FTS table still filters them
+        clauses = []
+        for i, term in enumerate(terms):
+            params[f"term{i}"] = f"%{_escape_like(term)}%"
+            clauses.append(f"(f.headline LIKE :term{i} ESCAPE '!' OR f.body LIKE :term{i} ESCAPE '!')")
+        where, score = " AND ".join(clauses), "0.0"
+    else:
+        # Quote every term so FTS5 operators in user input are taken literally
+        params["match"] = " ".join('"' + term.replace('"', '""') + '"' for term in terms)
+        where, score = "f.market_news_fts MATCH :match", "-bm25(f.market_news_fts, 2.0, 1.0)"
+
+    stmt = text(f"""
+        SELECT n.id, COALESCE({english}.date, n.date) AS date, COALESCE({english}.category, n.category) AS category,
+               {english}.headline AS headline, COALESCE({english}.url, n.url) AS url, {english}.body AS body,
+               {korean}.headline AS kor_headline, {korean}.body AS kor_body, {score} AS score
+        FROM {fts} AS f
+        JOIN {table} AS n ON n.id = f.rowid
+        LEFT JOIN {other} AS o ON o.id = n.id
+        WHERE {where}
+        ORDER BY score DESC, n.date DESC, n.id DESC
+        LIMIT :limit OFFSET :offset
+    """).columns(date=DateTime)
+    return db.execute(stmt, params).all()
+
+
+def create_sqlite_fts(connection: Connection):
+    """Create FTS5 tables mirroring both news tables, kept in sync by triggers"""
+    for schema, tokenizer in ((settings.DB_AGII, "porter unicode61"), (settings.DB_SCHEMA, "trigram")):
+        exists = connection.execute(text(
+            f"SELECT 1 FROM {schema}.sqlite_master WHERE type = 'table' AND name = 'market_news_fts'"
+        )).first()
+        if exists:
+            continue
+        connection.execute(text(
+            f"CREATE VIRTUAL TABLE {schema}.market_news_fts USING fts5("
+            f"headline, body, content='market_news', content_rowid='id', tokenize='{tokenizer}')"
+        ))
+        connection.execute(text(f"""
+            CREATE TRIGGER {schema}.market_news_fts_insert AFTER INSERT ON market_news BEGIN
+                INSERT INTO market_news_fts (rowid, headline, body) VALUES (new.id, new.headline, new.body);
+            END
+        """))
+        connection.execute(text(f"""
+            CREATE TRIGGER {schema}.market_news_fts_delete AFTER DELETE ON market_news BEGIN
+                INSERT INTO market_news_fts (market_news_fts, rowid, headline, body)
+                VALUES ('delete', old.id, old.headline, old.body);
+            END
+        """))
+        connection.execute(text(f"""
+            CREATE TRIGGER {schema}.market_news_fts_update AFTER UPDATE ON market_news BEGIN
+                INSERT INTO market_news_fts (market_news_fts, rowid, headline, body)
+                VALUES ('delete', old.id, old.headline, old.body);
+                INSERT INTO market_news_fts (rowid, headline, body) VALUES (new.id, new.headline, new.body);
+            END
+        """))
+        # Index rows that existed before the FTS table
+        connection.execute(text(f"INSERT INTO {schema}.market_news_fts (market_news_fts) VALUES ('rebuild')"))
+
+
+def _escape_like(term: str) -> str:
+    return term.replace("!", "!!").replace("%", "!%").replace("_", "!_")
+
+
+def _format_hit(row) -> Dict:
+    headline = row.headline or row.kor_headline
+    if row.url and row.url != 'NaN':
+        url = row.url
+    else:
+        # Without a URL or any headline there is nothing to search for
+        url = f"https://www.google.com/search?q={quote(headline)}" if headline else None
+    return {
+        "id": row.id,
+        "date": row.date,
+        "title": headline,
+        "tag": parse_news_tag(row.category),
+        "url": url,
+        "body": row.body or "",
+        "kor_title": row.kor_headline,
+        "kor_body": row.kor_body,
+        "score": float(row.score or 0.0),
+    }
@@ -0,0 +1,288 @@
+import json
+import os
+import uuid
+import numpy as np
+import pandas as pd
+from datetime import date, datetime
+from typing import Dict, Iterator, List, Optional
+
+# Bump when the on-disk cache layout changes
+CACHE_VERSION = 1
+
+# Rows converted to dicts at a time when streaming a history
+RECORD_CHUNK = 2048
+
+
+def date_bounds(dates: np.ndarray, start: Optional[date] = None, end: Optional[date] = None):
+    """Row positions [lo, hi) of sorted dates falling within [start, end]"""
+    lo = 0 if start is None else int(np.searchsorted(dates, np.datetime64(start, "D"), side="left"))
+    hi = len(dates) if end is None else int(np.searchsorted(dates, np.datetime64(end, "D"), side="right"))
+    return lo, max(lo, hi)
+
+
+class PriceSeries:
+    """Columnar price history for a single symbol.
+
+    Each column is one contiguous NumPy array (datetime64 dates, float prices,
+    int volumes), so slicing returns views instead of copies.
+    """
+
+    __slots__ = ("dates", "prices", "volumes")
+
+    def __init__(self, dates, prices, volumes):
+        self.dates = np.asarray(dates, dtype="datetime64[D]")
+        self.prices = np.asarray(prices, dtype=np.float64)
+        self.volumes = np.asarray(volumes, dtype=np.int64)
+
+    def __len__(self) -> int:
+        return len(self.prices)
+
+    @property
+    def nbytes(self) -> int:
+        """Memory held by the column arrays"""
+        return self.dates.nbytes + self.prices.nbytes + self.volumes.nbytes
+
+    def slice(self, start: int, stop: int) -> "PriceSeries":
+        """Return a zero-copy view of rows [start, stop)"""
+        return PriceSeries(self.dates[start:stop], self.prices[start:stop], self.volumes[start:stop])
+
+    def between(self, start: Optional[date] = None, end: Optional[date] = None) -> "PriceSeries":
+        """Return a zero-copy view of rows dated within [start, end]"""
+        return self.slice(*date_bounds(self.dates, start, end))
+
+    def take(self, indices: np.ndarray) -> "PriceSeries":
+        """Return the rows at the given positions"""
+        return PriceSeries(self.dates[indices], self.prices[indices], self.volumes[indices])
+
+    def to_records(self) -> List[Dict]:
+        """Build the priceHistory payload straight from the column arrays"""
+        dates = np.datetime_as_string(self.dates, unit="D").tolist()
+        return [
+            {"date": d, "price": p, "volume": v}
+            for d, p, v in zip(dates, self.prices.tolist(), self.volumes.tolist())
+        ]
+
+
+class OHLCSeries:
+    """Columnar open/high/low/close bars produced by resampling a PriceSeries"""
+
+    __slots__ = ("dates", "open", "high", "low", "close", "volumes")
+
+    def __init__(self, dates, open_, high, low, close, volumes):
+        self.dates = dates
+        self.open = open_
+        self.high = high
+        self.low = low
+        self.close = close
+        self.volumes = volumes
+
+    def __len__(self) -> int:
+        return len(self.close)
+
+    @property
+    def prices(self) -> np.ndarray:
+        return self.close
+
+    def take(self, indices: np.ndarray) -> "OHLCSeries":
+        """Return the bars at the given positions"""
+        return OHLCSeries(
+            self.dates[indices], self.open[indices], self.high[indices],
+            self.low[indices], self.close[indices], self.volumes[indices]
+        )
+
+    def to_records(self) -> List[Dict]:
+        """Build the priceHistory payload, keeping "price" as the close for existing charts"""
+        dates = np.datetime_as_string(self.dates, unit="D").tolist()
+        return [
+            {"date": d, "open": o, "high": h, "low": l, "close": c, "price": c, "volume": v}
+            for d, o, h, l, c, v in zip(
+                dates, self.open.tolist(), self.high.tolist(), self.low.tolist(),
+                self.close.tolist(), self.volumes.tolist()
+            )
+        ]
+
+
+def iter_records(series, chunk_size: int = RECORD_CHUNK) -> Iterator[Dict]:
+    """Yield series.to_records() a chunk at a time, so streaming never builds the full list"""
+    for lo in range(0, len(series), chunk_size):
+        yield from series.take(slice(lo, lo + chunk_size)).to_records()
+
+
+def resample_ohlc(series: PriceSeries, interval: str) -> OHLCSeries:
+    """Aggregate daily prices into weekly (Monday) or monthly OHLC bars"""
+    if interval == "weekly":
+        # datetime64 weeks start on Thursday, so align buckets on Monday manually
+        weekday = (series.dates.astype(np.int64) + 3) % 7
+        keys = series.dates - weekday.astype("timedelta64[D]")
+    elif interval == "monthly":
+        keys = series.dates.astype("datetime64[M]").astype("datetime64[D]")
+    else:
+        keys = series.dates
+
+    n = len(series)
+    if n == 0:
+        empty = np.array([], dtype=np.float64)
+        return OHLCSeries(keys, empty, empty, empty, empty, np.array([], dtype=np.int64))
+
+    starts = np.flatnonzero(np.r_[True, keys[1:] != keys[:-1]])
+    ends = np.r_[starts[1:], n] - 1
+    prices = series.prices
+    return OHLCSeries(
+        keys[starts],
+        prices[starts],
+        np.maximum.reduceat(prices, starts),
+        np.minimum.reduceat(prices, starts),
+        prices[ends],
+        np.add.reduceat(series.volumes, starts),
+    )
+
+
+def lttb_indices(x: np.ndarray, y: np.ndarray, threshold: int) -> np.ndarray:
+    """Largest-Triangle-Three-Buckets downsampling, returns the positions to keep"""
+    n = len(y)
+    if threshold >= n or threshold < 3:
+        return np.arange(n)
+
+    x = x.astype(np.float64)
+    bucket_size = (n - 2) / (threshold - 2)
+    indices = np.empty(threshold, dtype=np.int64)
+    indices[0] = 0
+    indices[-1] = n - 1
+
+    a = 0
+    for i in range(threshold - 2):
+        start = int(i * bucket_size) + 1
+        end = int((i + 1) * bucket_size) + 1
+        next_end = min(int((i + 2) * bucket_size) + 1, n)
+
+        # Average of the next bucket is the third vertex of the triangle
+        avg_x = x[end:next_end].mean()
+        avg_y = y[end:next_end].mean()
+
+        area = np.abs(
+            (x[a] - avg_x) * (y[start:end] - y[a]) - (x[a] - x[start:end]) * (avg_y - y[a])
+        )
+        a = start + int(np.argmax(area))
+        indices[i + 1] = a
+
+    return indices
+
+
+def downsample(series, max_points: int):
+    """Reduce a series to at most max_points rows while preserving its shape"""
+    if max_points is None or len(series) <= max_points:
+        return series
+    indices = lttb_indices(series.dates.astype(np.int64), series.prices, max_points)
+    return series.take(indices)
+
+
+def read_price_csv(path: str) -> pd.DataFrame:
+    """Read the CSV written by fetch_data.py into a date-indexed numeric frame"""
+    df = pd.read_csv(path, index_col=0)
+
+    # yfinance writes extra header rows ("Ticker", "Date") below the column names
+    dates = pd.to_datetime(pd.Series(df.index), errors="coerce", format="ISO8601")
+    df = df.loc[dates.notna().to_numpy()]
+    df.index = pd.DatetimeIndex(dates.dropna().to_numpy())
+    df.index.name = "Date"
+    return df.apply(pd.to_numeric, errors="coerce")
+
+
+def mock_volumes(n: int) -> np.ndarray:
+    """Random daily volumes, the CSV only carries closing prices"""
+    return np.random.normal(1000000, 300000, n).astype(np.int64)
+
+
+def series_from_column(column: pd.Series) -> PriceSeries:
+    """Convert one CSV column into a PriceSeries, skipping missing prices"""
+    column = column.dropna()
+    return PriceSeries(
+        column.index.to_numpy().astype("datetime64[D]"),
+        column.to_numpy(dtype=np.float64),
+        mock_volumes(len(column)),
+    )
+
+
+def cache_dir_for(csv_path: str) -> str:
+    """Directory holding the binary cache next to a price CSV"""
+    return os.path.splitext(csv_path)[0] + ".cache"
+
+
+def write_price_cache(df: pd.DataFrame, csv_path: str):
+    """Write a columnar .npy copy of a price frame next to its CSV.
+
+    Prices are stored column-major so every column is one contiguous block
+    once memory-mapped. Data files carry a generation suffix and the
+    manifest is replaced last, so readers always see a complete generation.
+    """
+    cache_dir = cache_dir_for(csv_path)
+    os.makedirs(cache_dir, exist_ok=True)
+    generation = uuid.uuid4().hex[:12]
+
+    files = {"dates": f"dates-{generation}.npy", "prices": f"prices-{generation}.npy"}
+    dates = df.index.to_numpy().astype("datetime64[D]")
+    prices = np.asfortranarray(df.to_numpy(dtype=np.float64))
+    np.save(os.path.join(cache_dir, files["dates"]), dates)
+    np.save(os.path.join(cache_dir, files["prices"]), prices)
+
+    manifest = {
+        "version": CACHE_VERSION,
+        "columns": [str(c) for c in df.columns],
+        "rows": len(df),
+        "files": files,
+        "source_mtime": os.path.getmtime(csv_path),
+        "created_at": datetime.now().isoformat(),
+    }
+    tmp_path = os.path.join(cache_dir, f"manifest-{generation}.json.tmp")
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        json.dump(manifest, f, ensure_ascii=False)
+    os.replace(tmp_path, os.path.join(cache_dir, "manifest.json"))
+
+    # Old generations stay readable for processes that already mapped them
+    for name in os.listdir(cache_dir):
+        if name.endswith(".npy") and generation not in name:
+            os.remove(os.path.join(cache_dir, name))
+
+
+def read_price_cache(csv_path: str) -> Optional[Dict[str, PriceSeries]]:
+    """Memory-map the binary cache, or return None if it is missing or stale"""
+    cache_dir = cache_dir_for(csv_path)
+    try:
+        with open(os.path.join(cache_dir, "manifest.json"), encoding="utf-8") as f:
+            manifest = json.load(f)
+        if manifest.get("version") != CACHE_VERSION:
+            return None
+        if os.path.exists(csv_path) and manifest["source_mtime"] != os.path.getmtime(csv_path):
+            return None
+        dates = np.load(os.path.join(cache_dir, manifest["files"]["dates"]), mmap_mode="r")
+        prices = np.load(os.path.join(cache_dir, manifest["files"]["prices"]), mmap_mode="r")
+    except (OSError, ValueError, KeyError):
+        return None
+
+    columns = {}
+    for i, name in enumerate(manifest["columns"]):
+        column = prices[:, i]
+        valid = np.flatnonzero(~np.isnan(column))
+        if len(valid) == 0:
+            continue
+        first, last = valid[0], valid[-1] + 1
+        if last - first == len(valid):
+            # No gaps inside the range, so keep views onto the mapped file
+            columns[name] = PriceSeries(dates[first:last], column[first:last], mock_volumes(len(valid)))
+        else:
+            columns[name] = PriceSeries(dates[valid], column[valid], mock_volumes(len(valid)))
+    return columns
+
+
+def load_price_columns(csv_path: str) -> Dict[str, PriceSeries]:
+    """Load every price column, preferring the binary cache over parsing the CSV"""
+    columns = read_price_cache(csv_path)
+    if columns is not None:
+        return columns
+    df = read_price_csv(csv_path)
+    columns = {}
+    for name in df.columns:
+        series = series_from_column(df[name])
+        if len(series):
+            columns[name] = series
+    return columns
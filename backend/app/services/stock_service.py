@@ -0,0 +1,153 @@
+import csv
+import io
+from datetime import datetime, timedelta, timezone
+from typing import Dict, List, Optional
+
+from sqlalchemy import func, insert, literal_column, select
+from sqlalchemy.dialects.postgresql import aggregate_order_by, array_agg
+from sqlalchemy.orm import Session
+
+from app.core.config import settings
+from app.db.models import Stock, StockPrice
+
+# Bucket width, date_trunc unit and SQLite strftime format per interval= value
+INTERVALS = {
+    "1m": (timedelta(minutes=1), "minute", "%Y-%m-%d %H:%M:00"),
+    "1h": (timedelta(hours=1), "hour", "%Y-%m-%d %H:00:00"),
+    "1d": (timedelta(days=1), "day", "%Y-%m-%d 00:00:00"),
+}
+
+# Range served when start= is omitted
+DEFAULT_RANGES = {"1m": timedelta(days=1), "1h": timedelta(days=30), "1d": timedelta(days=365)}
+
+# Rows per executemany batch on databases without COPY
+BATCH_SIZE = 5000
+
+
+def as_utc(value: datetime) -> datetime:
+    """Aware UTC datetime; naive values are taken to be UTC already"""
+    if value.tzinfo is None:
+        return value.replace(tzinfo=timezone.utc)
+    return value.astimezone(timezone.utc)
+
+
+def get_stock_id(db: Session, symbol: str) -> Optional[int]:
+    return db.execute(select(Stock.id).where(Stock.symbol == symbol.upper())).scalar()
+
+
+def price_bars_statement(dialect: str, stock_id: int, interval: str, start: datetime, end: datetime):
+    """OHLCV per interval bucket in [start, end), oldest first"""
+    _, unit, sqlite_format = INTERVALS[interval]
+    in_range = (StockPrice.stock_id == stock_id, StockPrice.timestamp >= start, StockPrice.timestamp < end)
+
+    if dialect == "postgresql":
+        # The unit is inlined so GROUP BY repeats the select expression exactly,
+        # not as a second bind parameter
+        bucket = func.date_trunc(literal_column(f"'{unit}'"), StockPrice.timestamp).label("bucket")
+        first = array_agg(aggregate_order_by(StockPrice.price, StockPrice.timestamp.asc(), StockPrice.id.asc()))
+        last = array_agg(aggregate_order_by(StockPrice.price, StockPrice.timestamp.desc(), StockPrice.id.desc()))
+        return (
+            select(
+                bucket,
+                first[1].label("open"),
+                func.max(StockPrice.price).label("high"),
+                func.min(StockPrice.price).label("low"),
+                last[1].label("close"),
+                func.sum(StockPrice.volume).label("volume"),
+            )
+            .where(*in_range)
+            .group_by(bucket)
+            .order_by(bucket)
+        )
+
+    # No ordered aggregates elsewhere; take open/close with window functions, then group
+    bucket = func.strftime(sqlite_format, StockPrice.timestamp)
+    ticks = select(
+        bucket.label("bucket"),
+        StockPrice.price,
+        StockPrice.volume,
+        func.first_value(StockPrice.price).over(
+            partition_by=bucket, order_by=(StockPrice.timestamp.asc(), StockPrice.id.asc())
+        ).label("open"),
+        func.first_value(StockPrice.price).over(
+            partition_by=bucket, order_by=(StockPrice.timestamp.desc(), StockPrice.id.desc())
+        ).label("close"),
+    ).where(*in_range).subquery()
+    return (
+        select(
+            ticks.c.bucket,
+            func.min(ticks.c.open).label("open"),
+            func.max(ticks.c.price).label("high"),
+            func.min(ticks.c.price).label("low"),
+            func.min(ticks.c.close).label("close"),
+            func.sum(ticks.c.volume).label("volume"),
+        )
+        .group_by(ticks.c.bucket)
+        .order_by(ticks.c.bucket)
+    )
+
+
+def get_price_bars(db: Session, stock_id: int, interval: str,
+                   start: Optional[datetime] = None, end: Optional[datetime] = None) -> Dict:
+    """Aggregate stored prices into OHLCV bars; raises ValueError for a bad range"""
+    if interval not in INTERVALS:
+        raise ValueError(f"Unknown interval {interval}. Choose from {', '.join(INTERVALS)}")
+    # Query parameters may come with or without an offset, so compare them all in UTC
+    end = as_utc(end) if end else datetime.now(timezone.utc)
+    start = as_utc(start) if start else end - DEFAULT_RANGES[interval]
+    if start >= end:
+        raise ValueError("start must be before end")
+    width = INTERVALS[interval][0]
+    if (end - start) / width > settings.STOCK_PRICES_MAX_BARS:
+        raise ValueError(
+            f"Range covers more than {settings.STOCK_PRICES_MAX_BARS} {interval} bars; use a wider interval"
+        )
+
+    rows = db.execute(price_bars_statement(db.get_bind().dialect.name, stock_id, interval, start, end)).all()
+    bars = []
+    for bucket, open_, high, low, close, volume in rows:
+        # strftime buckets come back as naive UTC text
+        timestamp = as_utc(datetime.fromisoformat(bucket) if isinstance(bucket, str) else bucket)
+        bars.append({
+            "timestamp": timestamp.isoformat(),
+            "open": open_,
+            "high": high,
+            "low": low,
+            "close": close,
+            "volume": int(volume or 0),
+        })
+    return {"interval": interval, "start": start.isoformat(), "end": end.isoformat(), "bars": bars}
+
+
+def insert_stock_prices(db: Session, stock_id: int, rows: List[Dict]) -> int:
+    """Append a batch of {timestamp, price, volume} ticks for one stock"""
+    if not rows:
+        return 0
+    # Store UTC, which is what SQLite (no time zone support) buckets and compares on
+    rows = [{**row, "timestamp": as_utc(row["timestamp"])} for row in rows]
+    if db.get_bind().dialect.name == "postgresql":
+        _copy_prices(db, stock_id, rows)
+    else:
+        values = [{"stock_id": stock_id, **row} for row in rows]
+        for i in range(0, len(values), BATCH_SIZE):
+            db.execute(insert(StockPrice), values[i:i + BATCH_SIZE])
+    db.commit()
+    return len(rows)
+
+
+def _copy_prices(db: Session, stock_id: int, rows: List[Dict]):
+    """COPY ticks straight into stock_prices; there is no key to merge on"""
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    for row in rows:
+        writer.writerow([stock_id, row["timestamp"].isoformat(), row["price"], row["volume"]])
+    buffer.seek(0)
+
+    cursor = db.connection().connection.cursor()
+    try:
+        cursor.copy_expert(
+            f"COPY {settings.DB_SCHEMA}.stock_prices (stock_id, timestamp, price, volume) FROM STDIN WITH (FORMAT csv)",
+            buffer,
+        )
+    finally:
+        cursor.close()
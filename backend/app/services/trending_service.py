@@ -0,0 +1,59 @@
+from typing import Dict, List
+
+from sqlalchemy import func, select
+from sqlalchemy.orm import Session
+
+from app.core.cache import CommitInvalidation, LRUCache, MISSING
+from app.core.config import settings
+from app.db.models import TrendingTicker
+
+# Columns served by /api/trending/tickers
+TICKER_COLUMNS = ("id", "symbol", "name", "last_price", "change", "change_percent")
+
+# Every live TrendingService, whose snapshot is dropped when a commit changes trending_tickers
+ticker_changes = CommitInvalidation(TrendingTicker, "trending_tickers_changed")
+
+
+def latest_tickers_statement(dialect: str):
+    """Newest row per symbol, in the order the latest rows were inserted"""
+    columns = [getattr(TrendingTicker, name) for name in TICKER_COLUMNS]
+    if dialect == "postgresql":
+        latest = select(*columns).distinct(TrendingTicker.symbol).order_by(
+            TrendingTicker.symbol, TrendingTicker.timestamp.desc(), TrendingTicker.id.desc()
+        ).subquery()
+        return select(latest).order_by(latest.c.id)
+
+    # No DISTINCT ON elsewhere; rank rows per symbol and keep the first
+    rank = func.row_number().over(
+        partition_by=TrendingTicker.symbol,
+        order_by=(TrendingTicker.timestamp.desc(), TrendingTicker.id.desc()),
+    ).label("rank")
+    ranked = select(*columns, rank).subquery()
+    return select(*(ranked.c[name] for name in TICKER_COLUMNS)).where(ranked.c.rank == 1).order_by(ranked.c.id)
+
+
+class TrendingService:
+    def __init__(self):
+        # Single entry holding the latest tickers, dropped when trending_tickers changes
+        self._snapshot = LRUCache(maxsize=1, ttl=settings.TRENDING_CACHE_TTL_SECONDS)
+        # Bumped on every invalidation so a read that raced one isn't stored
+        self._generation = 0
+        ticker_changes.register(self)
+
+    def invalidate(self):
+        self._generation += 1
+        self._snapshot.clear()
+
+    def get_trending_tickers(self, db: Session) -> List[Dict]:
+        """Latest price row for each trending symbol, served from memory between changes"""
+        cached = self._snapshot.get("tickers")
+        if cached is not MISSING:
+            return cached
+
+        generation = self._generation
+        rows = db.execute(latest_tickers_statement(db.get_bind().dialect.name)).all()
+        tickers = [dict(row._mapping) for row in rows]
+        if generation == self._generation:
+            self._snapshot.set("tickers", tickers)
+        return tickers
+
@@ -1,48 +1,32 @@
-import yfinance as yf
-import pandas as pd
-import os
-from datetime import datetime
+import argparse
+import time
 
-# 심볼 매핑
-symbols = {
-    "나스닥 100 선물": "NQ=F",
-    "다우존스 선물": "YM=F",
-    "S&P 500 선물": "ES=F",
-    "크루드 오일": "CL=F",
-    "골드": "GC=F",
-    "30년 국채": "^TYX",
-    "10년 국채": "^TNX",
-    "5년 국채": "^FVX",
-    "유로": "EURUSD=X",
-    "일본 엔": "JPY=X"
-}
+from app.core.config import settings
+from app.services.market_data import MarketDataFetcher, YFinanceSource
 
-# 데이터 저장 디렉토리
-os.makedirs("data", exist_ok=True)
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="금융 데이터 수집")
+    parser.add_argument("--full", action="store_true", help="기존 데이터를 무시하고 1년치 전체 재수집")
+    parser.add_argument("--workers", type=int, default=4, help="동시 수집 심볼 수")
+    parser.add_argument("--db", action="store_true", help="수집한 데이터를 futures_prices 테이블에도 저장")
+    args = parser.parse_args()
 
-# 전체 데이터를 저장할 DataFrame
-all_data = pd.DataFrame()
+    started = time.perf_counter()
+    fetcher = MarketDataFetcher(YFinanceSource(), settings.FUTURES_DATA_PATH, max_workers=args.workers)
+    all_data = fetcher.run(full=args.full)
+    print(f"모든 금융 데이터 수집 완료 및 저장됨 ({time.perf_counter() - started:.1f}초)")
 
-for name, symbol in symbols.items():
-    print(f"{name} ({symbol}) 데이터 수집 중...")
-    try:
-        df = yf.download(symbol, interval="1d", period="1y")[["Close"]]
-        df.rename(columns={"Close": name}, inplace=True)
-        if all_data.empty:
-            all_data = df
-        else:
-            all_data = all_data.join(df, how="outer")
-        print(f"{name} 데이터 수집 완료")
-    except Exception as e:
-        print(f"{name} 데이터 수집 실패: {e}")
+    if args.db:
+        # Imported here so the CSV-only path runs without DATABASE_URL
+        from app.db.database import SessionLocal
+        from app.services.futures_db import frame_to_rows, upsert_futures_prices
+        from app.services.futures_service import SYMBOL_MAPPING
 
-# 결측치 보간
-all_data = all_data.interpolate(method="linear")
+        rows = frame_to_rows(fetcher.last_fetched, SYMBOL_MAPPING)
+        with SessionLocal() as db:
+            upsert_futures_prices(db, rows)
+        print(f"futures_prices 테이블에 {len(rows)}건 저장됨")
 
-# 저장
-all_data.to_csv("data/all_financial_data.csv")
-print("모든 금융 데이터 수집 완료 및 저장됨")
-
-# 미리보기
-print(all_data.head())
-print(f"데이터 형태: {all_data.shape}")
+    # 미리보기
+    print(all_data.tail())
+    print(f"데이터 형태: {all_data.shape}")
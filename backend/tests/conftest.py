@@ -0,0 +1,41 @@
+import os
+import tempfile
+
+import pytest
+
+# Tests build their own SQLite engines; point the app's engines at a throwaway
+# file so importing app modules never reaches the DATABASE_URL from .env
+os.environ["DATABASE_URL"] = "sqlite:///" + os.path.join(tempfile.gettempdir(), "qfind-tests.db")
+os.environ["SCHEDULER_ENABLED"] = "false"
+
+from sqlalchemy import create_engine, event  # noqa: E402
+from sqlalchemy.orm import sessionmaker  # noqa: E402
+
+from app.core.config import settings  # noqa: E402
+
+
+@pytest.fixture
+def engine(tmp_path):
+    """File-backed SQLite with the qfind and agii schemas attached as databases"""
+    engine = create_engine(f"sqlite:///{tmp_path / 'main.db'}")
+
+    @event.listens_for(engine, "connect")
+    def attach(dbapi_connection, record):
+        for schema in (settings.DB_SCHEMA, settings.DB_AGII):
+            dbapi_connection.execute(f"ATTACH DATABASE '{tmp_path / schema}.db' AS {schema}")
+
+    yield engine
+    engine.dispose()
+
+
+@pytest.fixture
+def sessions(engine):
+    return sessionmaker(bind=engine, autoflush=False)
+
+
+@pytest.fixture
+def queries(engine):
+    """SQL statements executed on the engine while the test runs"""
+    statements = []
+    event.listen(engine, "before_cursor_execute", lambda conn, cursor, statement, *args: statements.append(statement))
+    return statements
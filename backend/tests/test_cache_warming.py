@@ -0,0 +1,104 @@
+import asyncio
+from contextlib import asynccontextmanager
+
+import pytest
+
+from app.api import cache_warming
+
+
+@asynccontextmanager
+async def no_session():
+    yield None
+
+
+class FakeMacro:
+    def __init__(self):
+        self.version = "v1"
+
+    async def get_available_dates_async(self, db):
+        return {"dates": ["2025-03-03"], "months": ["March 2025"]}
+
+    async def dashboard_version_async(self, sessions, day):
+        return day, {}, self.version
+
+
+class FakeFutures:
+    price_data = {"ES": None, "NQ": None}
+    data_version = 1.0
+
+
+@pytest.fixture
+def rendered(monkeypatch):
+    urls = []
+
+    async def refresh_entry(app, url, ttl=None):
+        assert ttl == 3600
+        urls.append(url)
+        return 200
+
+    monkeypatch.setattr(cache_warming, "refresh_entry", refresh_entry)
+    return urls
+
+
+def test_warmer_renders_only_after_a_change(rendered):
+    macro, futures = FakeMacro(), FakeFutures()
+    warmer = cache_warming.ResponseCacheWarmer(None, futures, macro, no_session, ttl=3600)
+
+    asyncio.run(warmer.run())
+    first = len(rendered)
+    asyncio.run(warmer.run())
+    assert len(rendered) == first
+
+    futures.data_version = 2.0
+    asyncio.run(warmer.run())
+    assert rendered[first:] == ["/api/futures/ES", "/api/futures/NQ"]
+
+    macro.version = "v2"
+    asyncio.run(warmer.run())
+    assert "/api/macro/dashboard" in rendered[first + 2:]
+    assert not any(url.startswith("/api/futures") for url in rendered[first + 2:])
+
+
+def test_warmer_skips_macro_while_its_version_is_unknown(rendered):
+    macro = FakeMacro()
+    macro.version = None
+    asyncio.run(cache_warming.ResponseCacheWarmer(None, FakeFutures(), macro, no_session, ttl=3600).run())
+
+    assert rendered == ["/api/futures/ES", "/api/futures/NQ"]
+
+
+def test_warmer_retries_a_failed_warm(monkeypatch):
+    statuses = iter([500, 200, 200, 200])
+    urls = []
+
+    async def refresh_entry(app, url, ttl=None):
+        urls.append(url)
+        return next(statuses)
+
+    monkeypatch.setattr(cache_warming, "refresh_entry", refresh_entry)
+    macro = FakeMacro()
+    macro.version = None
+    warmer = cache_warming.ResponseCacheWarmer(None, FakeFutures(), macro, no_session)
+
+    asyncio.run(warmer.run())
+    asyncio.run(warmer.run())
+    asyncio.run(warmer.run())
+
+    assert len(urls) == 4
+
+
+def test_warmer_renews_entries_before_they_expire(rendered, monkeypatch):
+    now = [1000.0]
+    monkeypatch.setattr(cache_warming.time, "monotonic", lambda: now[0])
+    warmer = cache_warming.ResponseCacheWarmer(None, FakeFutures(), FakeMacro(), no_session, ttl=3600)
+
+    asyncio.run(warmer.run())
+    first = len(rendered)
+    now[0] += 1799
+    asyncio.run(warmer.run())
+    assert len(rendered) == first
+
+    # Half the TTL has passed with no data change
+    now[0] += 1
+    asyncio.run(warmer.run())
+    assert len(rendered) == 2 * first
@@ -0,0 +1,76 @@
+from datetime import datetime
+
+import pytest
+
+from app.db.models import MacroAnalysisState, TrendingTicker
+from app.services.macro_service import MacroService, macro_state_changes
+from app.services.trending_service import ticker_changes
+
+
+class Owner:
+    def __init__(self):
+        self.invalidations = 0
+
+    def invalidate(self):
+        self.invalidations += 1
+
+
+@pytest.fixture
+def owner():
+    owner = Owner()
+    macro_state_changes.register(owner)
+    ticker_changes.register(owner)
+    return owner
+
+
+@pytest.fixture
+def db(engine, sessions):
+    for model in (MacroAnalysisState, TrendingTicker):
+        model.__table__.create(bind=engine)
+    with sessions() as db:
+        yield db
+
+
+def test_commit_invalidates_registered_owners(db, owner):
+    db.add(MacroAnalysisState(year_month_date=datetime(2025, 3, 1)))
+    db.flush()
+    assert owner.invalidations == 0
+
+    db.commit()
+    assert owner.invalidations == 1
+
+    # A commit without changes to the model leaves the caches alone
+    db.commit()
+    assert owner.invalidations == 1
+
+
+def test_rollback_discards_the_change(db, owner):
+    db.add(TrendingTicker(symbol="SPX", name="S&P 500", last_price=1.0, change=0.0, change_percent=0.0))
+    db.flush()
+    db.rollback()
+    db.commit()
+
+    assert owner.invalidations == 0
+
+
+def test_updates_and_deletes_invalidate(db, owner):
+    state = MacroAnalysisState(year_month_date=datetime(2025, 3, 1))
+    db.add(state)
+    db.commit()
+
+    state.remaining_days = 3
+    db.commit()
+    db.delete(state)
+    db.commit()
+
+    assert owner.invalidations == 3
+
+
+def test_services_register_themselves(db):
+    service = MacroService()
+    service._lookup_cache.set("dates", {"dates": []})
+
+    db.add(MacroAnalysisState(year_month_date=datetime(2025, 3, 1)))
+    db.commit()
+
+    assert len(service._lookup_cache) == 0
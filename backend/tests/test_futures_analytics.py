@@ -0,0 +1,84 @@
+import math
+
+import numpy as np
+import pytest
+
+from app.services.futures_analytics import RollingAnalytics, build_analytics
+from app.services.price_series import PriceSeries
+
+
+def batch_stats(prices, volumes):
+    """The per-request formulas FuturesService used before the rolling engine"""
+    daily_returns = [prices[i] / prices[i - 1] - 1 for i in range(1, len(prices))]
+    weighted = np.array(daily_returns[-10:]) * np.linspace(0.5, 1.0, min(10, len(daily_returns)))
+    daily_change = prices[-1] - prices[-2]
+    return {
+        "currentPrice": prices[-1],
+        "dailyChange": daily_change,
+        "dailyChangePercent": daily_change / prices[-2] * 100,
+        "volume": volumes[-1],
+        "openInterest": int(volumes[-1] * 1.5),
+        "volatility": round(np.std(daily_returns) * 100 * np.sqrt(252), 1),
+        "sentiment": max(min(np.mean(weighted) * 20, 1.0), -1.0),
+        "min": min(prices),
+        "max": max(prices),
+    }
+
+
+def random_series(n, seed=0):
+    rng = np.random.default_rng(seed)
+    prices = 100 * np.cumprod(1 + rng.normal(0, 0.02, n))
+    volumes = rng.integers(1000, 10000, n)
+    dates = np.datetime64("2024-01-01") + np.arange(n)
+    return PriceSeries(dates, prices, volumes)
+
+
+@pytest.mark.parametrize("n", [2, 3, 11, 250])
+def test_snapshot_matches_batch_formulas(n):
+    series = random_series(n, seed=n)
+    engine = build_analytics(series)
+    expected = batch_stats(series.prices.tolist(), series.volumes.tolist())
+
+    snapshot = engine.snapshot()
+    for key in ("currentPrice", "dailyChange", "dailyChangePercent", "volume", "openInterest", "volatility"):
+        assert snapshot[key] == pytest.approx(expected[key]), key
+    assert snapshot["sentiment"] == pytest.approx(expected["sentiment"])
+    assert engine.min_price == expected["min"]
+    assert engine.max_price == expected["max"]
+
+
+def test_sentiment_is_clamped():
+    engine = RollingAnalytics()
+    for price in (100, 150, 225, 340):
+        engine.append(price, 1)
+    assert engine.sentiment == 1.0
+
+
+def test_windowed_min_max_match_brute_force():
+    series = random_series(200, seed=7)
+    engine = RollingAnalytics(range_window=15)
+    prices = series.prices.tolist()
+    for i, price in enumerate(prices):
+        engine.append(price, 1)
+        window = prices[max(0, i - 14):i + 1]
+        assert engine.min_price == min(window)
+        assert engine.max_price == max(window)
+
+
+def test_single_bar_has_no_change_and_no_volatility():
+    engine = RollingAnalytics()
+    engine.append(50.0, 10)
+    snapshot = engine.snapshot()
+    assert snapshot["dailyChange"] == 0
+    assert math.isnan(snapshot["volatility"])
+    assert snapshot["sentiment"] == 0
+
+
+def test_copy_is_independent_of_the_original():
+    series = random_series(50, seed=3)
+    engine = build_analytics(series)
+    before = engine.snapshot()
+    clone = engine.copy()
+    clone.append(1.0, 5)
+    assert engine.snapshot() == before
+    assert clone.min_price == 1.0 and engine.min_price > 1.0
@@ -0,0 +1,110 @@
+from datetime import datetime, timedelta
+
+import pytest
+from sqlalchemy import text, update
+
+from app.core.config import settings
+from app.db.models import FuturesPrice
+from app.services import futures_db, futures_service
+from app.services.futures_analytics import RollingAnalytics, build_analytics
+from app.services.futures_service import FuturesService
+
+START = datetime(2025, 1, 1)
+OLD_WRITE = datetime(2024, 1, 1)
+
+
+def bars(symbol, first, count, base=100.0):
+    return [
+        {"symbol": symbol, "timestamp": START + timedelta(days=i), "price": base + i % 7 - i * 0.1, "volume": 1000 + i}
+        for i in range(first, first + count)
+    ]
+
+
+def age_rows(db):
+    """Backdate every row so the next write gets a newer updated_at (SQLite's now() has 1s resolution)"""
+    db.execute(update(FuturesPrice).values(updated_at=OLD_WRITE))
+    db.commit()
+
+
+@pytest.fixture
+def service(engine, sessions, monkeypatch):
+    FuturesPrice.__table__.create(engine)
+    with sessions() as db:
+        futures_db.upsert_futures_prices(db, bars("ES", 0, 100) + bars("NQ", 0, 60, base=200.0))
+        age_rows(db)
+    monkeypatch.setattr(settings, "FUTURES_SOURCE", "db")
+    monkeypatch.setattr(settings, "FUTURES_DB_TAIL_BARS", 20)
+    monkeypatch.setattr(futures_service, "SessionLocal", sessions)
+    return FuturesService()
+
+
+def full_series(sessions, symbol):
+    with sessions() as db:
+        return futures_db.query_price_range(db, symbol)
+
+
+def test_only_the_tail_is_held_but_stats_cover_all_history(service, sessions):
+    tail = service.price_data["ES"]
+    assert len(tail) == 20
+    assert service._dataset.analytics["ES"].count == 100
+    assert service.stats["ES"]["volatility"] == build_analytics(full_series(sessions, "ES")).snapshot()["volatility"]
+
+
+def test_reload_folds_in_only_rows_written_since(service, sessions, monkeypatch):
+    appended = []
+    original = RollingAnalytics.append
+    monkeypatch.setattr(RollingAnalytics, "append", lambda self, p, v: (appended.append(p), original(self, p, v)))
+    with sessions() as db:
+        futures_db.upsert_futures_prices(db, bars("ES", 100, 2))
+    assert service.reload_if_changed() is True
+
+    assert len(appended) == 2
+    assert service._dataset.analytics["ES"].count == 102
+    assert len(service.price_data["ES"]) == 20
+    assert service.stats["ES"] == {
+        **build_analytics(full_series(sessions, "ES")).snapshot(),
+        "support": service.stats["ES"]["support"],
+        "resistance": service.stats["ES"]["resistance"],
+    }
+
+
+def test_refetching_unchanged_bars_keeps_the_version(service, sessions):
+    with sessions() as db:
+        futures_db.upsert_futures_prices(db, bars("ES", 95, 5))
+    assert service.reload_if_changed() is False
+
+
+def test_revised_old_bar_replays_full_history(service, sessions):
+    revised = bars("ES", 10, 1)
+    revised[0]["price"] = 150.0
+    with sessions() as db:
+        futures_db.upsert_futures_prices(db, revised)
+    assert service.reload_if_changed() is True
+    assert service._dataset.analytics["ES"].max_price == 150.0
+    assert service._dataset.analytics["ES"].count == 100
+
+
+def test_ranges_inside_the_tail_are_served_from_memory(service, sessions, queries):
+    with sessions() as db:
+        recent = service.get_futures_data("ES", start=(START + timedelta(days=90)).date(), db=db)
+        assert not queries
+        everything = service.get_futures_data("ES", db=db)
+    assert len(recent["priceHistory"]) == 10
+    assert len(everything["priceHistory"]) == 100
+    assert len(queries) == 1
+
+
+def test_batch_history_past_the_tail_reads_the_table(service, sessions):
+    with sessions() as db:
+        result = service.get_futures_batch(["ES", "NQ"], history=True, db=db)
+    assert len(result["history"]["dates"]) == 100
+    assert result["history"]["prices"]["NQ"][-1] is None
+
+
+def test_data_version_reads_the_updated_at_index(service, sessions):
+    with sessions() as db:
+        assert futures_db.data_version(db) == OLD_WRITE
+        plan = db.execute(text(
+            f"EXPLAIN QUERY PLAN SELECT max(updated_at) FROM {settings.DB_SCHEMA}.futures_prices"
+        )).all()
+    assert "ix_futures_prices_updated_at" in " ".join(row[-1] for row in plan)
@@ -0,0 +1,76 @@
+import os
+
+import pandas as pd
+import pytest
+
+from app.core.config import settings
+from app.services.futures_analytics import RollingAnalytics, build_analytics
+from app.services.futures_service import SYMBOL_MAPPING, FuturesService
+
+
+def write_csv(path, columns, mtime, periods=30):
+    """columns maps names to a constant price or a list of prices"""
+    dates = pd.bdate_range("2025-01-01", periods=periods)
+    frame = pd.DataFrame(
+        {name: prices if isinstance(prices, list) else [prices] * periods for name, prices in columns.items()},
+        index=pd.Index(dates.strftime("%Y-%m-%d"), name="Date"),
+    )
+    frame.to_csv(path)
+    os.utime(path, (mtime, mtime))
+
+
+@pytest.fixture
+def service(tmp_path, monkeypatch):
+    path = str(tmp_path / "prices.csv")
+    write_csv(path, {SYMBOL_MAPPING["ES"]: 5000.0}, mtime=1_000_000)
+    monkeypatch.setattr(settings, "FUTURES_DATA_PATH", path)
+    monkeypatch.setattr(settings, "FUTURES_SOURCE", "file")
+    return FuturesService()
+
+
+def test_unchanged_file_is_not_reloaded(service):
+    assert service.stats["ES"]["currentPrice"] == 5000.0
+    assert service.reload_if_changed() is False
+    assert service.reload_stats["reloads"] == 0
+
+
+def test_failed_reload_is_retried_until_it_succeeds(service):
+    # A file with no futures columns fails to load and the old dataset stays live
+    write_csv(service.data_path, {"unrelated": 1.0}, mtime=1_000_100)
+    assert service.reload_if_changed() is False
+    assert service.reload_if_changed() is False
+    assert service.reload_stats["failures"] == 2
+    assert service.stats["ES"]["currentPrice"] == 5000.0
+
+    write_csv(service.data_path, {SYMBOL_MAPPING["ES"]: 5100.0}, mtime=1_000_200)
+    assert service.reload_if_changed() is True
+    assert service.stats["ES"]["currentPrice"] == 5100.0
+    assert service.reload_if_changed() is False
+
+
+def test_reload_pushes_only_appended_bars(service, monkeypatch):
+    prices = [5000.0 + i for i in range(30)]
+    write_csv(service.data_path, {SYMBOL_MAPPING["ES"]: prices}, mtime=1_000_100)
+    service.reload_if_changed()
+    engine = service._dataset.analytics["ES"]
+
+    appended = []
+    original = RollingAnalytics.append
+    monkeypatch.setattr(RollingAnalytics, "append", lambda self, p, v: (appended.append(p), original(self, p, v)))
+    write_csv(service.data_path, {SYMBOL_MAPPING["ES"]: prices + [5100.0, 4950.0]}, mtime=1_000_200, periods=32)
+    assert service.reload_if_changed() is True
+
+    assert appended == [5100.0, 4950.0]
+    extended = service._dataset.analytics["ES"]
+    assert extended is not engine and engine.count == 30
+    assert extended.snapshot() == build_analytics(service.price_data["ES"]).snapshot()
+
+
+def test_reload_replays_history_when_older_bars_change(service, monkeypatch):
+    appended = []
+    original = RollingAnalytics.append
+    monkeypatch.setattr(RollingAnalytics, "append", lambda self, p, v: (appended.append(p), original(self, p, v)))
+    revised = [4900.0] + [5000.0] * 30
+    write_csv(service.data_path, {SYMBOL_MAPPING["ES"]: revised}, mtime=1_000_100, periods=31)
+    assert service.reload_if_changed() is True
+    assert appended == revised
@@ -0,0 +1,40 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from app.services.indicators import compute_indicators
+from app.services.price_series import PriceSeries
+
+
+def series(prices, step=1):
+    dates = np.datetime64("2025-01-01") + np.arange(len(prices)) * step
+    return PriceSeries(dates, prices, np.ones(len(prices), dtype=np.int64))
+
+
+def test_indicators_ignore_other_contracts_calendars():
+    rng = np.random.default_rng(1)
+    daily = series(100 * np.cumprod(1 + rng.normal(0, 0.01, 120)))
+    # Trades every other day, so a shared date axis would give it filler bars
+    sparse = series(50 * np.cumprod(1 + rng.normal(0, 0.02, 60)), step=2)
+
+    together = compute_indicators({"A": daily, "B": sparse})
+    alone = compute_indicators({"B": sparse})
+    assert together["B"] == alone["B"]
+
+
+def test_values_match_their_definitions_over_own_bars():
+    prices = np.linspace(100, 159, 60)
+    result = compute_indicators({"UP": series(prices)})["UP"]
+
+    assert result["sma"]["20"] == pytest.approx(prices[-20:].mean())
+    assert result["sma"]["50"] == pytest.approx(prices[-50:].mean())
+    assert result["ema"]["12"] == pytest.approx(pd.Series(prices).ewm(span=12, adjust=False).mean().iloc[-1])
+    assert result["atr"] == pytest.approx(1.0)
+    assert result["bollinger"]["middle"] == pytest.approx(prices[-20:].mean())
+
+
+def test_short_series_leave_long_windows_empty():
+    result = compute_indicators({"NEW": series(np.linspace(10, 20, 30)), "OLD": series(np.linspace(10, 20, 80))})
+    assert result["NEW"]["sma"]["50"] is None
+    assert result["OLD"]["sma"]["50"] is not None
+    assert len(result["NEW"]["support"]) == 3
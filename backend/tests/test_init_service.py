@@ -0,0 +1,27 @@
+from types import SimpleNamespace
+
+from app.db import models
+from app.services import init_service
+from app.services.news_search import _format_hit
+
+
+def test_init_db_creates_extensions_before_tables(monkeypatch):
+    calls = []
+    for name in ("ensure_extensions", "migrate_macro_json_columns", "ensure_search_support", "ensure_indexes"):
+        monkeypatch.setattr(init_service, name, lambda name=name: calls.append(name))
+    monkeypatch.setattr(models.Base.metadata, "create_all", lambda bind: calls.append("create_all"))
+
+    init_service.init_db()
+
+    assert calls == ["ensure_extensions", "create_all", "migrate_macro_json_columns",
+                     "ensure_search_support", "ensure_indexes"]
+
+
+def test_search_hit_without_url_or_headline():
+    row = SimpleNamespace(id=1, date=None, category="[]", headline=None, kor_headline=None,
+                          url=None, body=None, kor_body=None, score=None)
+
+    hit = _format_hit(row)
+
+    assert hit["url"] is None
+    assert hit["title"] is None
@@ -0,0 +1,61 @@
+import asyncio
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from app import main
+from app.api.routes import system
+from app.core.config import settings
+from app.services import jobs
+
+
+@pytest.fixture
+def clean_scheduler():
+    yield jobs.scheduler
+    jobs.scheduler.jobs.clear()
+
+
+def test_futures_reload_is_scheduled_without_the_scheduler(monkeypatch, clean_scheduler):
+    monkeypatch.setattr(main, "init_db", lambda: None)
+    monkeypatch.setattr(settings, "SCHEDULER_ENABLED", False)
+
+    async def start_and_stop():
+        async with main.lifespan(main.app):
+            return set(clean_scheduler.jobs)
+
+    assert asyncio.run(start_and_stop()) == {"futures-reload"}
+
+
+@pytest.mark.parametrize("installed", [True, False])
+def test_market_refresh_needs_yfinance(monkeypatch, clean_scheduler, installed):
+    monkeypatch.setattr(jobs.importlib.util, "find_spec", lambda name: object() if installed else None)
+
+    jobs.register_jobs(None, None)
+
+    assert ("market-data-refresh" in clean_scheduler.jobs) is installed
+    assert "macro-precompute" in clean_scheduler.jobs
+
+
+@pytest.fixture
+def client(clean_scheduler):
+    clean_scheduler.add("noop", lambda: None, every=3600)
+    app = FastAPI()
+    app.include_router(system.router, prefix="/api/system")
+    return TestClient(app)
+
+
+@pytest.mark.parametrize("configured, sent, expected", [
+    ("", None, 403),
+    ("", "", 403),
+    ("secret", None, 401),
+    ("secret", "wrong", 401),
+    ("secret", "secret", 200),
+])
+def test_running_a_job_needs_the_admin_key(monkeypatch, client, configured, sent, expected):
+    monkeypatch.setattr(settings, "ADMIN_API_KEY", configured)
+    headers = {} if sent is None else {"X-API-Key": sent}
+
+    response = client.post("/api/system/jobs/noop/run", headers=headers)
+
+    assert response.status_code == expected
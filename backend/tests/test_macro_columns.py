@@ -0,0 +1,69 @@
+from datetime import datetime
+
+import pytest
+from sqlalchemy import event
+from sqlalchemy.exc import InvalidRequestError
+
+from app.db.models import KoreanNews, MacroAnalysisState, News
+from app.services.macro_service import (
+    ANALYSIS_SECTIONS, INDICATOR_GROUPS, INDICATOR_MAPPING, STATE_GROUPS, MacroService, day_range,
+)
+
+LIGHT_COLUMNS = 9
+
+
+@pytest.fixture
+def db(engine, sessions):
+    for model in (MacroAnalysisState, News, KoreanNews):
+        model.__table__.create(bind=engine)
+    with sessions() as db:
+        db.add(MacroAnalysisState(
+            id=1,
+            year_month_date=datetime(2025, 3, 1),
+            economic_indicator_values={name: 1.0 for name in INDICATOR_MAPPING},
+            final_analysis_results={"GDP": {"stock_market_final": "up"}},
+            news_items=["x" * 10000],
+        ))
+        db.commit()
+        yield db
+
+
+@pytest.fixture
+def widths(engine):
+    """Number of columns in each result set fetched while the test runs"""
+    found = []
+    event.listen(engine, "after_cursor_execute",
+                 lambda conn, cursor, *args: found.append(len(cursor.description or ())))
+    return found
+
+
+def test_lookup_statements_select_only_what_they_use(db, widths):
+    service = MacroService()
+    db.execute(service._dates_statement()).all()
+    db.execute(service._state_statement(2025, 3)).all()
+    db.execute(service._news_statement(*day_range(datetime(2025, 3, 1)))).all()
+
+    assert widths == [1, 2, 8]
+
+
+def test_indicators_extract_keys_instead_of_documents(db, widths):
+    row = db.execute(MacroService()._indicators_statement(1)).first()
+
+    # One scalar per indicator and one per analysis section of each indicator
+    assert widths == [len(INDICATOR_MAPPING) * (1 + len(ANALYSIS_SECTIONS))]
+    assert row[0] == 1.0
+
+
+@pytest.mark.parametrize("groups", [(), ("indicators",), INDICATOR_GROUPS, tuple(STATE_GROUPS)])
+def test_entity_load_selects_only_the_requested_groups(db, widths, groups):
+    db.execute(MacroService()._state_entity_statement(1, groups)).scalars().first()
+
+    assert widths == [LIGHT_COLUMNS + sum(len(STATE_GROUPS[group]) for group in groups)]
+
+
+def test_columns_outside_the_requested_groups_raise(db):
+    state = db.execute(MacroService()._state_entity_statement(1, ("indicators",))).scalars().first()
+
+    assert state.economic_indicator_values["GDP"] == 1.0
+    with pytest.raises(InvalidRequestError):
+        state.news_items
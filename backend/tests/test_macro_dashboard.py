@@ -0,0 +1,81 @@
+import asyncio
+from contextlib import asynccontextmanager
+from datetime import datetime
+from types import SimpleNamespace
+
+from app.services.macro_service import MacroService
+
+DATES = {"dates": ["2025-03-03"], "months": ["March 2025"]}
+VERSION = (("2025-03-03", ("March 2025",), "indicators", "news"), None)
+
+
+class FailingSession:
+    async def execute(self, stmt):
+        raise RuntimeError("connection reset")
+
+
+@asynccontextmanager
+async def session():
+    yield FailingSession()
+
+
+def test_news_query_failure_is_marked_as_an_error():
+    result = asyncio.run(MacroService().get_macro_news_async(FailingSession(), "2025-03-03"))
+
+    assert result["news"] == []
+    assert "error" in result
+
+
+def dashboard(service, **parts):
+    async def indicators(db, month):
+        return parts.get("indicators", {"month": month, "indicators": {}})
+
+    async def news(db, date_str):
+        return parts.get("news", {"date": date_str, "news": [], "next_cursor": None})
+
+    service.get_economic_indicators_async = indicators
+    service.get_macro_news_async = news
+    return asyncio.run(service.get_dashboard_async(session, "2025-03-03", DATES, VERSION))
+
+
+def test_dashboard_caches_a_complete_payload():
+    service = MacroService()
+    first = dashboard(service)
+
+    assert dashboard(service, news={"failed": True}) is first
+
+
+def test_dashboard_does_not_cache_failed_news():
+    service = MacroService()
+    failed = dashboard(service, news={"date": "2025-03-03", "news": [], "error": "Unable to retrieve macro news"})
+    retried = dashboard(service)
+
+    assert "error" in failed["news"]
+    assert "error" not in retried["news"]
+
+
+def test_dashboard_does_not_cache_failed_indicators():
+    service = MacroService()
+    dashboard(service, indicators={"month": "March 2025", "indicators": {}, "error": "x"})
+
+    assert "error" not in dashboard(service)["indicators"]
+
+
+class BrokenStream:
+    """Session whose news cursor fails after the first row"""
+
+    async def stream(self, stmt):
+        async def rows():
+            yield SimpleNamespace(id=1, headline="Rates", date=datetime(2025, 3, 3, 9), category="[]",
+                                  url="https://example.com", body="body", kor_headline="금리", kor_body="본문")
+            raise RuntimeError("connection reset")
+        return rows()
+
+
+def test_stream_failure_ends_with_an_error_line():
+    async def collect():
+        return [item async for item in MacroService().iter_macro_news_async(BrokenStream(), "2025-03-03")]
+
+    lines = asyncio.run(collect())
+
+    assert [list(line)[0] for line in lines] == ["date", "id", "error"]
@@ -0,0 +1,32 @@
+import json
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from app.api.routes import macro
+from app.db.database import get_async_db
+from tests.test_macro_dashboard import BrokenStream
+
+
+@pytest.fixture
+def client():
+    async def broken_db():
+        yield BrokenStream()
+
+    app = FastAPI()
+    app.include_router(macro.router, prefix="/api/macro")
+    app.dependency_overrides[get_async_db] = broken_db
+    return TestClient(app)
+
+
+@pytest.mark.parametrize("conditional", [{}, {"If-None-Match": "*"}])
+def test_ndjson_stream_has_no_validators(client, conditional):
+    response = client.get("/api/macro/news", params={"date": "2025-03-03"},
+                          headers={"Accept": "application/x-ndjson", **conditional})
+
+    assert response.status_code == 200
+    assert response.headers["cache-control"] == "no-store"
+    assert "etag" not in response.headers and "last-modified" not in response.headers
+    lines = [json.loads(line) for line in response.text.splitlines()]
+    assert "error" in lines[-1]
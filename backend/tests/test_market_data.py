@@ -0,0 +1,58 @@
+import sys
+import types
+
+import pandas as pd
+import pytest
+
+from app.services.market_data import SYMBOLS, FixtureSource, MarketDataFetcher, MarketDataSource, YFinanceSource
+from app.services.price_series import read_price_csv
+
+ES = "S&P 500 선물"
+GOLD = "골드"
+
+
+def write_frame(path, closes):
+    frame = pd.DataFrame({name: pd.Series(values) for name, values in closes.items()})
+    frame.index = pd.to_datetime(frame.index)
+    frame.index.name = "Date"
+    frame.to_csv(path, date_format="%Y-%m-%d")
+
+
+def test_source_interface_is_abstract():
+    with pytest.raises(TypeError):
+        MarketDataSource()
+
+
+def test_incremental_run_refetches_the_overlap_and_appends_new_closes(tmp_path):
+    stored = tmp_path / "prices.csv"
+    upstream = tmp_path / "upstream.csv"
+    # The last stored close was written mid-session; upstream now has its final value
+    write_frame(stored, {ES: {"2025-03-03": 5000.0, "2025-03-04": 5010.0, "2025-03-05": 5015.5}})
+    write_frame(upstream, {ES: {"2025-03-04": 5010.0, "2025-03-05": 5021.0, "2025-03-06": 5030.0}})
+
+    fetcher = MarketDataFetcher(FixtureSource(str(upstream)), str(stored), symbols={ES: "ES=F"})
+    fetcher.run()
+
+    merged = read_price_csv(str(stored))
+    assert merged[ES].tolist() == [5000.0, 5010.0, 5021.0, 5030.0]
+
+
+def test_yfinance_source_fetches_each_ticker_separately(tmp_path, monkeypatch):
+    requested = []
+
+    class FakeTicker:
+        def __init__(self, ticker):
+            self.ticker = ticker
+
+        def history(self, interval, period=None, start=None):
+            requested.append(self.ticker)
+            index = pd.DatetimeIndex(["2025-03-03", "2025-03-04"], tz="America/New_York")
+            return pd.DataFrame({"Close": [len(self.ticker), len(self.ticker) + 1.0]}, index=index)
+
+    monkeypatch.setitem(sys.modules, "yfinance", types.SimpleNamespace(Ticker=FakeTicker))
+    fetcher = MarketDataFetcher(YFinanceSource(), str(tmp_path / "prices.csv"), max_workers=4)
+    merged = fetcher.run()
+
+    assert sorted(requested) == sorted(SYMBOLS.values())
+    assert list(merged.columns) == list(SYMBOLS)
+    assert merged.loc["2025-03-04", GOLD] == len(SYMBOLS[GOLD]) + 1.0
@@ -0,0 +1,58 @@
+from datetime import datetime, timedelta
+
+import pytest
+from sqlalchemy import text
+
+from app.db.models import KoreanNews, MacroAnalysisState, News
+from app.services.macro_service import MacroService, day_range
+
+
+@pytest.fixture
+def db(engine, sessions):
+    for model in (MacroAnalysisState, News, KoreanNews):
+        model.__table__.create(bind=engine)
+
+    start = datetime(2025, 1, 1)
+    with sessions() as db:
+        for month in range(1, 13):
+            db.add(MacroAnalysisState(year_month_date=datetime(2025, month, 1)))
+        for i in range(200):
+            fields = dict(id=i + 1, date=start + timedelta(hours=6 * i), category="macro",
+                          headline=f"headline {i}", body="body", source="test")
+            db.add(News(**fields))
+            db.add(KoreanNews(**fields))
+        db.commit()
+        yield db
+
+
+def query_plan(db, stmt) -> str:
+    """EXPLAIN QUERY PLAN details for a statement, joined into one string"""
+    sql = stmt.compile(dialect=db.get_bind().dialect, compile_kwargs={"literal_binds": True})
+    return " | ".join(row[-1] for row in db.execute(text(f"EXPLAIN QUERY PLAN {sql}")))
+
+
+def test_month_lookup_searches_the_year_month_index(db):
+    plan = query_plan(db, MacroService()._state_statement(2025, 3))
+
+    assert "SEARCH" in plan
+    assert "ix_qfind_macro_analysis_states_year_month_date" in plan
+    assert "SCAN" not in plan
+
+
+def test_day_news_searches_the_date_id_index(db):
+    plan = query_plan(db, MacroService()._news_statement(*day_range(datetime(2025, 1, 10))))
+
+    # The day range drives the join through the (date, id) index, then the
+    # translation is looked up by primary key
+    assert "USING INDEX ix_agii_market_news_date_id (date>? AND date<?)" in plan
+    assert "USING INTEGER PRIMARY KEY" in plan
+    assert "SCAN" not in plan
+
+
+def test_news_cursor_page_stays_on_the_index(db):
+    day_start, day_end = day_range(datetime(2025, 1, 10))
+    stmt = MacroService()._news_statement(day_start, day_end, cursor=(day_start + timedelta(hours=12), 38))
+    plan = query_plan(db, stmt)
+
+    assert "ix_agii_market_news_date_id" in plan
+    assert "SCAN" not in plan
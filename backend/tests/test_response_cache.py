@@ -0,0 +1,205 @@
+import asyncio
+import fnmatch
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from app.api.conditional import NO_STORE_HEADERS
+from app.api.response_cache import MemoryBackend, RedisBackend, ResponseCache, ResponseCacheMiddleware, refresh_entry
+from app.api.routes import macro
+from app.core.cache import LRUCache
+from app.db.database import get_async_db
+
+JSON = [(b"content-type", b"application/json")]
+
+
+class FakeRedis:
+    """The slice of redis.asyncio.Redis used by RedisBackend, backed by a dict"""
+
+    def __init__(self):
+        self.data = {}
+        self.ttls = {}
+
+    async def get(self, key):
+        return self.data.get(key)
+
+    async def set(self, key, value, px=None):
+        assert isinstance(value, bytes)
+        self.data[key] = value
+        self.ttls[key] = px
+
+    async def scan_iter(self, match="*"):
+        for key in list(self.data):
+            if fnmatch.fnmatchcase(key, match):
+                yield key
+
+    async def delete(self, key):
+        self.data.pop(key, None)
+
+
+def test_redis_backend_round_trips_entries():
+    client = FakeRedis()
+    backend = RedisBackend(client, prefix="test:")
+    entry = (200, JSON + [(b"etag", b'"abc"')], b'{"a": 1}\n{"b": 2}')
+
+    asyncio.run(backend.set("/api/x?", entry, ttl=1.5))
+
+    assert client.ttls["test:/api/x?"] == 1500
+    assert asyncio.run(backend.get("/api/x?")) == entry
+    assert asyncio.run(backend.get("/api/y?")) is None
+
+
+def test_redis_clear_only_drops_its_prefix():
+    client = FakeRedis()
+    client.data["other:key"] = b"kept"
+    backend = RedisBackend(client, prefix="test:")
+    asyncio.run(backend.set("a", (200, [], b"1"), ttl=10))
+    asyncio.run(backend.set("b", (200, [], b"2"), ttl=10))
+
+    asyncio.run(backend.clear())
+
+    assert client.data == {"other:key": b"kept"}
+
+
+def test_lru_is_bounded_by_bytes():
+    cache = LRUCache(maxsize=100, maxbytes=10, sizeof=len)
+    cache.set("a", b"aaaa")
+    cache.set("b", b"bbbb")
+    cache.get("a")
+    cache.set("c", b"cccc")
+
+    # "b" was least recently used, so it went to make room
+    assert cache.get("b", None) is None
+    assert cache.get("a") == b"aaaa" and cache.get("c") == b"cccc"
+    assert cache.nbytes == 8
+
+    cache.set("big", b"x" * 11)
+    assert cache.get("big", None) is None
+    cache.set("a", b"aa")
+    assert cache.nbytes == 6
+
+
+def test_memory_backend_charges_body_and_headers():
+    backend = MemoryBackend(maxsize=100, maxbytes=100)
+    asyncio.run(backend.set("a", (200, JSON, b"x" * 40), ttl=10))
+    asyncio.run(backend.set("b", (200, JSON, b"x" * 40), ttl=10))
+
+    assert asyncio.run(backend.get("a")) is None
+    assert asyncio.run(backend.get("b")) is not None
+
+
+@pytest.mark.parametrize("entry", [
+    (500, JSON, b"{}"),
+    (200, JSON + [(b"cache-control", NO_STORE_HEADERS["Cache-Control"].encode())], b'{"error": "x"}'),
+    (200, JSON + [(b"set-cookie", b"a=1")], b"{}"),
+    (200, JSON, b"x" * 101),
+])
+def test_store_skips_uncacheable_responses(entry):
+    client = FakeRedis()
+    cache = ResponseCache(RedisBackend(client), {"/": 10}, max_body=100)
+
+    asyncio.run(cache.store("key", entry, ttl=10))
+
+    assert client.data == {}
+    assert cache.stats["stored"] == 0
+
+
+def make_app(headers=(), delay=0.0):
+    calls = []
+
+    async def app(scope, receive, send):
+        calls.append(scope["path"])
+        await asyncio.sleep(delay)
+        await send({"type": "http.response.start", "status": 200, "headers": JSON + list(headers)})
+        await send({"type": "http.response.body", "body": b'{"n": %d}' % len(calls)})
+
+    return app, calls
+
+
+async def get(app, path, query=b""):
+    scope = {"type": "http", "method": "GET", "path": path, "query_string": query, "headers": []}
+    messages = []
+
+    async def receive():
+        return {"type": "http.request", "body": b"", "more_body": False}
+
+    async def send(message):
+        messages.append(message)
+
+    await app(scope, receive, send)
+    headers = dict(messages[0]["headers"])
+    return headers[b"x-cache"], messages[1]["body"]
+
+
+def test_middleware_serves_hits_from_a_shared_backend():
+    client = FakeRedis()
+    inner, calls = make_app()
+    app = ResponseCacheMiddleware(inner, ResponseCache(RedisBackend(client), {"/api": 10}, max_body=1000))
+
+    assert asyncio.run(get(app, "/api/x", b"b=2&a=1")) == (b"MISS", b'{"n": 1}')
+    # A second worker with its own middleware reads the same entry
+    other = ResponseCacheMiddleware(inner, ResponseCache(RedisBackend(client), {"/api": 10}, max_body=1000))
+    assert asyncio.run(get(other, "/api/x", b"a=1&b=2")) == (b"HIT", b'{"n": 1}')
+    assert calls == ["/api/x"]
+
+
+def test_refresh_replaces_the_entry_with_its_own_ttl():
+    client = FakeRedis()
+    inner, calls = make_app()
+    app = ResponseCacheMiddleware(inner, ResponseCache(RedisBackend(client), {"/api": 10}, max_body=1000))
+    asyncio.run(get(app, "/api/x"))
+
+    assert asyncio.run(refresh_entry(app, "/api/x", ttl=3600)) == 200
+    assert client.ttls["qfind:response:/api/x?"] == 3600 * 1000
+    assert asyncio.run(get(app, "/api/x")) == (b"HIT", b'{"n": 2}')
+
+    # Without a ttl the path's TTL applies
+    asyncio.run(refresh_entry(app, "/api/x"))
+    assert client.ttls["qfind:response:/api/x?"] == 10 * 1000
+
+
+def test_concurrent_misses_run_the_handler_once():
+    inner, calls = make_app(delay=0.05)
+    cache = ResponseCache(MemoryBackend(maxsize=10), {"/api": 10}, max_body=1000)
+    app = ResponseCacheMiddleware(inner, cache)
+
+    async def burst():
+        return await asyncio.gather(*(get(app, "/api/x") for _ in range(5)))
+
+    results = asyncio.run(burst())
+
+    assert calls == ["/api/x"]
+    assert sorted(state for state, _ in results) == [b"COALESCED"] * 4 + [b"MISS"]
+    assert {body for _, body in results} == {b'{"n": 1}'}
+
+
+def test_no_store_responses_are_rendered_every_time():
+    inner, calls = make_app(headers=[(b"cache-control", b"no-store")])
+    app = ResponseCacheMiddleware(inner, ResponseCache(MemoryBackend(maxsize=10), {"/api": 10}, max_body=1000))
+
+    asyncio.run(get(app, "/api/x"))
+    assert asyncio.run(get(app, "/api/x")) == (b"MISS", b'{"n": 2}')
+
+
+def test_macro_error_payloads_are_not_cached(monkeypatch):
+    async def failing_dates(db):
+        return {"dates": [], "months": [], "error": "Unable to retrieve available dates"}
+
+    async def no_db():
+        yield None
+
+    monkeypatch.setattr(macro.macro_service, "get_available_dates_async", failing_dates)
+    app = FastAPI()
+    app.include_router(macro.router, prefix="/api/macro")
+    app.dependency_overrides[get_async_db] = no_db
+    cache = ResponseCache(MemoryBackend(maxsize=10), {"/api/macro/dates": 300}, max_body=100000)
+    app.add_middleware(ResponseCacheMiddleware, cache=cache)
+
+    with TestClient(app) as client:
+        first = client.get("/api/macro/dates")
+        second = client.get("/api/macro/dates")
+
+    assert first.headers["cache-control"] == "no-store"
+    assert second.headers["x-cache"] == "MISS"
+    assert cache.stats["stored"] == 0
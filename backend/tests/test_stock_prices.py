@@ -0,0 +1,86 @@
+from datetime import datetime, timedelta, timezone
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from app.api.routes import stock
+from app.core.config import settings
+from app.db.database import get_db
+from app.db.models import Stock, StockPrice
+from app.services import stock_service
+
+KST = timezone(timedelta(hours=9))
+
+
+@pytest.fixture
+def stock_id(engine, sessions):
+    for model in (Stock, StockPrice):
+        model.__table__.create(bind=engine)
+    with sessions() as db:
+        db.add(Stock(id=1, symbol="TSLA", name="Tesla, Inc."))
+        db.commit()
+        stock_service.insert_stock_prices(db, 1, [
+            # 09:00 and 09:30 UTC on the same day, one given in KST
+            {"timestamp": datetime(2025, 3, 3, 9, 0), "price": 10.0, "volume": 1},
+            {"timestamp": datetime(2025, 3, 3, 18, 30, tzinfo=KST), "price": 12.0, "volume": 2},
+        ])
+    return 1
+
+
+@pytest.mark.parametrize("start, end", [
+    (datetime(2025, 3, 3), datetime(2025, 3, 4, tzinfo=timezone.utc)),
+    (datetime(2025, 3, 3, 9, tzinfo=KST), datetime(2025, 3, 4)),
+    (None, datetime(2025, 3, 4, tzinfo=KST)),
+])
+def test_naive_and_aware_bounds_mix(sessions, stock_id, start, end):
+    with sessions() as db:
+        result = stock_service.get_price_bars(db, stock_id, "1h", start, end)
+
+    assert result["bars"] == [{
+        "timestamp": "2025-03-03T09:00:00+00:00", "open": 10.0, "high": 12.0,
+        "low": 10.0, "close": 12.0, "volume": 3,
+    }]
+    assert result["end"].endswith("+00:00")
+
+
+def test_default_range_ends_now_in_utc(sessions, stock_id):
+    with sessions() as db:
+        result = stock_service.get_price_bars(db, stock_id, "1d")
+
+    end = datetime.fromisoformat(result["end"])
+    assert end.tzinfo is not None
+    assert abs(datetime.now(timezone.utc) - end) < timedelta(minutes=1)
+
+
+@pytest.fixture
+def client(sessions, stock_id, monkeypatch):
+    monkeypatch.setattr(settings, "ADMIN_API_KEY", "secret")
+
+    def db():
+        with sessions() as session:
+            yield session
+
+    app = FastAPI()
+    app.include_router(stock.router, prefix="/api/stock")
+    app.dependency_overrides[get_db] = db
+    return TestClient(app)
+
+
+def test_ingest_needs_the_admin_key(client):
+    batch = {"prices": [{"timestamp": "2025-03-03T10:00:00Z", "price": 11.0, "volume": 5}]}
+
+    assert client.post("/api/stock/TSLA/prices", json=batch).status_code == 401
+    response = client.post("/api/stock/TSLA/prices", json=batch, headers={"X-API-Key": "secret"})
+
+    assert response.status_code == 200
+    assert response.json() == {"symbol": "TSLA", "inserted": 1}
+
+
+def test_prices_route_accepts_offset_bounds(client):
+    response = client.get("/api/stock/TSLA/prices", params={
+        "interval": "1h", "start": "2025-03-03T18:00:00+09:00", "end": "2025-03-03T10:00:00",
+    })
+
+    assert response.status_code == 200
+    assert [bar["volume"] for bar in response.json()["bars"]] == [3]
@@ -0,0 +1,35 @@
+import asyncio
+from datetime import date, datetime
+
+import numpy as np
+from fastapi.responses import ORJSONResponse
+
+from app.api.streaming import _aencode, _encode
+
+RECORDS = [
+    {"date": date(2025, 3, 3)},
+    {"title": "금리 동결", "at": datetime(2025, 3, 3, 9, 30), "prices": np.array([1.5, 2.0]), 1: "key"},
+]
+
+
+def expected() -> bytes:
+    return b"".join(ORJSONResponse(record).body + b"\n" for record in RECORDS)
+
+
+def test_lines_match_orjson_responses():
+    assert b"".join(_encode(iter(RECORDS))) == expected()
+
+
+def test_async_lines_match_orjson_responses():
+    async def records():
+        for record in RECORDS:
+            yield record
+
+    async def collect():
+        return [chunk async for chunk in _aencode(records())]
+
+    chunks = asyncio.run(collect())
+
+    # The header line is flushed on its own
+    assert chunks[0] == b'{"date":"2025-03-03"}\n'
+    assert b"".join(chunks) == expected()
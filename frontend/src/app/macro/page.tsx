@@ -1,18 +1,13 @@
 'use client'
 
-import React, { useState, useEffect } from 'react';
+import React, { useState, useEffect, useRef } from 'react';
 import Layout from '@/components/layout/Layout';
 import { DayPicker } from 'react-day-picker';
 import 'react-day-picker/dist/style.css';
 import NewsSection from '@/components/news/NewsSection';
 
 
-import {
-    fetchEconomicIndicators,
-    fetchDailyAnalysis,
-    fetchMacroNews,
-    fetchAvailableDates
-} from '@/services/macro';
+import { fetchMacroDashboard } from '@/services/macro';
 
 // Helper function to format dates instead of using date-fns
 const formatDate = (dateString: string) => {
@@ -22,6 +17,15 @@ const formatDate = (dateString: string) => {
 };
 
 
+const MONTH_NAMES = ['January', 'February', 'March', 'April', 'May', 'June', 'July',
+    'August', 'September', 'October', 'November', 'December'];
+
+// "March 2025" for "2025-03-28", the backend's "%B %Y" month label. Read from
+// the string itself, since new Date("2025-03-01") is UTC midnight and lands in
+// the previous month in time zones west of UTC
+const monthLabel = (dateString: string) =>
+    `${MONTH_NAMES[Number(dateString.slice(5, 7)) - 1]} ${dateString.slice(0, 4)}`;
+
 // Dummy data for macro analysis
 type MacroAnalysisData = {
     // 7 days of sample data
@@ -495,67 +499,36 @@ const MacroPage = () => {
 
     const enabledDays = availableDates.map(date => new Date(date));
 
-    // Fetch available dates when component mounts
-    useEffect(() => {
-        const loadInitialData = async () => {
-            try {
-                setLoading(true);
-
-                // Get available dates first
-                const datesData = await fetchAvailableDates();
-                setAvailableDates(datesData.dates);
-
-                // Set most recent date as default
-                const mostRecentDate = datesData.dates[0];
-                const mostRecentMonth = String(new Date(mostRecentDate).getMonth() + 1);
-                setSelectedDate(mostRecentDate);
-
-                // Fetch data for the most recent date
-                const [indicatorsData, analysisData, newsData] = await Promise.all([
-                    fetchEconomicIndicators(mostRecentMonth),
-                    fetchDailyAnalysis(mostRecentDate),
-                    fetchMacroNews(mostRecentDate)
-                ]);
-
-                setIndicators(indicatorsData.indicators);
-                setDailyAnalysis(analysisData);
-                setNews(newsData.news);
-
-                setLoading(false);
-            } catch (error) {
-                console.error('Error loading macro data:', error);
-                setLoading(false);
-                // You could set some error state here
-            }
-        };
-
-        loadInitialData();
-    }, []);
-
-    // Fetch new data when date changes
-    useEffect(() => {
-        const updateDataForDate = async () => {
-            if (!selectedDate) return;
+    // Day whose dashboard is on screen, so selecting it again doesn't refetch
+    const loadedDate = useRef<string | null>(null);
 
-            try {
-                setLoading(true);
+    // One request returns the dates plus indicators, analysis and news for a
+    // day; without a date the backend picks the most recent one
+    const loadDashboard = async (date?: string) => {
+        try {
+            setLoading(true);
 
-                const [analysisData, newsData] = await Promise.all([
-                    fetchDailyAnalysis(selectedDate),
-                    fetchMacroNews(selectedDate)
-                ]);
+            const dashboard = await fetchMacroDashboard(date);
+            loadedDate.current = dashboard.date;
+            setAvailableDates(dashboard.dates.dates);
+            setSelectedDate(dashboard.date);
 
-                setDailyAnalysis(analysisData);
-                setNews(newsData.news);
+            setIndicators(dashboard.indicators.indicators);
+            setDailyAnalysis(dashboard.analysis);
+            setNews(dashboard.news.news);
 
-                setLoading(false);
-            } catch (error) {
-                console.error('Error updating data for date:', error);
-                setLoading(false);
-            }
-        };
+            setLoading(false);
+        } catch (error) {
+            console.error('Error loading macro data:', error);
+            setLoading(false);
+            // You could set some error state here
+        }
+    };
 
-        updateDataForDate();
+    // Fetch the dashboard when the selected date changes (and on mount)
+    useEffect(() => {
+        if (selectedDate && selectedDate === loadedDate.current) return;
+        loadDashboard(selectedDate || undefined);
     }, [selectedDate]);
 
 
@@ -577,28 +550,11 @@ const MacroPage = () => {
     if (loading) {
         console.log('Loading...');
     }
-    // Enhanced month change handler
-    const handleMonthChange = async (monthYear: string) => {
-        try {
-            setLoading(true);
-            const indicatorsData = await fetchEconomicIndicators(monthYear);
-            setIndicators(indicatorsData.indicators);
-
-            // Find the first date in this month to update daily analysis too
-            const [month, year] = monthYear.split(' ');
-            const monthNumber = new Date(`${month} 1, ${year}`).getMonth() + 1;
-            const monthPrefix = `${year}-${monthNumber.toString().padStart(2, '0')}`;
-
-            // Find the first date in this month from available dates
-            const firstDateInMonth = availableDates.find(date => date.startsWith(monthPrefix));
-            if (firstDateInMonth) {
-                setSelectedDate(firstDateInMonth);
-            }
-
-            setLoading(false);
-        } catch (error) {
-            console.error('Error updating indicators for month:', error);
-            setLoading(false);
+    // Jump to the latest available day of the month; its dashboard carries that month's indicators
+    const handleMonthChange = (monthYear: string) => {
+        const dateInMonth = availableDates.find(date => monthLabel(date) === monthYear);
+        if (dateInMonth) {
+            setSelectedDate(dateInMonth);
         }
     };
 
@@ -624,13 +580,11 @@ const MacroPage = () => {
                             <label className="mr-2 text-gray-600 text-sm">Month:</label>
                             <select
                                 className="bg-white border rounded-md px-3 py-1 text-gray-700 text-sm"
+                                value={selectedDate ? monthLabel(selectedDate) : ''}
                                 onChange={(e) => handleMonthChange(e.target.value)}
                             >
                                 {availableDates.length > 0 ? (
-                                    Array.from(new Set(availableDates.map(date => {
-                                        const d = new Date(date);
-                                        return `${d.toLocaleString('en-US', { month: 'long' })} ${d.getFullYear()}`;
-                                    }))).map(monthYear => (
+                                    Array.from(new Set(availableDates.map(monthLabel))).map(monthYear => (
                                         <option key={monthYear} value={monthYear}>
                                             {monthYear}
                                         </option>
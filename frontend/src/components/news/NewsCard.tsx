@@ -18,6 +18,19 @@ interface NewsCardProps {
   item: NewsItem;
 }
 
+// The API sends absolute ISO timestamps (so its responses stay cacheable);
+// the relative age is worked out here at render time
+const formatNewsAge = (date: string) => {
+  const published = new Date(date).getTime();
+  if (isNaN(published)) return date;
+
+  const minutes = Math.max(0, Math.floor((Date.now() - published) / 60000));
+  if (minutes < 60) return `${minutes} min ago`;
+  const hours = Math.floor(minutes / 60);
+  if (hours < 24) return `${hours} hours ago`;
+  return `${Math.floor(hours / 24)} days ago`;
+};
+
 const NewsCard: React.FC<NewsCardProps> = ({ item }) => {
   const [isModalOpen, setIsModalOpen] = useState(false);
   const [isTranslating, setIsTranslating] = useState(false);
@@ -40,6 +53,8 @@ const NewsCard: React.FC<NewsCardProps> = ({ item }) => {
     (item.body.length > 100 ? `${item.body.substring(0, 100)}...` : item.body) : 
     "No preview available";
     
+  const newsAge = formatNewsAge(item.date);
+    
   const korBodyPreview = item.kor_body ? 
     (item.kor_body.length > 100 ? `${item.kor_body.substring(0, 100)}...` : item.kor_body) : 
     "미리보기가 없습니다";
@@ -88,7 +103,7 @@ const NewsCard: React.FC<NewsCardProps> = ({ item }) => {
                 <svg xmlns="http://www.w3.org/2000/svg" className="h-4 w-4 mr-1 text-gray-400" fill="none" viewBox="0 0 24 24" stroke="currentColor">
                   <path strokeLinecap="round" strokeLinejoin="round" strokeWidth={2} d="M12 8v4l3 3m6-3a9 9 0 11-18 0 9 9 0 0118 0z" />
                 </svg>
-                {item.date}
+                <time dateTime={item.date}>{newsAge}</time>
               </span>
               <span className="mx-2">•</span>
               <span className="bg-indigo-50 text-indigo-700 px-2 py-1 rounded-full text-xs font-medium">{item.tag}</span>
@@ -183,7 +198,7 @@ const NewsCard: React.FC<NewsCardProps> = ({ item }) => {
                 <div>
                   <span className="bg-indigo-50 text-indigo-700 px-2 py-1 rounded-full text-xs font-medium">{item.tag}</span>
                   <span className="mx-2 text-gray-500">•</span>
-                  <span className="text-gray-500 text-sm">{item.date}</span>
+                  <time dateTime={item.date} className="text-gray-500 text-sm">{newsAge}</time>
                 </div>
               </div>
               